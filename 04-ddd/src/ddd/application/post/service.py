@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from fastapi import HTTPException, status
 
+from ddd.application.queries.dto import CommentDTO, PostSummaryDTO
+from ddd.application.queries.post_query_service import PostQueryService
 from ddd.domain.hashtag.repository import HashtagRepository
 from ddd.domain.notification.entity import Notification
 from ddd.domain.notification.repository import NotificationRepository
@@ -20,12 +22,14 @@ class PostApplicationService:
         like_repo: LikeRepository,
         comment_repo: CommentRepository,
         hashtag_repo: HashtagRepository | None,
+        post_queries: PostQueryService,
     ):
         self.post_repo = post_repo
         self.user_repo = user_repo
         self.like_repo = like_repo
         self.comment_repo = comment_repo
         self.hashtag_repo = hashtag_repo
+        self.post_queries = post_queries
 
     async def _enrich(self, post: PostAggregate) -> dict:
         author = await self.user_repo.get_by_id(post.author_id)
@@ -69,9 +73,8 @@ class PostApplicationService:
 
     async def get_by_author(
         self, author_id: int, limit: int = 20, offset: int = 0
-    ) -> list[dict]:
-        posts = await self.post_repo.get_by_author(author_id, limit, offset)
-        return [await self._enrich(p) for p in posts]
+    ) -> list[PostSummaryDTO]:
+        return await self.post_queries.get_by_author(author_id, limit, offset)
 
     async def delete(self, post_id: int, user_id: int) -> None:
         post = await self.post_repo.get_by_id(post_id)
@@ -95,11 +98,13 @@ class CommentApplicationService:
         post_repo: PostRepository,
         user_repo: UserRepository,
         notification_repo: NotificationRepository,
+        post_queries: PostQueryService,
     ):
         self.comment_repo = comment_repo
         self.post_repo = post_repo
         self.user_repo = user_repo
         self.notification_repo = notification_repo
+        self.post_queries = post_queries
 
     async def create(self, post_id: int, author_id: int, content: str) -> dict:
         post = await self.post_repo.get_by_id(post_id)
@@ -131,20 +136,8 @@ class CommentApplicationService:
 
     async def get_by_post(
         self, post_id: int, limit: int = 50, offset: int = 0
-    ) -> list[dict]:
-        comments = await self.comment_repo.get_by_post(post_id, limit, offset)
-        result = []
-        for c in comments:
-            author = await self.user_repo.get_by_id(c.author_id)
-            result.append({
-                "id": c.id,
-                "post_id": c.post_id,
-                "author_id": c.author_id,
-                "author_username": author.username.value if author else None,
-                "content": c.content,
-                "created_at": c.created_at,
-            })
-        return result
+    ) -> list[CommentDTO]:
+        return await self.post_queries.get_comments(post_id, limit, offset)
 
     async def delete(self, comment_id: int, user_id: int) -> None:
         comment = await self.comment_repo.get_by_id(comment_id)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class PostSummaryDTO:
+    id: int
+    author_id: int
+    author_username: str | None
+    content: str | None
+    image_url: str | None
+    like_count: int
+    comment_count: int
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class CommentDTO:
+    id: int
+    post_id: int
+    author_id: int
+    author_username: str | None
+    content: str
+    created_at: datetime
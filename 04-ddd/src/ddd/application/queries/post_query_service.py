@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from ddd.application.queries.dto import CommentDTO, PostSummaryDTO
+
+
+class PostQueryService(ABC):
+    """Read side for post listings.
+
+    Returns flat DTOs straight from storage; aggregates are only loaded on
+    the command side where invariants have to be enforced.
+    """
+
+    @abstractmethod
+    async def get_feed(
+        self, user_id: int, limit: int, offset: int
+    ) -> list[PostSummaryDTO]: ...
+
+    @abstractmethod
+    async def get_by_author(
+        self, author_id: int, limit: int, offset: int
+    ) -> list[PostSummaryDTO]: ...
+
+    @abstractmethod
+    async def get_by_hashtag(
+        self, tag: str, limit: int, offset: int
+    ) -> list[PostSummaryDTO]: ...
+
+    @abstractmethod
+    async def get_comments(
+        self, post_id: int, limit: int, offset: int
+    ) -> list[CommentDTO]: ...
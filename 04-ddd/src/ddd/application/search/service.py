@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from ddd.application.queries.dto import PostSummaryDTO
+from ddd.application.queries.post_query_service import PostQueryService
 from ddd.domain.hashtag.entity import Hashtag
 from ddd.domain.hashtag.repository import HashtagRepository
-from ddd.domain.post.repository import CommentRepository, LikeRepository
 from ddd.domain.user.aggregate import UserAggregate
 from ddd.domain.user.repository import UserRepository
 
@@ -12,13 +13,11 @@ class SearchApplicationService:
         self,
         user_repo: UserRepository,
         hashtag_repo: HashtagRepository,
-        like_repo: LikeRepository,
-        comment_repo: CommentRepository,
+        post_queries: PostQueryService,
     ):
         self.user_repo = user_repo
         self.hashtag_repo = hashtag_repo
-        self.like_repo = like_repo
-        self.comment_repo = comment_repo
+        self.post_queries = post_queries
 
     async def search_users(
         self, query: str, limit: int = 20
@@ -30,21 +29,5 @@ class SearchApplicationService:
 
     async def get_posts_by_hashtag(
         self, tag: str, limit: int = 20, offset: int = 0
-    ) -> list[dict]:
-        posts = await self.hashtag_repo.get_posts_by_hashtag(tag, limit, offset)
-        result = []
-        for p in posts:
-            author = await self.user_repo.get_by_id(p.author_id)
-            like_count = await self.like_repo.count_by_post(p.id)
-            comments = await self.comment_repo.get_by_post(p.id, 0, 0)
-            result.append({
-                "id": p.id,
-                "author_id": p.author_id,
-                "author_username": author.username.value if author else None,
-                "content": p.content,
-                "image_url": p.image_url,
-                "like_count": like_count,
-                "comment_count": len(comments),
-                "created_at": p.created_at,
-            })
-        return result
+    ) -> list[PostSummaryDTO]:
+        return await self.post_queries.get_by_hashtag(tag, limit, offset)
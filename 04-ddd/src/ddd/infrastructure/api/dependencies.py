@@ -22,6 +22,7 @@ from ddd.application.social.service import (
 )
 from ddd.application.user.service import UserApplicationService
 from ddd.infrastructure.database import async_session_factory
+from ddd.infrastructure.queries.post_query_service import SqlAlchemyPostQueryService
 from ddd.infrastructure.repositories.hashtag_repository import SqlAlchemyHashtagRepository
 from ddd.infrastructure.repositories.message_repository import SqlAlchemyMessageRepository
 from ddd.infrastructure.repositories.notification_repository import SqlAlchemyNotificationRepository
@@ -86,6 +87,7 @@ def get_post_service(
         SqlAlchemyLikeRepository(db),
         SqlAlchemyCommentRepository(db),
         SqlAlchemyHashtagRepository(db),
+        SqlAlchemyPostQueryService(db),
     )
 
 
@@ -97,6 +99,7 @@ def get_comment_service(
         SqlAlchemyPostRepository(db),
         SqlAlchemyUserRepository(db),
         SqlAlchemyNotificationRepository(db),
+        SqlAlchemyPostQueryService(db),
     )
 
 
@@ -123,13 +126,7 @@ def get_follow_service(
 def get_feed_service(
     db: AsyncSession = Depends(get_db),
 ) -> FeedApplicationService:
-    return FeedApplicationService(
-        SqlAlchemyPostRepository(db),
-        SqlAlchemyFollowRepository(db),
-        SqlAlchemyUserRepository(db),
-        SqlAlchemyLikeRepository(db),
-        SqlAlchemyCommentRepository(db),
-    )
+    return FeedApplicationService(SqlAlchemyPostQueryService(db))
 
 
 def get_story_service(
@@ -162,6 +159,5 @@ def get_search_service(
     return SearchApplicationService(
         SqlAlchemyUserRepository(db),
         SqlAlchemyHashtagRepository(db),
-        SqlAlchemyLikeRepository(db),
-        SqlAlchemyCommentRepository(db),
+        SqlAlchemyPostQueryService(db),
     )
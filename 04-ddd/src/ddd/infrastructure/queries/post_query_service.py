@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from sqlalchemy import Select, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ddd.application.queries.dto import CommentDTO, PostSummaryDTO
+from ddd.application.queries.post_query_service import PostQueryService
+from ddd.infrastructure.orm.models import (
+    CommentModel,
+    FollowModel,
+    HashtagModel,
+    LikeModel,
+    PostHashtagModel,
+    PostModel,
+    UserModel,
+)
+
+
+def _post_summary_select() -> Select:
+    like_count = (
+        select(func.count())
+        .select_from(LikeModel)
+        .where(LikeModel.post_id == PostModel.id)
+        .correlate(PostModel)
+        .scalar_subquery()
+    )
+    comment_count = (
+        select(func.count())
+        .select_from(CommentModel)
+        .where(CommentModel.post_id == PostModel.id)
+        .correlate(PostModel)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            PostModel.id,
+            PostModel.author_id,
+            UserModel.username.label("author_username"),
+            PostModel.content,
+            PostModel.image_url,
+            like_count.label("like_count"),
+            comment_count.label("comment_count"),
+            PostModel.created_at,
+        )
+        .outerjoin(UserModel, UserModel.id == PostModel.author_id)
+    )
+
+
+class SqlAlchemyPostQueryService(PostQueryService):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _fetch_posts(
+        self, stmt: Select, limit: int, offset: int
+    ) -> list[PostSummaryDTO]:
+        r = await self.db.execute(
+            stmt.order_by(PostModel.created_at.desc()).limit(limit).offset(offset)
+        )
+        return [PostSummaryDTO(**row) for row in r.mappings().all()]
+
+    async def get_feed(
+        self, user_id: int, limit: int, offset: int
+    ) -> list[PostSummaryDTO]:
+        following = select(FollowModel.following_id).where(
+            FollowModel.follower_id == user_id
+        )
+        stmt = _post_summary_select().where(
+            or_(PostModel.author_id == user_id, PostModel.author_id.in_(following))
+        )
+        return await self._fetch_posts(stmt, limit, offset)
+
+    async def get_by_author(
+        self, author_id: int, limit: int, offset: int
+    ) -> list[PostSummaryDTO]:
+        stmt = _post_summary_select().where(PostModel.author_id == author_id)
+        return await self._fetch_posts(stmt, limit, offset)
+
+    async def get_by_hashtag(
+        self, tag: str, limit: int, offset: int
+    ) -> list[PostSummaryDTO]:
+        stmt = (
+            _post_summary_select()
+            .join(PostHashtagModel, PostHashtagModel.post_id == PostModel.id)
+            .join(HashtagModel, HashtagModel.id == PostHashtagModel.hashtag_id)
+            .where(HashtagModel.name == tag)
+        )
+        return await self._fetch_posts(stmt, limit, offset)
+
+    async def get_comments(
+        self, post_id: int, limit: int, offset: int
+    ) -> list[CommentDTO]:
+        r = await self.db.execute(
+            select(
+                CommentModel.id,
+                CommentModel.post_id,
+                CommentModel.author_id,
+                UserModel.username.label("author_username"),
+                CommentModel.content,
+                CommentModel.created_at,
+            )
+            .outerjoin(UserModel, UserModel.id == CommentModel.author_id)
+            .where(CommentModel.post_id == post_id)
+            .order_by(CommentModel.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return [CommentDTO(**row) for row in r.mappings().all()]
@@ -241,6 +241,28 @@ class TestFeed:
         assert resp.status_code == 200
         assert isinstance(resp.json(), list)
 
+    async def test_feed_read_model_counts(self, auth_client: AsyncClient):
+        post_resp = await auth_client.post(
+            "/api/posts",
+            json={"content": "Read model post"},
+        )
+        post_id = post_resp.json()["id"]
+        await auth_client.post(f"/api/posts/{post_id}/likes")
+        await auth_client.post(
+            f"/api/posts/{post_id}/comments",
+            json={"content": "Counted"},
+        )
+
+        resp = await auth_client.get("/api/feed")
+        assert resp.status_code == 200
+        post = next(p for p in resp.json() if p["id"] == post_id)
+        assert post["author_username"] == "testuser"
+        assert post["like_count"] == 1
+        assert post["comment_count"] == 1
+
+        comments = await auth_client.get(f"/api/posts/{post_id}/comments")
+        assert comments.json()[0]["author_username"] == "testuser"
+
 
 class TestStory:
     async def test_create_and_get_stories(self, auth_client: AsyncClient):
@@ -0,0 +1,76 @@
+"""Cold-start benchmark: import time and time to first request.
+
+Each sample runs in a fresh interpreter so nothing is cached in
+``sys.modules``. Compares eager router registration with lazy loading.
+
+    uv run python benchmarks/startup.py [--runs 5] [--path /api/feed]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+PROBE = """
+import asyncio, json, time
+t0 = time.perf_counter()
+from modular_monolith.main import app
+t1 = time.perf_counter()
+
+async def first_request():
+    from httpx import ASGITransport, AsyncClient
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        resp = await client.get({path!r})
+    return resp.status_code
+
+status = asyncio.run(first_request())
+t2 = time.perf_counter()
+print(json.dumps({{"import": t1 - t0, "first_request": t2 - t1, "status": status}}))
+"""
+
+
+def sample(path: str, lazy: bool, db_url: str) -> dict:
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(SRC),
+        "LAZY_MODULE_LOADING": "true" if lazy else "false",
+        "DATABASE_URL": db_url,
+    }
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE.format(path=path)],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default="/api/search/hashtags?q=x")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = f"sqlite+aiosqlite:///{tmp}/bench.db"
+        subprocess.run(
+            [sys.executable, "-m", "modular_monolith.migrate"],
+            env={**os.environ, "PYTHONPATH": str(SRC), "DATABASE_URL": db_url},
+            check=True,
+        )
+        print(f"first request: GET {args.path}, {args.runs} runs (median ms)")
+        print(f"{'mode':<8}{'import':>10}{'first req':>12}{'total':>10}")
+        for lazy in (False, True):
+            samples = [sample(args.path, lazy, db_url) for _ in range(args.runs)]
+            imp = statistics.median(s["import"] for s in samples) * 1000
+            req = statistics.median(s["first_request"] for s in samples) * 1000
+            mode = "lazy" if lazy else "eager"
+            print(f"{mode:<8}{imp:>10.1f}{req:>12.1f}{imp + req:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,49 +2,37 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from modular_monolith.modules.auth import router as auth_router
-from modular_monolith.modules.comment import router as comment_router
-from modular_monolith.modules.feed import router as feed_router
-from modular_monolith.modules.follow import router as follow_router
-from modular_monolith.modules.like import router as like_router
-from modular_monolith.modules.messaging import router as messaging_router
-from modular_monolith.modules.notification import router as notification_router
-from modular_monolith.modules.post import router as post_router
-from modular_monolith.modules.search import router as search_router
-from modular_monolith.modules.story import router as story_router
-from modular_monolith.modules.user import router as user_router
-from modular_monolith.shared.base_model import Base
-from modular_monolith.shared.database import engine
-
-# Import all models so Base.metadata knows about them
-import modular_monolith.modules.auth.models  # noqa: F401
-import modular_monolith.modules.post.models  # noqa: F401
-import modular_monolith.modules.comment.models  # noqa: F401
-import modular_monolith.modules.like.models  # noqa: F401
-import modular_monolith.modules.follow.models  # noqa: F401
-import modular_monolith.modules.story.models  # noqa: F401
-import modular_monolith.modules.messaging.models  # noqa: F401
-import modular_monolith.modules.notification.models  # noqa: F401
+from modular_monolith.manifest import enabled_modules
+from modular_monolith.shared.config import settings
+from modular_monolith.shared.database import engines
+from modular_monolith.shared.event_bus import event_bus
+from modular_monolith.shared.module_loader import (
+    LazyModuleMiddleware,
+    ModuleLoader,
+    register_subscribers,
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Tables are created by `python -m modular_monolith.migrate`, not here.
     yield
-    await engine.dispose()
-
-
-app = FastAPI(title="Instagram Clone - Modular Monolith", lifespan=lifespan)
-
-app.include_router(auth_router)
-app.include_router(user_router)
-app.include_router(post_router)
-app.include_router(comment_router)
-app.include_router(like_router)
-app.include_router(follow_router)
-app.include_router(feed_router)
-app.include_router(story_router)
-app.include_router(messaging_router)
-app.include_router(notification_router)
-app.include_router(search_router)
+    await event_bus.stop()
+    await engines.dispose()
+
+
+def create_app(modules: list[str] | None = None, lazy: bool | None = None) -> FastAPI:
+    app = FastAPI(title=settings.app_name, lifespan=lifespan)
+    if modules is None:
+        modules = settings.enabled_modules
+    loader = ModuleLoader(app, enabled_modules(modules))
+    register_subscribers(event_bus)
+    if settings.lazy_module_loading if lazy is None else lazy:
+        app.add_middleware(LazyModuleMiddleware, loader=loader)
+    else:
+        loader.load_all()
+    app.state.module_loader = loader
+    return app
+
+
+app = create_app()
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ModuleSpec:
+    name: str
+    # URL prefixes served by the module's router; the first request under
+    # one of them imports and registers the router.
+    prefixes: tuple[str, ...]
+    has_models: bool = False
+    # "package.module:function" called with the event bus at startup.
+    subscribers: str | None = None
+
+    @property
+    def package(self) -> str:
+        return f"modular_monolith.modules.{self.name}"
+
+
+MODULES: tuple[ModuleSpec, ...] = (
+    ModuleSpec("auth", ("/api/auth",), has_models=True),
+    ModuleSpec("user", ("/api/users",)),
+    ModuleSpec("post", ("/api/posts",), has_models=True),
+    ModuleSpec("comment", ("/api/posts",), has_models=True),
+    ModuleSpec("like", ("/api/posts",), has_models=True),
+    ModuleSpec("follow", ("/api/follow",), has_models=True),
+    ModuleSpec("feed", ("/api/feed",)),
+    ModuleSpec("story", ("/api/stories",), has_models=True),
+    ModuleSpec("messaging", ("/api/messages",), has_models=True),
+    ModuleSpec(
+        "notification",
+        ("/api/notifications",),
+        has_models=True,
+        subscribers="modular_monolith.modules.notification.handlers:register_handlers",
+    ),
+    ModuleSpec("search", ("/api/search",)),
+)
+
+
+def enabled_modules(names: list[str] | None) -> list[ModuleSpec]:
+    if names is None:
+        return list(MODULES)
+    unknown = set(names) - {m.name for m in MODULES}
+    if unknown:
+        raise ValueError(f"Unknown modules in manifest: {', '.join(sorted(unknown))}")
+    return [m for m in MODULES if m.name in names]
@@ -0,0 +1,24 @@
+"""Create the tables of every enabled module.
+
+Run once per deploy instead of on each worker start:
+
+    python -m modular_monolith.migrate
+"""
+import asyncio
+
+from modular_monolith.manifest import MODULES
+from modular_monolith.shared.base_model import Base
+from modular_monolith.shared.database import engines
+from modular_monolith.shared.module_loader import import_models
+
+
+async def migrate():
+    # Every module's tables are created, not only the enabled ones: a worker
+    # serving a subset of routes still shares the schema with the others.
+    import_models(list(MODULES))
+    await engines.create_all(Base.metadata)
+    await engines.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
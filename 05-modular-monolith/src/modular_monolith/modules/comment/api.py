@@ -0,0 +1,16 @@
+"""Public, batch-first API of the comment module."""
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from modular_monolith.modules.comment.models import Comment
+
+
+async def counts(db: AsyncSession, post_ids: list[int]) -> dict[int, int]:
+    """Comment count per post; posts without comments map to 0."""
+    if not post_ids:
+        return {}
+    result = await db.execute(
+        select(Comment.post_id, func.count()).where(Comment.post_id.in_(set(post_ids))).group_by(Comment.post_id)
+    )
+    found = dict(result.all())
+    return {pid: found.get(pid, 0) for pid in post_ids}
@@ -2,11 +2,11 @@ from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from modular_monolith.modules.auth.models import User
 from modular_monolith.modules.comment.models import Comment
 from modular_monolith.modules.comment.schemas import CommentCreate, CommentResponse
-from modular_monolith.modules.notification.service import NotificationService
-from modular_monolith.modules.post.models import Post
+from modular_monolith.modules.post import api as post_api
+from modular_monolith.modules.user import api as user_api
+from modular_monolith.shared.event_bus import Event, event_bus
 
 
 class CommentService:
@@ -14,8 +14,8 @@ class CommentService:
         self.db = db
 
     async def create(self, post_id: int, author_id: int, data: CommentCreate) -> CommentResponse:
-        post = await self.db.get(Post, post_id)
-        if not post:
+        post_author_id = (await post_api.get_author_ids(self.db, [post_id])).get(post_id)
+        if post_author_id is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
 
         comment = Comment(post_id=post_id, author_id=author_id, content=data.content)
@@ -23,11 +23,10 @@ class CommentService:
         await self.db.flush()
         await self.db.refresh(comment)
 
-        if post.author_id != author_id:
-            await NotificationService(self.db).create_notification(
-                user_id=post.author_id, actor_id=author_id,
-                type="comment", reference_id=post_id, message="commented on your post",
-            )
+        event_bus.publish_on_commit(self.db, Event("comment.created", {
+            "comment_id": comment.id, "post_id": post_id,
+            "post_author_id": post_author_id, "author_id": author_id,
+        }))
 
         return CommentResponse(
             id=comment.id, post_id=comment.post_id, author_id=comment.author_id,
@@ -38,15 +37,16 @@ class CommentService:
         result = await self.db.execute(
             select(Comment).where(Comment.post_id == post_id).order_by(Comment.created_at.desc()).limit(limit).offset(offset)
         )
-        responses = []
-        for c in result.scalars().all():
-            user = await self.db.get(User, c.author_id)
-            responses.append(CommentResponse(
+        comments = result.scalars().all()
+        usernames = await user_api.get_usernames(self.db, [c.author_id for c in comments])
+        return [
+            CommentResponse(
                 id=c.id, post_id=c.post_id, author_id=c.author_id,
-                author_username=user.username if user else None,
+                author_username=usernames.get(c.author_id),
                 content=c.content, created_at=c.created_at,
-            ))
-        return responses
+            )
+            for c in comments
+        ]
 
     async def delete(self, comment_id: int, user_id: int) -> None:
         comment = await self.db.get(Comment, comment_id)
@@ -1,10 +1,8 @@
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from modular_monolith.modules.follow.models import Follow
-from modular_monolith.modules.post.models import Post
+from modular_monolith.modules.follow import api as follow_api
+from modular_monolith.modules.post import api as post_api
 from modular_monolith.modules.post.schemas import PostResponse
-from modular_monolith.modules.post.service import PostService
 
 
 class FeedService:
@@ -12,14 +10,6 @@ class FeedService:
         self.db = db
 
     async def get_feed(self, user_id: int, limit: int = 20, offset: int = 0) -> list[PostResponse]:
-        result = await self.db.execute(
-            select(Follow.following_id).where(Follow.follower_id == user_id)
-        )
-        following_ids = list(result.scalars().all())
+        following_ids = await follow_api.get_following_ids(self.db, user_id)
         following_ids.append(user_id)
-
-        result = await self.db.execute(
-            select(Post).where(Post.author_id.in_(following_ids)).order_by(Post.created_at.desc()).limit(limit).offset(offset)
-        )
-        post_service = PostService(self.db)
-        return [await post_service._to_response(p) for p in result.scalars().all()]
+        return await post_api.list_by_authors(self.db, following_ids, limit, offset)
@@ -0,0 +1,27 @@
+"""Public, batch-first API of the follow module."""
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from modular_monolith.modules.follow.models import Follow
+
+
+async def get_following_ids(db: AsyncSession, user_id: int) -> list[int]:
+    result = await db.execute(select(Follow.following_id).where(Follow.follower_id == user_id))
+    return list(result.scalars().all())
+
+
+async def get_follower_ids(db: AsyncSession, user_id: int) -> list[int]:
+    result = await db.execute(select(Follow.follower_id).where(Follow.following_id == user_id))
+    return list(result.scalars().all())
+
+
+async def count_followers(db: AsyncSession, user_id: int) -> int:
+    return (await db.execute(
+        select(func.count()).select_from(Follow).where(Follow.following_id == user_id)
+    )).scalar_one()
+
+
+async def count_following(db: AsyncSession, user_id: int) -> int:
+    return (await db.execute(
+        select(func.count()).select_from(Follow).where(Follow.follower_id == user_id)
+    )).scalar_one()
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from modular_monolith.shared.base_model import Base, TimestampMixin
@@ -9,5 +9,5 @@ class Follow(TimestampMixin, Base):
     __table_args__ = (UniqueConstraint("follower_id", "following_id", name="uq_follow"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    follower_id: Mapped[int] = mapped_column(ForeignKey("user.id"), index=True)
-    following_id: Mapped[int] = mapped_column(ForeignKey("user.id"), index=True)
+    follower_id: Mapped[int] = mapped_column(index=True)
+    following_id: Mapped[int] = mapped_column(index=True)
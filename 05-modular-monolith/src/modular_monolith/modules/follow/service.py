@@ -2,9 +2,9 @@ from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from modular_monolith.modules.auth.models import User
 from modular_monolith.modules.follow.models import Follow
-from modular_monolith.modules.notification.service import NotificationService
+from modular_monolith.modules.user import api as user_api
+from modular_monolith.shared.event_bus import Event, event_bus
 
 
 class FollowService:
@@ -15,8 +15,7 @@ class FollowService:
         if follower_id == following_id:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot follow yourself")
 
-        target = await self.db.get(User, following_id)
-        if not target:
+        if not await user_api.exists(self.db, following_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
         result = await self.db.execute(
@@ -28,10 +27,9 @@ class FollowService:
         self.db.add(Follow(follower_id=follower_id, following_id=following_id))
         await self.db.flush()
 
-        await NotificationService(self.db).create_notification(
-            user_id=following_id, actor_id=follower_id,
-            type="follow", message="started following you",
-        )
+        event_bus.publish_on_commit(self.db, Event("user.followed", {
+            "follower_id": follower_id, "following_id": following_id,
+        }))
         return {"following": True}
 
     async def unfollow(self, follower_id: int, following_id: int) -> dict:
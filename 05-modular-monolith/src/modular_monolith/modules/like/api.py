@@ -0,0 +1,16 @@
+"""Public, batch-first API of the like module."""
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from modular_monolith.modules.like.models import Like
+
+
+async def counts(db: AsyncSession, post_ids: list[int]) -> dict[int, int]:
+    """Like count per post; posts without likes map to 0."""
+    if not post_ids:
+        return {}
+    result = await db.execute(
+        select(Like.post_id, func.count()).where(Like.post_id.in_(set(post_ids))).group_by(Like.post_id)
+    )
+    found = dict(result.all())
+    return {pid: found.get(pid, 0) for pid in post_ids}
@@ -3,8 +3,8 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from modular_monolith.modules.like.models import Like
-from modular_monolith.modules.notification.service import NotificationService
-from modular_monolith.modules.post.models import Post
+from modular_monolith.modules.post import api as post_api
+from modular_monolith.shared.event_bus import Event, event_bus
 
 
 class LikeService:
@@ -12,8 +12,8 @@ class LikeService:
         self.db = db
 
     async def toggle(self, post_id: int, user_id: int) -> dict:
-        post = await self.db.get(Post, post_id)
-        if not post:
+        post_author_id = (await post_api.get_author_ids(self.db, [post_id])).get(post_id)
+        if post_author_id is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
 
         result = await self.db.execute(
@@ -27,11 +27,9 @@ class LikeService:
         else:
             self.db.add(Like(post_id=post_id, user_id=user_id))
             liked = True
-            if post.author_id != user_id:
-                await NotificationService(self.db).create_notification(
-                    user_id=post.author_id, actor_id=user_id,
-                    type="like", reference_id=post_id, message="liked your post",
-                )
+            event_bus.publish_on_commit(self.db, Event("post.liked", {
+                "post_id": post_id, "post_author_id": post_author_id, "user_id": user_id,
+            }))
 
         await self.db.flush()
         count = (await self.db.execute(
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, ForeignKey, Text
+from sqlalchemy import Boolean, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from modular_monolith.shared.base_model import Base, TimestampMixin
@@ -8,7 +8,7 @@ class Message(TimestampMixin, Base):
     __tablename__ = "message"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    sender_id: Mapped[int] = mapped_column(ForeignKey("user.id"), index=True)
-    receiver_id: Mapped[int] = mapped_column(ForeignKey("user.id"), index=True)
+    sender_id: Mapped[int] = mapped_column(index=True)
+    receiver_id: Mapped[int] = mapped_column(index=True)
     content: Mapped[str] = mapped_column(Text)
     is_read: Mapped[bool] = mapped_column(Boolean, default=False)
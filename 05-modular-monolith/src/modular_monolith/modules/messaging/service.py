@@ -2,9 +2,9 @@ from fastapi import HTTPException, status
 from sqlalchemy import and_, case, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from modular_monolith.modules.auth.models import User
 from modular_monolith.modules.messaging.models import Message
 from modular_monolith.modules.messaging.schemas import ConversationResponse, MessageCreate, MessageResponse
+from modular_monolith.modules.user import api as user_api
 
 
 class MessageService:
@@ -12,8 +12,7 @@ class MessageService:
         self.db = db
 
     async def send(self, sender_id: int, data: MessageCreate) -> MessageResponse:
-        receiver = await self.db.get(User, data.receiver_id)
-        if not receiver:
+        if not await user_api.exists(self.db, data.receiver_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Receiver not found")
         message = Message(sender_id=sender_id, receiver_id=data.receiver_id, content=data.content)
         self.db.add(message)
@@ -1,2 +0,0 @@
-from modular_monolith.modules.notification.router import router
-__all__ = ["router"]
@@ -0,0 +1,66 @@
+"""Bounded distinct-actor counting for coalesced notifications.
+
+A group row keeps the ids of its last ``RECENT_ACTORS`` distinct actors and
+a HyperLogLog sketch of all of them in ``SKETCH_REGISTERS`` bytes, so its
+size does not grow with the number of likers. The count is exact until the
+recent list overflows and an estimate (about 13% standard error) from then
+on. An actor who comes back is found in the list or the sketch and is not
+counted again.
+"""
+import hashlib
+import math
+
+RECENT_ACTORS = 20
+SKETCH_REGISTERS = 64
+EMPTY_SKETCH = bytes(SKETCH_REGISTERS)
+
+
+def _hash(actor_id: int) -> int:
+    digest = hashlib.blake2b(actor_id.to_bytes(8, "big"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def add_to_sketch(sketch: bytes, actor_id: int) -> bytes:
+    h = _hash(actor_id)
+    index, rest = h % SKETCH_REGISTERS, h // SKETCH_REGISTERS
+    # Position of the lowest set bit of the remaining 58 bits, from 1.
+    rank = (rest & -rest).bit_length() if rest else 59
+    if sketch[index] >= rank:
+        return sketch
+    registers = bytearray(sketch)
+    registers[index] = rank
+    return bytes(registers)
+
+
+def estimate(sketch: bytes) -> int:
+    m = len(sketch)
+    raw = 0.709 * m * m / sum(2.0 ** -rank for rank in sketch)
+    zeros = sketch.count(0)
+    if raw <= 2.5 * m and zeros:
+        # Small range: linear counting over the empty registers is closer.
+        return round(m * math.log(m / zeros))
+    return round(raw)
+
+
+def add_actor(
+    recent: list[int], sketch: bytes, count: int, actor_id: int
+) -> tuple[list[int], bytes, int]:
+    """Record ``actor_id``; returns the new recent list, sketch and count."""
+    updated = add_to_sketch(sketch, actor_id)
+    if actor_id in recent:
+        return [actor_id, *(a for a in recent if a != actor_id)], updated, count
+    if count == len(recent):
+        # Every earlier actor is still listed, so this one is new.
+        count += 1
+    elif updated != sketch:
+        # A returning actor leaves the sketch as it was.
+        count = max(count, estimate(updated))
+    return [actor_id, *recent][:RECENT_ACTORS], updated, count
+
+
+def format_recent(recent: list[int]) -> str:
+    return ",".join(map(str, recent))
+
+
+def parse_recent(value: str | None) -> list[int]:
+    return [int(a) for a in value.split(",")] if value else []
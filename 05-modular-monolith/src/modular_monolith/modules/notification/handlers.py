@@ -0,0 +1,35 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from modular_monolith.modules.notification.service import NotificationService
+from modular_monolith.shared.event_bus import Event, EventBus
+
+
+async def on_post_liked(event: Event, db: AsyncSession) -> None:
+    if event.data["post_author_id"] == event.data["user_id"]:
+        return
+    await NotificationService(db).create_notification(
+        user_id=event.data["post_author_id"], actor_id=event.data["user_id"],
+        type="like", reference_id=event.data["post_id"], message="liked your post",
+    )
+
+
+async def on_comment_created(event: Event, db: AsyncSession) -> None:
+    if event.data["post_author_id"] == event.data["author_id"]:
+        return
+    await NotificationService(db).create_notification(
+        user_id=event.data["post_author_id"], actor_id=event.data["author_id"],
+        type="comment", reference_id=event.data["post_id"], message="commented on your post",
+    )
+
+
+async def on_user_followed(event: Event, db: AsyncSession) -> None:
+    await NotificationService(db).create_notification(
+        user_id=event.data["following_id"], actor_id=event.data["follower_id"],
+        type="follow", message="started following you",
+    )
+
+
+def register_handlers(bus: EventBus) -> None:
+    bus.subscribe("post.liked", on_post_liked)
+    bus.subscribe("comment.created", on_comment_created)
+    bus.subscribe("user.followed", on_user_followed)
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, ForeignKey, String, Text
+from sqlalchemy import Boolean, LargeBinary, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from modular_monolith.shared.base_model import Base, TimestampMixin
@@ -8,9 +8,17 @@ class Notification(TimestampMixin, Base):
     __tablename__ = "notification"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("user.id"), index=True)
-    actor_id: Mapped[int] = mapped_column(ForeignKey("user.id"), index=True)
+    user_id: Mapped[int] = mapped_column(index=True)
+    actor_id: Mapped[int] = mapped_column(index=True)
     type: Mapped[str] = mapped_column(String(50))
     reference_id: Mapped[int | None] = mapped_column()
     message: Mapped[str] = mapped_column(Text)
     is_read: Mapped[bool] = mapped_column(Boolean, default=False)
+    # "<user_id>:<type>:<reference_id>:<window>" for coalesced rows.
+    group_key: Mapped[str | None] = mapped_column(String(255), unique=True)
+    actor_count: Mapped[int] = mapped_column(default=1)
+    # Coalesced rows only: the latest distinct actors, newest first, and a
+    # sketch of all of them; both bounded in size (see actors.py).
+    recent_actors: Mapped[str | None] = mapped_column(Text)
+    actor_sketch: Mapped[bytes | None] = mapped_column(LargeBinary)
+
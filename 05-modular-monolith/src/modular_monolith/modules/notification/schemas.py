@@ -10,6 +10,7 @@ class NotificationResponse(BaseModel):
     type: str
     reference_id: int | None
     message: str
+    actor_count: int = 1
     is_read: bool
     created_at: datetime
 
@@ -1,8 +1,29 @@
+from datetime import datetime, timezone
+
 from sqlalchemy import select, update
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from modular_monolith.modules.notification import actors
 from modular_monolith.modules.notification.models import Notification
 from modular_monolith.modules.notification.schemas import NotificationResponse
+from modular_monolith.modules.user import api as user_api
+from modular_monolith.shared.config import settings
+
+
+def group_key(
+    user_id: int, type: str, reference_id: int | None, now: datetime, window: int
+) -> str:
+    bucket = int(now.timestamp()) // window
+    return f"{user_id}:{type}:{'' if reference_id is None else reference_id}:{bucket}"
+
+
+def render_message(message: str, actor_count: int, actor_username: str | None) -> str:
+    if actor_count <= 1 or actor_username is None:
+        return message
+    others = actor_count - 1
+    noun = "other" if others == 1 else "others"
+    return f"{actor_username} and {others:,} {noun} {message}"
 
 
 class NotificationService:
@@ -10,19 +31,83 @@ class NotificationService:
         self.db = db
 
     async def create_notification(
-        self, user_id: int, actor_id: int, type: str, message: str, reference_id: int | None = None,
+        self,
+        user_id: int,
+        actor_id: int,
+        type: str,
+        message: str,
+        reference_id: int | None = None,
     ) -> None:
-        self.db.add(Notification(
-            user_id=user_id, actor_id=actor_id, type=type,
-            reference_id=reference_id, message=message,
-        ))
-        await self.db.flush()
+        window = settings.notification_coalesce_window_seconds
+        if window <= 0:
+            self.db.add(Notification(
+                user_id=user_id, actor_id=actor_id, type=type,
+                reference_id=reference_id, message=message,
+            ))
+            await self.db.flush()
+            return
+
+        # One row per (recipient, type, reference, window): the latest actor
+        # wins and actor_count grows, so storage is bounded per post rather
+        # than per interaction. The row is read and written back only if no
+        # other handler changed its actors in between, else retried.
+        now = datetime.now(timezone.utc)
+        key = group_key(user_id, type, reference_id, now, window)
+        while True:
+            result = await self.db.execute(
+                select(
+                    Notification.recent_actors,
+                    Notification.actor_sketch,
+                    Notification.actor_count,
+                ).where(Notification.group_key == key)
+            )
+            row = result.one_or_none()
+            if row is None:
+                recent, sketch, count = actors.add_actor(
+                    [], actors.EMPTY_SKETCH, 0, actor_id
+                )
+                stmt = insert(Notification).values(
+                    user_id=user_id, actor_id=actor_id, type=type,
+                    reference_id=reference_id, message=message, group_key=key,
+                    actor_count=count, recent_actors=actors.format_recent(recent),
+                    actor_sketch=sketch, is_read=False, created_at=now,
+                ).on_conflict_do_nothing()
+            else:
+                recent, sketch, count = actors.add_actor(
+                    actors.parse_recent(row.recent_actors),
+                    row.actor_sketch or actors.EMPTY_SKETCH,
+                    row.actor_count,
+                    actor_id,
+                )
+                stmt = update(Notification).where(
+                    Notification.group_key == key,
+                    Notification.recent_actors == row.recent_actors,
+                    Notification.actor_sketch == row.actor_sketch,
+                ).values(
+                    actor_id=actor_id, actor_count=count,
+                    recent_actors=actors.format_recent(recent), actor_sketch=sketch,
+                    is_read=False, created_at=now, updated_at=now,
+                )
+            result = await self.db.execute(stmt)
+            if result.rowcount == 1:
+                return
 
     async def get_notifications(self, user_id: int, limit: int = 50, offset: int = 0) -> list[NotificationResponse]:
         result = await self.db.execute(
             select(Notification).where(Notification.user_id == user_id).order_by(Notification.created_at.desc()).limit(limit).offset(offset)
         )
-        return [NotificationResponse.model_validate(n) for n in result.scalars().all()]
+        notifications = result.scalars().all()
+        usernames = await user_api.get_usernames(
+            self.db, [n.actor_id for n in notifications if n.actor_count > 1]
+        )
+        responses = []
+        for n in notifications:
+            response = NotificationResponse.model_validate(n)
+            response.message = render_message(
+                n.message, n.actor_count, usernames.get(n.actor_id)
+            )
+            responses.append(response)
+        return responses
 
     async def mark_read(self, notification_id: int, user_id: int) -> dict:
         await self.db.execute(
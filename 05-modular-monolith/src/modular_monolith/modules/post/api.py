@@ -0,0 +1,80 @@
+"""Public, batch-first API of the post module.
+
+Listing functions return fully populated ``PostResponse`` objects for a
+whole page at a fixed cost: one query for the posts plus one each for
+usernames, like counts and comment counts.
+"""
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from modular_monolith.modules.comment import api as comment_api
+from modular_monolith.modules.like import api as like_api
+from modular_monolith.modules.post.models import Hashtag, Post, PostHashtag
+from modular_monolith.modules.post.schemas import PostResponse
+from modular_monolith.modules.user import api as user_api
+
+
+async def summarize(db: AsyncSession, posts: list[Post]) -> list[PostResponse]:
+    """Build responses for already loaded posts, preserving their order."""
+    if not posts:
+        return []
+    post_ids = [p.id for p in posts]
+    usernames = await user_api.get_usernames(db, [p.author_id for p in posts])
+    like_counts = await like_api.counts(db, post_ids)
+    comment_counts = await comment_api.counts(db, post_ids)
+    return [
+        PostResponse(
+            id=p.id, author_id=p.author_id,
+            author_username=usernames.get(p.author_id),
+            content=p.content, image_url=p.image_url,
+            like_count=like_counts[p.id], comment_count=comment_counts[p.id],
+            created_at=p.created_at,
+        )
+        for p in posts
+    ]
+
+
+async def get_summaries(db: AsyncSession, post_ids: list[int]) -> list[PostResponse]:
+    """Summaries in the order of ``post_ids``; unknown ids are skipped."""
+    if not post_ids:
+        return []
+    result = await db.execute(select(Post).where(Post.id.in_(set(post_ids))))
+    by_id = {p.id: p for p in result.scalars().all()}
+    return await summarize(db, [by_id[pid] for pid in post_ids if pid in by_id])
+
+
+async def get_author_ids(db: AsyncSession, post_ids: list[int]) -> dict[int, int]:
+    if not post_ids:
+        return {}
+    result = await db.execute(select(Post.id, Post.author_id).where(Post.id.in_(set(post_ids))))
+    return dict(result.all())
+
+
+async def list_by_authors(db: AsyncSession, author_ids: list[int], limit: int = 20, offset: int = 0) -> list[PostResponse]:
+    result = await db.execute(
+        select(Post).where(Post.author_id.in_(author_ids)).order_by(Post.created_at.desc()).limit(limit).offset(offset)
+    )
+    return await summarize(db, list(result.scalars().all()))
+
+
+async def list_by_hashtag(db: AsyncSession, tag: str, limit: int = 20, offset: int = 0) -> list[PostResponse]:
+    result = await db.execute(
+        select(Post)
+        .join(PostHashtag, Post.id == PostHashtag.post_id)
+        .join(Hashtag, PostHashtag.hashtag_id == Hashtag.id)
+        .where(Hashtag.name == tag)
+        .order_by(Post.created_at.desc())
+        .limit(limit).offset(offset)
+    )
+    return await summarize(db, list(result.scalars().all()))
+
+
+async def count_by_author(db: AsyncSession, author_id: int) -> int:
+    return (await db.execute(
+        select(func.count()).select_from(Post).where(Post.author_id == author_id)
+    )).scalar_one()
+
+
+async def search_hashtags(db: AsyncSession, query: str, limit: int = 20) -> list[Hashtag]:
+    result = await db.execute(select(Hashtag).where(Hashtag.name.ilike(f"%{query}%")).limit(limit))
+    return list(result.scalars().all())
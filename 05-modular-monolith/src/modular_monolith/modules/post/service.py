@@ -1,12 +1,10 @@
 import re
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from modular_monolith.modules.auth.models import User
-from modular_monolith.modules.comment.models import Comment
-from modular_monolith.modules.like.models import Like
+from modular_monolith.modules.post import api as post_api
 from modular_monolith.modules.post.models import Hashtag, Post, PostHashtag
 from modular_monolith.modules.post.schemas import PostCreate, PostResponse
 
@@ -21,22 +19,6 @@ class PostService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def _to_response(self, post: Post) -> PostResponse:
-        user = await self.db.get(User, post.author_id)
-        like_count = (await self.db.execute(
-            select(func.count()).select_from(Like).where(Like.post_id == post.id)
-        )).scalar_one()
-        comment_count = (await self.db.execute(
-            select(func.count()).select_from(Comment).where(Comment.post_id == post.id)
-        )).scalar_one()
-        return PostResponse(
-            id=post.id, author_id=post.author_id,
-            author_username=user.username if user else None,
-            content=post.content, image_url=post.image_url,
-            like_count=like_count, comment_count=comment_count,
-            created_at=post.created_at,
-        )
-
     async def _process_hashtags(self, post_id: int, content: str | None):
         for tag in extract_hashtags(content):
             tag_lower = tag.lower()
@@ -56,19 +38,16 @@ class PostService:
         await self.db.flush()
         await self.db.refresh(post)
         await self._process_hashtags(post.id, data.content)
-        return await self._to_response(post)
+        return (await post_api.summarize(self.db, [post]))[0]
 
     async def get(self, post_id: int) -> PostResponse:
-        post = await self.db.get(Post, post_id)
-        if not post:
+        summaries = await post_api.get_summaries(self.db, [post_id])
+        if not summaries:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
-        return await self._to_response(post)
+        return summaries[0]
 
     async def get_by_author(self, author_id: int, limit: int = 20, offset: int = 0) -> list[PostResponse]:
-        result = await self.db.execute(
-            select(Post).where(Post.author_id == author_id).order_by(Post.created_at.desc()).limit(limit).offset(offset)
-        )
-        return [await self._to_response(p) for p in result.scalars().all()]
+        return await post_api.list_by_authors(self.db, [author_id], limit, offset)
 
     async def delete(self, post_id: int, user_id: int) -> None:
         post = await self.db.get(Post, post_id)
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from modular_monolith.shared.base_model import Base, TimestampMixin
@@ -8,6 +8,6 @@ class Story(TimestampMixin, Base):
     __tablename__ = "story"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    author_id: Mapped[int] = mapped_column(ForeignKey("user.id"), index=True)
+    author_id: Mapped[int] = mapped_column(index=True)
     image_url: Mapped[str | None] = mapped_column(String(500))
     content: Mapped[str | None] = mapped_column(Text)
@@ -4,10 +4,10 @@ from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from modular_monolith.modules.auth.models import User
-from modular_monolith.modules.follow.models import Follow
+from modular_monolith.modules.follow import api as follow_api
 from modular_monolith.modules.story.models import Story
 from modular_monolith.modules.story.schemas import StoryCreate, StoryResponse
+from modular_monolith.modules.user import api as user_api
 
 STORY_EXPIRY_HOURS = 24
 
@@ -16,14 +16,17 @@ class StoryService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def _to_response(self, story: Story) -> StoryResponse:
-        user = await self.db.get(User, story.author_id)
-        return StoryResponse(
-            id=story.id, author_id=story.author_id,
-            author_username=user.username if user else None,
-            image_url=story.image_url, content=story.content,
-            created_at=story.created_at,
-        )
+    async def _to_responses(self, stories: list[Story]) -> list[StoryResponse]:
+        usernames = await user_api.get_usernames(self.db, [s.author_id for s in stories])
+        return [
+            StoryResponse(
+                id=s.id, author_id=s.author_id,
+                author_username=usernames.get(s.author_id),
+                image_url=s.image_url, content=s.content,
+                created_at=s.created_at,
+            )
+            for s in stories
+        ]
 
     async def create(self, author_id: int, data: StoryCreate) -> StoryResponse:
         story = Story(author_id=author_id, image_url=data.image_url, content=data.content)
@@ -41,18 +44,17 @@ class StoryService:
         result = await self.db.execute(
             select(Story).where(Story.author_id == user_id, Story.created_at >= cutoff).order_by(Story.created_at.desc())
         )
-        return [await self._to_response(s) for s in result.scalars().all()]
+        return await self._to_responses(list(result.scalars().all()))
 
     async def get_feed(self, user_id: int) -> list[StoryResponse]:
-        result = await self.db.execute(select(Follow.following_id).where(Follow.follower_id == user_id))
-        following_ids = list(result.scalars().all())
+        following_ids = await follow_api.get_following_ids(self.db, user_id)
         following_ids.append(user_id)
 
         cutoff = datetime.now(timezone.utc) - timedelta(hours=STORY_EXPIRY_HOURS)
         result = await self.db.execute(
             select(Story).where(Story.author_id.in_(following_ids), Story.created_at >= cutoff).order_by(Story.created_at.desc())
         )
-        return [await self._to_response(s) for s in result.scalars().all()]
+        return await self._to_responses(list(result.scalars().all()))
 
     async def delete(self, story_id: int, user_id: int) -> None:
         story = await self.db.get(Story, story_id)
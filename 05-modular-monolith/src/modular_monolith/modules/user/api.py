@@ -0,0 +1,36 @@
+"""Public, batch-first API of the user module.
+
+Other modules read user data only through these functions. Every function
+costs one query regardless of how many ids it is given.
+"""
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from modular_monolith.modules.auth.models import User
+from modular_monolith.modules.user.schemas import UserResponse
+
+
+async def get_usernames(db: AsyncSession, user_ids: list[int]) -> dict[int, str]:
+    if not user_ids:
+        return {}
+    result = await db.execute(select(User.id, User.username).where(User.id.in_(set(user_ids))))
+    return dict(result.all())
+
+
+async def get_users(db: AsyncSession, user_ids: list[int]) -> list[UserResponse]:
+    """Users in the order of ``user_ids``; unknown ids are skipped."""
+    if not user_ids:
+        return []
+    result = await db.execute(select(User).where(User.id.in_(set(user_ids))))
+    by_id = {u.id: u for u in result.scalars().all()}
+    return [UserResponse.model_validate(by_id[uid]) for uid in user_ids if uid in by_id]
+
+
+async def exists(db: AsyncSession, user_id: int) -> bool:
+    result = await db.execute(select(User.id).where(User.id == user_id))
+    return result.scalar_one_or_none() is not None
+
+
+async def search(db: AsyncSession, query: str, limit: int = 20) -> list[UserResponse]:
+    result = await db.execute(select(User).where(User.username.ilike(f"%{query}%")).limit(limit))
+    return [UserResponse.model_validate(u) for u in result.scalars().all()]
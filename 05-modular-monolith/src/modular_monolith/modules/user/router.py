@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from modular_monolith.modules.post import api as post_api
 from modular_monolith.modules.post.schemas import PostResponse
-from modular_monolith.modules.post.service import PostService
 from modular_monolith.modules.user.schemas import UserProfileResponse, UserResponse, UserUpdate
 from modular_monolith.modules.user.service import UserService
 from modular_monolith.shared.database import get_db
@@ -23,7 +23,7 @@ async def update_me(data: UserUpdate, user_id: int = Depends(get_current_user_id
 
 @router.get("/{user_id}/posts", response_model=list[PostResponse])
 async def get_user_posts(user_id: int, limit: int = 20, offset: int = 0, db: AsyncSession = Depends(get_db)):
-    return await PostService(db).get_by_author(user_id, limit, offset)
+    return await post_api.list_by_authors(db, [user_id], limit, offset)
 
 
 @router.get("/{user_id}/followers", response_model=list[UserResponse])
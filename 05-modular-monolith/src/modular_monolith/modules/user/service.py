@@ -1,10 +1,10 @@
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from modular_monolith.modules.auth.models import User
-from modular_monolith.modules.follow.models import Follow
-from modular_monolith.modules.post.models import Post
+from modular_monolith.modules.follow import api as follow_api
+from modular_monolith.modules.post import api as post_api
+from modular_monolith.modules.user import api as user_api
 from modular_monolith.modules.user.schemas import UserProfileResponse, UserResponse, UserUpdate
 
 
@@ -17,15 +17,9 @@ class UserService:
         if not user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-        post_count = (await self.db.execute(
-            select(func.count()).select_from(Post).where(Post.author_id == user_id)
-        )).scalar_one()
-        follower_count = (await self.db.execute(
-            select(func.count()).select_from(Follow).where(Follow.following_id == user_id)
-        )).scalar_one()
-        following_count = (await self.db.execute(
-            select(func.count()).select_from(Follow).where(Follow.follower_id == user_id)
-        )).scalar_one()
+        post_count = await post_api.count_by_author(self.db, user_id)
+        follower_count = await follow_api.count_followers(self.db, user_id)
+        following_count = await follow_api.count_following(self.db, user_id)
 
         return UserProfileResponse(
             id=user.id, username=user.username, full_name=user.full_name,
@@ -44,19 +38,10 @@ class UserService:
         return UserResponse.model_validate(user)
 
     async def get_followers(self, user_id: int) -> list[UserResponse]:
-        result = await self.db.execute(
-            select(User).join(Follow, Follow.follower_id == User.id).where(Follow.following_id == user_id)
-        )
-        return [UserResponse.model_validate(u) for u in result.scalars().all()]
+        return await user_api.get_users(self.db, await follow_api.get_follower_ids(self.db, user_id))
 
     async def get_following(self, user_id: int) -> list[UserResponse]:
-        result = await self.db.execute(
-            select(User).join(Follow, Follow.following_id == User.id).where(Follow.follower_id == user_id)
-        )
-        return [UserResponse.model_validate(u) for u in result.scalars().all()]
+        return await user_api.get_users(self.db, await follow_api.get_following_ids(self.db, user_id))
 
     async def search_users(self, query: str, limit: int = 20) -> list[UserResponse]:
-        result = await self.db.execute(
-            select(User).where(User.username.ilike(f"%{query}%")).limit(limit)
-        )
-        return [UserResponse.model_validate(u) for u in result.scalars().all()]
+        return await user_api.search(self.db, query, limit)
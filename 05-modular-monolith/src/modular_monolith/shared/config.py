@@ -4,9 +4,21 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     app_name: str = "Instagram Clone - Modular Monolith"
     database_url: str = "sqlite+aiosqlite:///./modular_monolith.db"
+    # Per-module overrides, e.g. {"like": "sqlite+aiosqlite:///./like.db"}.
+    # Modules not listed here use ``database_url``.
+    module_database_urls: dict[str, str] = {}
+    # Modules whose routes this worker serves; None serves all of them.
+    enabled_modules: list[str] | None = None
+    # Import and register a module's router on the first request to it.
+    lazy_module_loading: bool = True
     secret_key: str = "super-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60
+    event_bus_workers: int = 4
+    event_bus_queue_size: int = 1000
+    # Notifications with the same recipient, type and reference inside this
+    # window collapse into one row. 0 stores one row per interaction.
+    notification_coalesce_window_seconds: int = 3600
 
 
 settings = Settings()
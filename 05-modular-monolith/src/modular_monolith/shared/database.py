@@ -1,11 +1,108 @@
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import MetaData, Table
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.util import find_tables
 
+from modular_monolith.shared.base_model import Base
 from modular_monolith.shared.config import settings
 
-engine = create_async_engine(settings.database_url, echo=False)
-async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+MODULES_PACKAGE = "modular_monolith.modules."
+
+
+def module_of(cls: type) -> str:
+    """Name of the module that owns a mapped class, e.g. ``like``."""
+    return cls.__module__.removeprefix(MODULES_PACKAGE).split(".")[0]
+
+
+class ModuleEngines:
+    """One engine per module database.
+
+    Modules without an entry in ``module_urls`` share the default engine, so
+    the out-of-the-box setup is still a single database file. Modules that
+    point at the same URL share an engine as well.
+    """
+
+    def __init__(self, default_url: str, module_urls: dict[str, str] | None = None):
+        self.default_url = default_url
+        self.module_urls = dict(module_urls or {})
+        self._by_url: dict[str, AsyncEngine] = {}
+        # Filled on first use of each table, as get_bind runs per statement.
+        self._by_table: dict[Table, AsyncEngine] = {}
+        self.default = self._engine(default_url)
+
+    def _engine(self, url: str) -> AsyncEngine:
+        if url not in self._by_url:
+            self._by_url[url] = create_async_engine(url, echo=False)
+        return self._by_url[url]
+
+    def for_module(self, module: str) -> AsyncEngine:
+        return self._engine(self.module_urls.get(module, self.default_url))
+
+    def for_table(self, table: Table) -> AsyncEngine:
+        engine = self._by_table.get(table)
+        if engine is None:
+            for mapper in Base.registry.mappers:
+                if mapper.local_table is table:
+                    engine = self.for_module(module_of(mapper.class_))
+                    self._by_table[table] = engine
+                    break
+            else:
+                # Not cached: its model may not be imported yet.
+                return self.default
+        return engine
+
+    def tables_by_engine(self, metadata: MetaData) -> dict[AsyncEngine, list[Table]]:
+        grouped: dict[AsyncEngine, list[Table]] = {}
+        for table in metadata.sorted_tables:
+            grouped.setdefault(self.for_table(table), []).append(table)
+        return grouped
+
+    async def create_all(self, metadata: MetaData = Base.metadata):
+        for engine, tables in self.tables_by_engine(metadata).items():
+            async with engine.begin() as conn:
+                await conn.run_sync(metadata.create_all, tables=tables)
+
+    async def dispose(self):
+        for engine in self._by_url.values():
+            await engine.dispose()
+
+
+class ModuleRoutingSession(Session):
+    """Sends each statement to the engine of the module owning its tables.
+
+    Cross-module joins are not possible; modules read each other's data
+    through their public ``api.py`` instead.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        engines: ModuleEngines = self.info["engines"]
+        if mapper is not None:
+            return engines.for_module(module_of(mapper.class_)).sync_engine
+        if clause is not None:
+            for table in find_tables(clause, include_crud=True):
+                return engines.for_table(table).sync_engine
+        return engines.default.sync_engine
+
+
+def make_session_factory(engines: ModuleEngines) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        class_=AsyncSession,
+        sync_session_class=ModuleRoutingSession,
+        info={"engines": engines},
+        expire_on_commit=False,
+    )
+
+
+engines = ModuleEngines(settings.database_url, settings.module_database_urls)
+engine = engines.default
+async_session = make_session_factory(engines)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession]:
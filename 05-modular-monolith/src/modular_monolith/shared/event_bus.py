@@ -1,8 +1,20 @@
+import asyncio
+import logging
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+from sqlalchemy import event as sa_event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from modular_monolith.shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+PENDING_EVENTS_KEY = "pending_events"
+
 
 @dataclass
 class Event:
@@ -10,16 +22,128 @@ class Event:
     data: dict[str, Any] = field(default_factory=dict)
 
 
+Handler = Callable[[Event, AsyncSession], Awaitable[None]]
+
+
 class EventBus:
-    def __init__(self):
-        self._handlers: dict[str, list[Callable]] = defaultdict(list)
+    """In-process pub/sub between modules.
+
+    Handlers receive the event plus a session of their own, so they never
+    share the publisher's transaction. ``publish`` delivers inline;
+    ``publish_nowait`` and ``publish_on_commit`` hand events to a bounded
+    pool of background workers and return immediately.
+    """
+
+    def __init__(self, workers: int = 4, max_queue_size: int = 1000):
+        self._handlers: dict[str, list[Handler]] = defaultdict(list)
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._queue: asyncio.Queue[tuple[Handler, Event]] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.dropped = 0
+
+    def configure(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        workers: int | None = None,
+        max_queue_size: int | None = None,
+    ):
+        if session_factory is not None:
+            self._session_factory = session_factory
+        if workers is not None:
+            self.workers = workers
+        if max_queue_size is not None:
+            self.max_queue_size = max_queue_size
+
+    def subscribe(self, event_type: str, handler: Handler):
+        if handler not in self._handlers[event_type]:
+            self._handlers[event_type].append(handler)
+
+    def _sessions(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_factory is None:
+            from modular_monolith.shared.database import async_session
 
-    def subscribe(self, event_type: str, handler: Callable):
-        self._handlers[event_type].append(handler)
+            self._session_factory = async_session
+        return self._session_factory
+
+    async def _deliver(self, handler: Handler, event: Event):
+        async with self._sessions()() as session:
+            try:
+                await handler(event, session)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                logger.exception("Handler %s failed for %s", handler.__qualname__, event.type)
 
     async def publish(self, event: Event):
         for handler in self._handlers.get(event.type, []):
-            await handler(event)
+            await self._deliver(handler, event)
+
+    def _ensure_workers(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+        # Workers are bound to the loop that started them.
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def _worker(self):
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            handler, event = await queue.get()
+            try:
+                await self._deliver(handler, event)
+            finally:
+                queue.task_done()
+
+    def publish_nowait(self, event: Event):
+        """Queue delivery and return; drops the event if the queue is full."""
+        handlers = self._handlers.get(event.type, [])
+        if not handlers:
+            return
+        self._ensure_workers()
+        assert self._queue is not None
+        for handler in handlers:
+            try:
+                self._queue.put_nowait((handler, event))
+            except asyncio.QueueFull:
+                self.dropped += 1
+                logger.warning("Event queue full, dropping %s for %s", event.type, handler.__qualname__)
+
+    def publish_on_commit(self, db: AsyncSession, event: Event):
+        """Queue ``event`` once ``db`` commits; discarded on rollback."""
+        db.info.setdefault(PENDING_EVENTS_KEY, []).append(event)
+
+    async def drain(self):
+        """Wait until every queued event has been handled."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def stop(self):
+        await self.drain()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        self._loop = None
+
+
+event_bus = EventBus(
+    workers=settings.event_bus_workers, max_queue_size=settings.event_bus_queue_size
+)
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _flush_pending_events(session: Session):
+    for pending in session.info.pop(PENDING_EVENTS_KEY, []):
+        event_bus.publish_nowait(pending)
 
 
-event_bus = EventBus()
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session):
+    session.info.pop(PENDING_EVENTS_KEY, None)
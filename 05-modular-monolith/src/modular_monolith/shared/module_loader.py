@@ -0,0 +1,73 @@
+import importlib
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from modular_monolith.manifest import MODULES, ModuleSpec
+from modular_monolith.shared.event_bus import EventBus
+
+# Paths that need the full route table, e.g. to render the OpenAPI schema.
+FULL_SCHEMA_PATHS = ("/docs", "/redoc", "/openapi.json")
+
+
+def _resolve(target: str):
+    module_path, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_path), attr)
+
+
+def import_models(modules: list[ModuleSpec]):
+    """Import model modules so ``Base.metadata`` knows their tables."""
+    for spec in modules:
+        if spec.has_models:
+            importlib.import_module(f"{spec.package}.models")
+
+
+def register_subscribers(bus: EventBus, modules: tuple[ModuleSpec, ...] = MODULES):
+    """Subscribe every module's event handlers.
+
+    Not limited to the enabled modules: a worker serving only the post
+    routes still publishes events that the notification module handles.
+    """
+    for spec in modules:
+        if spec.subscribers:
+            _resolve(spec.subscribers)(bus)
+
+
+class ModuleLoader:
+    """Registers module routers on first use instead of at import time."""
+
+    def __init__(self, app: FastAPI, modules: list[ModuleSpec]):
+        self.app = app
+        self.modules = modules
+        self.loaded: set[str] = set()
+
+    def load(self, spec: ModuleSpec):
+        if spec.name in self.loaded:
+            return
+        router = importlib.import_module(f"{spec.package}.router").router
+        self.app.include_router(router)
+        self.app.openapi_schema = None
+        self.loaded.add(spec.name)
+
+    def load_all(self):
+        for spec in self.modules:
+            self.load(spec)
+
+    def load_for_path(self, path: str):
+        if path.startswith(FULL_SCHEMA_PATHS):
+            self.load_all()
+            return
+        for spec in self.modules:
+            if spec.name not in self.loaded and path.startswith(spec.prefixes):
+                self.load(spec)
+
+
+class LazyModuleMiddleware:
+    def __init__(self, app: ASGIApp, loader: ModuleLoader):
+        self.app = app
+        self.loader = loader
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] in ("http", "websocket"):
+            self.loader.load_for_path(scope["path"])
+        await self.app(scope, receive, send)
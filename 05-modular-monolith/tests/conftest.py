@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from modular_monolith.shared.database import get_db
 from modular_monolith.shared.base_model import Base
+from modular_monolith.shared.event_bus import event_bus
 from modular_monolith.main import app
 
 import modular_monolith.modules.auth.models
@@ -52,6 +53,7 @@ async def override_get_db() -> AsyncGenerator[AsyncSession]:
 
 
 app.dependency_overrides[get_db] = override_get_db
+event_bus.configure(session_factory=test_session)
 
 BASE_URL = "http://testserver"
 
@@ -1,5 +1,19 @@
+import asyncio
+
 import pytest
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event as sa_event
+from sqlalchemy import inspect
+
+from modular_monolith.main import create_app
+from modular_monolith.manifest import enabled_modules
+from modular_monolith.modules.like import api as like_api
+from modular_monolith.modules.like.models import Like
+from modular_monolith.modules.post.models import Post
+from modular_monolith.shared.base_model import Base
+from modular_monolith.shared.database import ModuleEngines, get_db, make_session_factory
+from modular_monolith.shared.event_bus import Event, EventBus, event_bus
+from tests.conftest import engine, override_get_db
 
 pytestmark = pytest.mark.asyncio
 
@@ -256,6 +270,96 @@ class TestFeed:
         assert isinstance(posts, list)
 
 
+class TestModuleApiBatching:
+    async def _count_queries(self, call):
+        statements = []
+
+        def before_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        sa_event.listen(engine.sync_engine, "before_cursor_execute", before_execute)
+        try:
+            resp = await call()
+        finally:
+            sa_event.remove(engine.sync_engine, "before_cursor_execute", before_execute)
+        assert resp.status_code == 200
+        return len(statements), resp.json()
+
+    async def test_feed_query_count_is_independent_of_page_size(self, auth_client: AsyncClient):
+        for i in range(5):
+            post = await auth_client.post("/api/posts", json={"content": f"Batch post {i}"})
+            await auth_client.post(f"/api/posts/{post.json()['id']}/likes")
+
+        small, small_page = await self._count_queries(lambda: auth_client.get("/api/feed", params={"limit": 1}))
+        large, large_page = await self._count_queries(lambda: auth_client.get("/api/feed", params={"limit": 5}))
+        assert len(small_page) == 1
+        assert len(large_page) == 5
+        assert small == large
+        assert all(p["author_username"] == "testuser" for p in large_page)
+        assert large_page[0]["like_count"] == 1
+
+
+class TestModuleDatabases:
+    async def test_module_tables_live_in_their_own_database(self, tmp_path):
+        engines = ModuleEngines(
+            f"sqlite+aiosqlite:///{tmp_path / 'main.db'}",
+            {"like": f"sqlite+aiosqlite:///{tmp_path / 'like.db'}"},
+        )
+        await engines.create_all(Base.metadata)
+        session_factory = make_session_factory(engines)
+        try:
+            async with session_factory() as db:
+                post = Post(author_id=1, content="split")
+                db.add(post)
+                await db.flush()
+                db.add(Like(post_id=post.id, user_id=1))
+                await db.commit()
+                assert await like_api.counts(db, [post.id]) == {post.id: 1}
+
+            async with engines.for_module("like").connect() as conn:
+                like_tables = await conn.run_sync(lambda c: inspect(c).get_table_names())
+            async with engines.default.connect() as conn:
+                main_tables = await conn.run_sync(lambda c: inspect(c).get_table_names())
+            assert like_tables == ["like"]
+            assert "post" in main_tables and "like" not in main_tables
+            # Routing is looked up once per table, then served from the cache.
+            assert engines.for_table(Like.__table__) is engines.for_module("like")
+            assert engines._by_table[Like.__table__] is engines.for_module("like")
+        finally:
+            await engines.dispose()
+
+
+class TestModuleManifest:
+    async def test_routers_register_on_first_request(self):
+        app = create_app(modules=["auth", "search"], lazy=True)
+        app.dependency_overrides[get_db] = override_get_db
+        loader = app.state.module_loader
+        assert loader.loaded == set()
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+            resp = await client.get("/api/search/users", params={"q": "test"})
+            assert resp.status_code == 200
+            assert loader.loaded == {"search"}
+
+            resp = await client.get("/api/feed")
+            assert resp.status_code == 404
+            assert loader.loaded == {"search"}
+
+    async def test_subscribers_of_disabled_modules_are_registered(self, monkeypatch):
+        from modular_monolith import main
+        from modular_monolith.modules.notification.handlers import on_post_liked
+        from modular_monolith.shared.event_bus import EventBus
+
+        bus = EventBus()
+        monkeypatch.setattr(main, "event_bus", bus)
+        create_app(modules=["auth", "post", "comment", "like"], lazy=True)
+        assert bus._handlers["post.liked"] == [on_post_liked]
+
+    async def test_unknown_module_is_rejected(self):
+        with pytest.raises(ValueError):
+            enabled_modules(["auth", "nope"])
+
+
 class TestStory:
     async def test_create_and_get_stories(self, auth_client: AsyncClient):
         resp = await auth_client.post("/api/stories", json={
@@ -357,6 +461,7 @@ class TestNotification:
         other_id = other_me.json()["id"]
 
         await auth_client.post(f"/api/follow/{other_id}")
+        await event_bus.drain()
 
         notif_resp = await auth_client.get(
             "/api/notifications",
@@ -380,6 +485,7 @@ class TestNotification:
         post_id = post_resp.json()["id"]
 
         await auth_client.post(f"/api/posts/{post_id}/likes")
+        await event_bus.drain()
 
         notif_resp = await auth_client.get(
             "/api/notifications",
@@ -390,6 +496,62 @@ class TestNotification:
         like_notifs = [n for n in notifications if n["type"] == "like"]
         assert len(like_notifs) >= 1
 
+    async def test_like_notifications_coalesce_per_post(
+        self, auth_client: AsyncClient, second_user_token: str
+    ):
+        second = {"Authorization": f"Bearer {second_user_token}"}
+        post_resp = await auth_client.post("/api/posts", json={"content": "Viral"}, headers=second)
+        post_id = post_resp.json()["id"]
+
+        await auth_client.post("/api/auth/register", json={
+            "username": "thirduser", "email": "third@example.com", "password": "testpass123",
+        })
+        login = await auth_client.post("/api/auth/login", json={
+            "email": "third@example.com", "password": "testpass123",
+        })
+        third = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        await auth_client.post(f"/api/posts/{post_id}/likes")
+        await event_bus.drain()
+        await auth_client.post(f"/api/posts/{post_id}/likes", headers=third)
+        await event_bus.drain()
+
+        notif_resp = await auth_client.get("/api/notifications", headers=second)
+        like_notifs = [
+            n for n in notif_resp.json() if n["type"] == "like" and n["reference_id"] == post_id
+        ]
+        assert len(like_notifs) == 1
+        assert like_notifs[0]["actor_count"] == 2
+        assert like_notifs[0]["message"] == "thirduser and 1 other liked your post"
+
+        # Unlike and like again: the first liker is still one of two actors.
+        await auth_client.post(f"/api/posts/{post_id}/likes")
+        await auth_client.post(f"/api/posts/{post_id}/likes")
+        await event_bus.drain()
+
+        notif_resp = await auth_client.get("/api/notifications", headers=second)
+        like_notifs = [
+            n for n in notif_resp.json() if n["type"] == "like" and n["reference_id"] == post_id
+        ]
+        assert len(like_notifs) == 1
+        assert like_notifs[0]["actor_count"] == 2
+        assert like_notifs[0]["message"] == "testuser and 1 other liked your post"
+
+    async def test_actor_tracking_stays_bounded(self):
+        from modular_monolith.modules.notification import actors
+
+        recent, sketch, count = [], actors.EMPTY_SKETCH, 0
+        for actor_id in range(1, 5001):
+            recent, sketch, count = actors.add_actor(recent, sketch, count, actor_id)
+        assert len(recent) == actors.RECENT_ACTORS
+        assert len(sketch) == actors.SKETCH_REGISTERS
+        assert 3500 < count < 6500
+
+        # Returning actors, listed or not, are not counted again.
+        for actor_id in (1, 2500, 5000):
+            _, _, again = actors.add_actor(recent, sketch, count, actor_id)
+            assert again == count
+
     async def test_mark_single_notification_read(
         self, auth_client: AsyncClient, second_user_token: str
     ):
@@ -407,6 +569,41 @@ class TestNotification:
             assert mark_resp.status_code == 200
 
 
+class TestEventBus:
+    async def test_publish_nowait_does_not_wait_for_slow_handler(self):
+        bus = EventBus(workers=2, max_queue_size=10)
+        release = asyncio.Event()
+        handled = []
+
+        async def slow_handler(event, db):
+            await release.wait()
+            handled.append(event.data["n"])
+
+        bus.subscribe("slow", slow_handler)
+        bus.publish_nowait(Event("slow", {"n": 1}))
+        assert handled == []
+
+        release.set()
+        await bus.drain()
+        assert handled == [1]
+        await bus.stop()
+
+    async def test_publish_nowait_drops_when_queue_full(self):
+        bus = EventBus(workers=1, max_queue_size=1)
+        release = asyncio.Event()
+
+        async def blocked_handler(event, db):
+            await release.wait()
+
+        bus.subscribe("blocked", blocked_handler)
+        for _ in range(3):
+            bus.publish_nowait(Event("blocked"))
+        assert bus.dropped >= 1
+
+        release.set()
+        await bus.stop()
+
+
 class TestSearch:
     async def test_search_users(self, auth_client: AsyncClient):
         resp = await auth_client.get("/api/search/users", params={"q": "test"})
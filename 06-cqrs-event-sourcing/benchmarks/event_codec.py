@@ -0,0 +1,66 @@
+"""Event codec benchmark: encode/decode throughput and bytes per event.
+
+Compares the JSON encoding used by older rows with the binary codec on a
+few representative payloads.
+
+    uv run python benchmarks/event_codec.py [--events 100000]
+"""
+import argparse
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from cqrs_es.shared.event_codec import BinaryCodec, JsonCodec  # noqa: E402
+from cqrs_es.write.events.events import (  # noqa: E402
+    COMMENT_CREATED,
+    EVENT_SCHEMAS,
+    LIKE_ADDED,
+    POST_CREATED,
+)
+
+NOW = datetime.now(timezone.utc).isoformat()
+
+SAMPLES = {
+    LIKE_ADDED: {"post_id": 48213, "user_id": 90211, "post_author_id": 1734},
+    POST_CREATED: {
+        "post_id": 48213, "author_id": 1734, "content": "Sunset at the pier #travel",
+        "image_url": "https://cdn.example.com/p/48213.jpg", "created_at": NOW,
+    },
+    COMMENT_CREATED: {
+        "comment_id": 991, "post_id": 48213, "author_id": 90211,
+        "content": "Gorgeous!", "post_author_id": 1734, "created_at": NOW,
+    },
+}
+
+
+def measure(codec, event_type: str, data: dict, n: int) -> tuple[float, float, int]:
+    start = time.perf_counter()
+    for _ in range(n):
+        raw = codec.encode(event_type, data)
+    encode_rate = n / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for _ in range(n):
+        codec.decode(raw)
+    decode_rate = n / (time.perf_counter() - start)
+    size = len(raw.encode() if isinstance(raw, str) else raw)
+    return encode_rate, decode_rate, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=100_000)
+    n = parser.parse_args().events
+
+    codecs = {"json": JsonCodec(), "binary": BinaryCodec(EVENT_SCHEMAS)}
+    print(f"{'event':<16}{'codec':<8}{'encode/s':>12}{'decode/s':>12}{'bytes':>8}")
+    for event_type, data in SAMPLES.items():
+        for name, codec in codecs.items():
+            enc, dec, size = measure(codec, event_type, data, n)
+            print(f"{event_type:<16}{name:<8}{enc:>12,.0f}{dec:>12,.0f}{size:>8}")
+
+
+if __name__ == "__main__":
+    main()
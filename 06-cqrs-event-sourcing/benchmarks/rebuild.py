@@ -0,0 +1,132 @@
+"""Projection rebuild benchmark: replay throughput in events per second.
+
+Fills a scratch database with a synthetic event history (registrations,
+posts with hashtags, likes and unlikes, comments, follows and messages)
+and times ``rebuild_projections`` over it.
+
+    uv run python benchmarks/rebuild.py [--events 50000] [--batch-size 1000]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from cqrs_es.main import _register_event_subscribers  # noqa: E402
+from cqrs_es.rebuild import rebuild_projections  # noqa: E402
+from cqrs_es.shared.database import Base  # noqa: E402
+from cqrs_es.shared.event_codec import encode_event  # noqa: E402
+from cqrs_es.shared.event_store import EventStoreModel  # noqa: E402
+from cqrs_es.write.aggregates.post import PostAggregate  # noqa: E402
+from cqrs_es.write.aggregates.social import (  # noqa: E402
+    FollowAggregate,
+    MessageAggregate,
+)
+from cqrs_es.write.aggregates.user import UserAggregate  # noqa: E402
+
+TAGS = ["travel", "food", "sunset", "cats", "code", "music", "art", "gym"]
+
+
+def history(n: int, users: int, seed: int = 7) -> list[tuple[str, str, tuple]]:
+    """``(aggregate_type, aggregate_id, (event_type, data))`` in stored order."""
+    rng = random.Random(seed)
+    events = []
+    for user_id in range(1, users + 1):
+        events.append(("User", str(user_id), UserAggregate.register(
+            user_id, f"user{user_id}", f"user{user_id}@example.com", "x" * 60, None,
+        )))
+    authors: dict[int, int] = {}
+    likes: set[tuple[int, int]] = set()
+    follows: set[tuple[int, int]] = set()
+    comments = messages = 0
+    while len(events) < n:
+        roll = rng.random()
+        user_id = rng.randint(1, users)
+        if roll < 0.12 or not authors:
+            post_id = len(authors) + 1
+            authors[post_id] = user_id
+            tag = f" #{rng.choice(TAGS)}" if rng.random() < 0.3 else ""
+            events.append(("Post", str(post_id), PostAggregate.create(
+                post_id, user_id, f"Post {post_id}{tag}", None,
+            )))
+            continue
+        post_id = rng.randint(1, len(authors))
+        if roll < 0.62:
+            if (post_id, user_id) in likes:
+                likes.discard((post_id, user_id))
+                event = PostAggregate.remove_like(post_id, user_id)
+            else:
+                likes.add((post_id, user_id))
+                event = PostAggregate.add_like(post_id, user_id, authors[post_id])
+            events.append(("Post", str(post_id), event))
+        elif roll < 0.82:
+            comments += 1
+            events.append(("Post", str(post_id), PostAggregate.add_comment(
+                comments, post_id, user_id, "Nice!", authors[post_id],
+            )))
+        elif roll < 0.91:
+            other = rng.randint(1, users)
+            if other == user_id or (user_id, other) in follows:
+                continue
+            follows.add((user_id, other))
+            events.append(
+                ("Follow", str(user_id), FollowAggregate.follow(user_id, other))
+            )
+        else:
+            messages += 1
+            events.append(("Message", str(messages), MessageAggregate.send(
+                messages, user_id, rng.randint(1, users), "hello",
+            )))
+    return events
+
+
+async def run(n: int, users: int, batch_size: int) -> None:
+    fd, path = tempfile.mkstemp(prefix="cqrs_es_bench_", suffix=".db")
+    os.close(fd)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            versions: dict[tuple[str, str], int] = defaultdict(int)
+            rows = []
+            for aggregate_type, aggregate_id, (event_type, data) in history(n, users):
+                versions[aggregate_type, aggregate_id] += 1
+                rows.append({
+                    "aggregate_type": aggregate_type,
+                    "aggregate_id": aggregate_id,
+                    "event_type": event_type,
+                    "event_data": encode_event(event_type, data),
+                    "version": versions[aggregate_type, aggregate_id],
+                })
+            await conn.execute(insert(EventStoreModel), rows)
+
+        _register_event_subscribers()
+        stats = await rebuild_projections(engine, batch_size)
+        print(
+            f"{stats.events:,} events in {stats.seconds:.2f}s "
+            f"({stats.events_per_second:,.0f} events/s, batch size {batch_size})"
+        )
+    finally:
+        await engine.dispose()
+        os.remove(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(run(args.events, args.users, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cqrs_es.shared.database import get_db
+from cqrs_es.shared.projection_runner import wait_for_position
 from cqrs_es.shared.security import decode_token
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
@@ -16,5 +17,18 @@ async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> int:
     return int(user_id)
 
 
-async def get_session(db: AsyncSession = Depends(get_db)) -> AsyncSession:
+async def get_session(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    x_min_position: int | None = Header(default=None),
+) -> AsyncSession:
+    if x_min_position is not None:
+        try:
+            await wait_for_position(x_min_position)
+        except TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Projections have not caught up yet",
+            )
+    request.state.db = db
     return db
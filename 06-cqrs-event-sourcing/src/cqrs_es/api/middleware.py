@@ -0,0 +1,33 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from cqrs_es.shared.event_store import LAST_POSITION_KEY
+
+POSITION_HEADER = b"x-event-position"
+
+
+class EventPositionMiddleware:
+    """Adds ``X-Event-Position`` to responses of requests that appended events.
+
+    Clients pass it back as ``X-Min-Position`` on later reads to wait until
+    the projections have caught up with their own writes.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_position(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                db = scope.get("state", {}).get("db")
+                position = db.info.get(LAST_POSITION_KEY) if db is not None else None
+                if position is not None:
+                    headers = list(message.get("headers", []))
+                    headers.append((POSITION_HEADER, str(position).encode()))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_position)
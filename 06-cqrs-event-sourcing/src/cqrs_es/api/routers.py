@@ -1,4 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cqrs_es.api.dependencies import get_current_user_id, get_session
@@ -40,7 +44,9 @@ from cqrs_es.read.queries.queries import (
     SearchUsers,
 )
 from cqrs_es.shared.command_bus import dispatch_command
+from cqrs_es.shared.event_store import RecordedEvent
 from cqrs_es.shared.query_bus import dispatch_query
+from cqrs_es.shared.subscriptions import subscribe
 from cqrs_es.write.commands.commands import (
     CreateComment,
     CreatePost,
@@ -59,6 +65,12 @@ from cqrs_es.write.commands.commands import (
     UnfollowUser,
     UpdateUser,
 )
+from cqrs_es.write.events.events import (
+    ALL_NOTIFICATIONS_READ,
+    MESSAGE_SENT,
+    MESSAGES_MARKED_READ,
+    NOTIFICATION_READ,
+)
 
 # --- Auth ---
 auth_router = APIRouter(prefix="/api/auth", tags=["auth"])
@@ -314,10 +326,13 @@ async def send_message(
 
 @message_router.get("", response_model=list[ConversationResponse])
 async def list_conversations(
+    limit: int = 50, offset: int = 0,
     user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_session),
 ):
-    return await dispatch_query(GetConversations(user_id=user_id, db=db))
+    return await dispatch_query(
+        GetConversations(user_id=user_id, limit=limit, offset=offset, db=db)
+    )
 
 
 @message_router.get("/{other_user_id}", response_model=list[MessageResponse])
@@ -400,3 +415,73 @@ async def get_posts_by_hashtag(
     return await dispatch_query(
         GetPostsByHashtag(tag=tag, limit=limit, offset=offset, db=db)
     )
+
+
+# --- Event stream ---
+event_router = APIRouter(prefix="/api/events", tags=["events"])
+
+# Private to the users involved; never streamed.
+HIDDEN_EVENT_TYPES = {
+    MESSAGE_SENT, MESSAGES_MARKED_READ, NOTIFICATION_READ, ALL_NOTIFICATIONS_READ,
+}
+REDACTED_FIELDS = ("hashed_password", "email")
+KEEPALIVE_SECONDS = 15
+
+
+def _sse(event: RecordedEvent) -> str:
+    data = {k: v for k, v in event.event_data.items() if k not in REDACTED_FIELDS}
+    payload = json.dumps({
+        "aggregate_type": event.aggregate_type,
+        "aggregate_id": event.aggregate_id,
+        "version": event.version,
+        "data": data,
+        "created_at": event.created_at.isoformat(),
+    })
+    return f"id: {event.position}\nevent: {event.event_type}\ndata: {payload}\n\n"
+
+
+@event_router.get("/stream")
+async def stream_events(
+    from_position: int = 0,
+    follow: bool = True,
+    types: list[str] | None = Query(default=None),
+    last_event_id: int | None = Header(default=None),
+    _: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_session),
+):
+    """Server-Sent Events for every event after ``Last-Event-ID`` (or
+    ``from_position``): stored events first, then live ones as they commit."""
+    position = last_event_id if last_event_id is not None else from_position
+    wanted = set(types) - HIDDEN_EVENT_TYPES if types else None
+    events = subscribe(db.bind, position, live=follow)
+
+    async def body():
+        next_event = None
+        try:
+            while True:
+                if next_event is None:
+                    next_event = asyncio.ensure_future(anext(events))
+                done, _ = await asyncio.wait({next_event}, timeout=KEEPALIVE_SECONDS)
+                if not done:
+                    yield ": keepalive\n\n"
+                    continue
+                try:
+                    event = next_event.result()
+                except StopAsyncIteration:
+                    return
+                next_event = None
+                if event.event_type in HIDDEN_EVENT_TYPES:
+                    continue
+                if wanted is None or event.event_type in wanted:
+                    yield _sse(event)
+        finally:
+            if next_event is not None:
+                next_event.cancel()
+                await asyncio.gather(next_event, return_exceptions=True)
+            await events.aclose()
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -107,6 +107,7 @@ class MessageResponse(BaseModel):
 
 class ConversationResponse(BaseModel):
     other_user_id: int
+    unread_count: int
     last_message: MessageResponse
 
 
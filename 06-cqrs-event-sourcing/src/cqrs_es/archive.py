@@ -0,0 +1,136 @@
+"""Move old events out of ``event_store`` into archive segments.
+
+    python -m cqrs_es.archive [--horizon-days 365] [--batch-size 5000] [--vacuum]
+
+An event is archived once it is older than the horizon and its stream has a
+snapshot at or past its version, so loading the aggregate never needs it.
+Events the projection runners have not applied yet stay in the table, and so
+does the newest event: SQLite assigns the next id after the largest one left
+in the table, and global positions must keep increasing.
+
+Each batch is written as a segment before its rows are deleted. If the job
+stops in between, the next run finishes deleting the last segment's rows.
+"""
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from cqrs_es.shared.event_archive import (
+    ARCHIVE_HORIZON_DAYS,
+    EventArchive,
+    event_archive,
+)
+from cqrs_es.shared.event_store import EventStoreModel, SnapshotModel
+from cqrs_es.shared.projection_runner import ProjectionCheckpoint
+
+# Ids per DELETE, below SQLite's bound parameter limit.
+DELETE_CHUNK = 500
+
+
+@dataclass
+class ArchiveStats:
+    events: int
+    segments: int
+    seconds: float
+
+
+async def _delete_events(db: AsyncSession, ids: list[int]) -> None:
+    for start in range(0, len(ids), DELETE_CHUNK):
+        await db.execute(
+            delete(EventStoreModel).where(
+                EventStoreModel.id.in_(ids[start:start + DELETE_CHUNK])
+            )
+        )
+
+
+async def _archivable_up_to(db: AsyncSession) -> int:
+    newest = (await db.execute(select(func.max(EventStoreModel.id)))).scalar_one()
+    if newest is None:
+        return 0
+    applied = (
+        await db.execute(select(func.min(ProjectionCheckpoint.position)))
+    ).scalar_one()
+    return min(newest - 1, applied) if applied is not None else newest - 1
+
+
+async def archive_events(
+    engine: AsyncEngine,
+    archive: EventArchive = event_archive,
+    horizon: timedelta = timedelta(days=ARCHIVE_HORIZON_DAYS),
+    batch_size: int = 5000,
+) -> ArchiveStats:
+    started = time.perf_counter()
+    archived = segments = 0
+    async with AsyncSession(engine) as db:
+        existing = archive.segments()
+        if existing:
+            await _delete_events(db, [e.position for e in existing[-1].iter_events()])
+            await db.commit()
+
+        cutoff = datetime.now(timezone.utc) - horizon
+        up_to = await _archivable_up_to(db)
+        position = 0
+        while True:
+            result = await db.execute(
+                select(EventStoreModel)
+                .join(
+                    SnapshotModel,
+                    and_(
+                        SnapshotModel.aggregate_type == EventStoreModel.aggregate_type,
+                        SnapshotModel.aggregate_id == EventStoreModel.aggregate_id,
+                        SnapshotModel.version >= EventStoreModel.version,
+                    ),
+                )
+                .where(
+                    EventStoreModel.id > position,
+                    EventStoreModel.id <= up_to,
+                    EventStoreModel.created_at < cutoff,
+                )
+                .order_by(EventStoreModel.id)
+                .limit(batch_size)
+            )
+            rows = result.scalars().all()
+            if not rows:
+                break
+            archive.write_segment(rows)
+            ids = [row.id for row in rows]
+            await _delete_events(db, ids)
+            await db.commit()
+            db.expunge_all()
+            position = ids[-1]
+            archived += len(ids)
+            segments += 1
+    return ArchiveStats(archived, segments, time.perf_counter() - started)
+
+
+async def main(horizon_days: int, batch_size: int, vacuum: bool) -> None:
+    from cqrs_es.shared.database import engine
+
+    stats = await archive_events(
+        engine, event_archive, timedelta(days=horizon_days), batch_size
+    )
+    if vacuum and stats.events:
+        async with engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text("VACUUM"))
+    await engine.dispose()
+    print(
+        f"Archived {stats.events} events into {stats.segments} segments "
+        f"in {stats.seconds:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--horizon-days", type=int, default=ARCHIVE_HORIZON_DAYS)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument(
+        "--vacuum", action="store_true", help="reclaim the freed space afterwards"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.horizon_days, args.batch_size, args.vacuum))
@@ -2,8 +2,10 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from cqrs_es.api.middleware import EventPositionMiddleware
 from cqrs_es.api.routers import (
     auth_router,
+    event_router,
     feed_router,
     follow_router,
     message_router,
@@ -38,6 +40,7 @@ from cqrs_es.read.projections.handlers import (
     on_comment_deleted,
     on_like_added,
     on_like_removed,
+    on_likes_changed,
     on_message_sent,
     on_messages_marked_read,
     on_notification_read,
@@ -51,6 +54,13 @@ from cqrs_es.read.projections.handlers import (
     on_user_updated,
 )
 from cqrs_es.read.projections.models import *  # noqa: F403
+from cqrs_es.read.projections.models import (
+    CommentProjection,
+    MessageProjection,
+    PostProjection,
+    StoryProjection,
+    UserProjection,
+)
 from cqrs_es.read.queries.queries import (
     GetConversation,
     GetConversations,
@@ -70,9 +80,13 @@ from cqrs_es.read.queries.queries import (
     SearchHashtags,
     SearchUsers,
 )
-from cqrs_es.shared import command_bus, event_bus, query_bus
+from cqrs_es.shared import command_bus, event_bus, projection_runner, query_bus
+from cqrs_es.shared.command_batcher import BatchPolicy
 from cqrs_es.shared.database import Base, engine
-from cqrs_es.shared.event_store import EventStoreModel  # noqa: F401
+from cqrs_es.shared.event_store import upgrade_event_data
+from cqrs_es.shared.id_sequence import id_allocator
+from cqrs_es.shared.query_cache import CachePolicy
+from cqrs_es.write.aggregates.claims import backfill_claims
 from cqrs_es.write.commands.commands import (
     CreateComment,
     CreatePost,
@@ -126,6 +140,7 @@ from cqrs_es.write.handlers.post import (
     handle_delete_comment,
     handle_delete_post,
     handle_toggle_like,
+    handle_toggle_likes,
 )
 from cqrs_es.write.handlers.social import (
     handle_create_story,
@@ -135,14 +150,26 @@ from cqrs_es.write.handlers.social import (
 )
 
 
+def _register_id_sequences() -> None:
+    id_allocator.register("user", UserProjection.id)
+    id_allocator.register("post", PostProjection.id)
+    id_allocator.register("comment", CommentProjection.id)
+    id_allocator.register("story", StoryProjection.id)
+    id_allocator.register("message", MessageProjection.id)
+
+
 def _register_command_handlers() -> None:
+    _register_id_sequences()
     command_bus.clear_handlers()
     command_bus.register_command_handler(RegisterUser, handle_register_user)
     command_bus.register_command_handler(LoginUser, handle_login_user)
     command_bus.register_command_handler(UpdateUser, handle_update_user)
     command_bus.register_command_handler(CreatePost, handle_create_post)
     command_bus.register_command_handler(DeletePost, handle_delete_post)
-    command_bus.register_command_handler(ToggleLike, handle_toggle_like)
+    command_bus.register_command_handler(
+        ToggleLike, handle_toggle_like,
+        batch=BatchPolicy(handler=handle_toggle_likes, key=lambda c: c.post_id),
+    )
     command_bus.register_command_handler(CreateComment, handle_create_comment)
     command_bus.register_command_handler(DeleteComment, handle_delete_comment)
     command_bus.register_command_handler(FollowUser, handle_follow_user)
@@ -159,12 +186,23 @@ def _register_query_handlers() -> None:
     query_bus.clear_handlers()
     query_bus.register_query_handler(GetUserById, handle_get_user_by_id)
     query_bus.register_query_handler(GetUserByEmail, handle_get_user_by_email)
-    query_bus.register_query_handler(GetUserProfile, handle_get_user_profile)
+    query_bus.register_query_handler(
+        GetUserProfile, handle_get_user_profile,
+        cache=CachePolicy(ttl=60, max_entries=10_000, tags=lambda q: [("user", q.user_id)]),
+    )
     query_bus.register_query_handler(GetUserPosts, handle_get_user_posts)
     query_bus.register_query_handler(GetUserFollowers, handle_get_user_followers)
     query_bus.register_query_handler(GetUserFollowing, handle_get_user_following)
-    query_bus.register_query_handler(GetPost, handle_get_post)
-    query_bus.register_query_handler(GetPostComments, handle_get_post_comments)
+    query_bus.register_query_handler(
+        GetPost, handle_get_post,
+        cache=CachePolicy(ttl=60, max_entries=10_000, tags=lambda q: [("post", q.post_id)]),
+    )
+    query_bus.register_query_handler(
+        GetPostComments, handle_get_post_comments,
+        cache=CachePolicy(
+            ttl=15, max_entries=2_000, tags=lambda q: [("post_comments", q.post_id)]
+        ),
+    )
     query_bus.register_query_handler(GetFeed, handle_get_feed)
     query_bus.register_query_handler(GetMyStories, handle_get_my_stories)
     query_bus.register_query_handler(GetStoryFeed, handle_get_story_feed)
@@ -184,6 +222,10 @@ def _register_event_subscribers() -> None:
     event_bus.subscribe(POST_DELETED, on_post_deleted)
     event_bus.subscribe(LIKE_ADDED, on_like_added)
     event_bus.subscribe(LIKE_REMOVED, on_like_removed)
+    event_bus.subscribe_batch(
+        (LIKE_ADDED, LIKE_REMOVED), on_likes_changed,
+        replaces=(on_like_added, on_like_removed),
+    )
     event_bus.subscribe(COMMENT_CREATED, on_comment_created)
     event_bus.subscribe(COMMENT_DELETED, on_comment_deleted)
     event_bus.subscribe(USER_FOLLOWED, on_user_followed)
@@ -196,6 +238,21 @@ def _register_event_subscribers() -> None:
     event_bus.subscribe(ALL_NOTIFICATIONS_READ, on_all_notifications_read)
 
 
+READ_MODEL = "read_model"
+
+
+async def _apply_read_model(events: list[tuple[str, dict]], db) -> None:
+    await event_bus.dispatch_many(events, db=db)
+
+
+def _register_projection_runners() -> None:
+    event_bus.defer()
+    projection_runner.register_runner(
+        projection_runner.ProjectionRunner(READ_MODEL, _apply_read_model)
+    )
+    projection_runner.start_runners()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     _register_command_handlers()
@@ -203,7 +260,16 @@ async def lifespan(app: FastAPI):
     _register_event_subscribers()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await upgrade_event_data(conn)
+        await backfill_claims(conn)
+        if projection_runner.ASYNC_PROJECTIONS:
+            await projection_runner.adopt_checkpoint(conn, READ_MODEL)
+        else:
+            await projection_runner.drop_checkpoint(conn, READ_MODEL)
+    if projection_runner.ASYNC_PROJECTIONS:
+        _register_projection_runners()
     yield
+    await projection_runner.stop_runners()
     await engine.dispose()
 
 
@@ -212,6 +278,8 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+app.add_middleware(EventPositionMiddleware)
+
 app.include_router(auth_router)
 app.include_router(user_router)
 app.include_router(post_router)
@@ -221,3 +289,4 @@ app.include_router(story_router)
 app.include_router(message_router)
 app.include_router(notification_router)
 app.include_router(search_router)
+app.include_router(event_router)
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from cqrs_es.read.projections.models import (
     CommentProjection,
+    ConversationProjection,
     FollowProjection,
     HashtagProjection,
     MessageProjection,
@@ -186,37 +187,32 @@ async def handle_get_story_feed(query: GetStoryFeed) -> list[dict]:
 
 async def handle_get_conversations(query: GetConversations) -> list[dict]:
     stmt = (
-        select(MessageProjection)
-        .where(
-            or_(
-                MessageProjection.sender_id == query.user_id,
-                MessageProjection.receiver_id == query.user_id,
-            )
+        select(ConversationProjection)
+        .where(ConversationProjection.user_id == query.user_id)
+        .order_by(
+            ConversationProjection.last_message_at.desc(),
+            ConversationProjection.other_user_id.desc(),
         )
-        .order_by(MessageProjection.created_at.desc())
+        .limit(query.limit)
+        .offset(query.offset)
     )
     result = await query.db.execute(stmt)
-    messages = result.scalars().all()
-
-    conversations: dict[int, MessageProjection] = {}
-    for msg in messages:
-        other_id = msg.receiver_id if msg.sender_id == query.user_id else msg.sender_id
-        if other_id not in conversations:
-            conversations[other_id] = msg
-
     return [
         {
-            "other_user_id": other_id,
+            "other_user_id": c.other_user_id,
+            "unread_count": c.unread_count,
             "last_message": {
-                "id": msg.id,
-                "sender_id": msg.sender_id,
-                "receiver_id": msg.receiver_id,
-                "content": msg.content,
-                "is_read": msg.is_read,
-                "created_at": msg.created_at,
+                "id": c.last_message_id,
+                "sender_id": c.last_sender_id,
+                "receiver_id": (
+                    c.other_user_id if c.last_sender_id == c.user_id else c.user_id
+                ),
+                "content": c.last_content,
+                "is_read": c.last_is_read,
+                "created_at": c.last_message_at,
             },
         }
-        for other_id, msg in conversations.items()
+        for c in result.scalars().all()
     ]
 
 
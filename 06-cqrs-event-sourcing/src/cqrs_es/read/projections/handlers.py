@@ -1,11 +1,15 @@
 import re
+from collections import Counter
 from datetime import datetime, timezone
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import and_, delete, insert, or_, select, tuple_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cqrs_es.read.projections.hashtag_cache import hashtag_cache
 from cqrs_es.read.projections.models import (
     CommentProjection,
+    ConversationProjection,
     FollowProjection,
     HashtagProjection,
     LikeProjection,
@@ -16,6 +20,8 @@ from cqrs_es.read.projections.models import (
     StoryProjection,
     UserProjection,
 )
+from cqrs_es.shared.query_cache import query_cache
+from cqrs_es.write.events.events import LIKE_ADDED
 
 
 async def on_user_registered(event_data: dict, db: AsyncSession, **_) -> None:
@@ -46,6 +52,7 @@ async def on_user_updated(event_data: dict, db: AsyncSession, **_) -> None:
         await db.execute(
             update(UserProjection).where(UserProjection.id == user_id).values(**values)
         )
+    query_cache.invalidate_on_commit(db, ("user", user_id))
 
 
 async def on_post_created(event_data: dict, db: AsyncSession, **_) -> None:
@@ -75,21 +82,51 @@ async def on_post_created(event_data: dict, db: AsyncSession, **_) -> None:
     )
 
     content = event_data.get("content") or ""
-    for tag in re.findall(r"#(\w+)", content):
-        tag_lower = tag.lower()
-        result = await db.execute(
-            select(HashtagProjection).where(HashtagProjection.name == tag_lower)
+    names = list(dict.fromkeys(tag.lower() for tag in re.findall(r"#(\w+)", content)))
+    if names:
+        hashtag_ids = await _resolve_hashtags(db, names)
+        await db.execute(
+            insert(PostHashtagProjection).values([
+                {"post_id": event_data["post_id"], "hashtag_id": hashtag_ids[name]}
+                for name in names
+            ])
         )
-        hashtag = result.scalar_one_or_none()
-        if not hashtag:
-            hashtag = HashtagProjection(name=tag_lower)
-            db.add(hashtag)
-            await db.flush()
-        link = PostHashtagProjection(
-            post_id=event_data["post_id"], hashtag_id=hashtag.id
+    query_cache.invalidate_on_commit(
+        db, ("post", event_data["post_id"]), ("user", event_data["author_id"])
+    )
+
+
+async def _hashtag_ids(db: AsyncSession, names: list[str]) -> dict[str, int]:
+    result = await db.execute(
+        select(HashtagProjection.name, HashtagProjection.id)
+        .where(HashtagProjection.name.in_(names))
+    )
+    return dict(result.all())
+
+
+async def _resolve_hashtags(db: AsyncSession, names: list[str]) -> dict[str, int]:
+    """Ids for ``names``, creating missing hashtags, in at most one select
+    and one insert beyond the cache."""
+    ids = hashtag_cache.lookup(names)
+    missing = [name for name in names if name not in ids]
+    if not missing:
+        return ids
+    found = await _hashtag_ids(db, missing)
+    new = [name for name in missing if name not in found]
+    if new:
+        result = await db.execute(
+            sqlite_insert(HashtagProjection)
+            .values([{"name": name} for name in new])
+            .on_conflict_do_nothing(index_elements=["name"])
+            .returning(HashtagProjection.name, HashtagProjection.id)
         )
-        db.add(link)
-        await db.flush()
+        found.update(result.all())
+        if len(found) < len(missing):
+            # Created by another writer since the select.
+            found.update(await _hashtag_ids(db, new))
+    hashtag_cache.stage(db, found)
+    ids.update(found)
+    return ids
 
 
 async def on_post_deleted(event_data: dict, db: AsyncSession, **_) -> None:
@@ -105,6 +142,12 @@ async def on_post_deleted(event_data: dict, db: AsyncSession, **_) -> None:
         .where(UserProjection.id == event_data["author_id"])
         .values(post_count=UserProjection.post_count - 1)
     )
+    query_cache.invalidate_on_commit(
+        db,
+        ("post", post_id),
+        ("post_comments", post_id),
+        ("user", event_data["author_id"]),
+    )
 
 
 async def on_like_added(event_data: dict, db: AsyncSession, **_) -> None:
@@ -127,6 +170,7 @@ async def on_like_added(event_data: dict, db: AsyncSession, **_) -> None:
         )
         db.add(notification)
         await db.flush()
+    query_cache.invalidate_on_commit(db, ("post", event_data["post_id"]))
 
 
 async def on_like_removed(event_data: dict, db: AsyncSession, **_) -> None:
@@ -141,6 +185,60 @@ async def on_like_removed(event_data: dict, db: AsyncSession, **_) -> None:
         .where(PostProjection.id == event_data["post_id"])
         .values(like_count=PostProjection.like_count - 1)
     )
+    query_cache.invalidate_on_commit(db, ("post", event_data["post_id"]))
+
+
+async def on_likes_changed(
+    events: list[tuple[str, dict]], db: AsyncSession, **_
+) -> None:
+    """``on_like_added``/``on_like_removed`` for a run of like events, with
+    one statement per table and a net counter delta per post."""
+    deltas: Counter[int] = Counter()
+    toggles: dict[tuple[int, int], tuple[int, str]] = {}
+    notifications = []
+    for event_type, data in events:
+        key = (data["post_id"], data["user_id"])
+        count, _ = toggles.get(key, (0, event_type))
+        toggles[key] = (count + 1, event_type)
+        if event_type == LIKE_ADDED:
+            deltas[data["post_id"]] += 1
+            if data.get("post_author_id") and data["post_author_id"] != data["user_id"]:
+                notifications.append({
+                    "user_id": data["post_author_id"],
+                    "actor_id": data["user_id"],
+                    "type": "like",
+                    "reference_id": data["post_id"],
+                    "message": "liked your post",
+                })
+        else:
+            deltas[data["post_id"]] -= 1
+
+    # Likes and unlikes alternate per user, so a like toggled an even number
+    # of times ends where it started.
+    flipped = [(key, last) for key, (n, last) in toggles.items() if n % 2]
+    added = [key for key, last in flipped if last == LIKE_ADDED]
+    removed = [key for key, last in flipped if last != LIKE_ADDED]
+    if removed:
+        await db.execute(
+            delete(LikeProjection).where(
+                tuple_(LikeProjection.post_id, LikeProjection.user_id).in_(removed)
+            )
+        )
+    if added:
+        await db.execute(
+            insert(LikeProjection),
+            [{"post_id": post_id, "user_id": user_id} for post_id, user_id in added],
+        )
+    if notifications:
+        await db.execute(insert(NotificationProjection), notifications)
+    for post_id, delta in deltas.items():
+        if delta:
+            await db.execute(
+                update(PostProjection)
+                .where(PostProjection.id == post_id)
+                .values(like_count=PostProjection.like_count + delta)
+            )
+    query_cache.invalidate_on_commit(db, *(("post", post_id) for post_id in deltas))
 
 
 async def on_comment_created(event_data: dict, db: AsyncSession, **_) -> None:
@@ -177,6 +275,9 @@ async def on_comment_created(event_data: dict, db: AsyncSession, **_) -> None:
         )
         db.add(notification)
         await db.flush()
+    query_cache.invalidate_on_commit(
+        db, ("post", event_data["post_id"]), ("post_comments", event_data["post_id"])
+    )
 
 
 async def on_comment_deleted(event_data: dict, db: AsyncSession, **_) -> None:
@@ -188,6 +289,9 @@ async def on_comment_deleted(event_data: dict, db: AsyncSession, **_) -> None:
         .where(PostProjection.id == event_data["post_id"])
         .values(comment_count=PostProjection.comment_count - 1)
     )
+    query_cache.invalidate_on_commit(
+        db, ("post", event_data["post_id"]), ("post_comments", event_data["post_id"])
+    )
 
 
 async def on_user_followed(event_data: dict, db: AsyncSession, **_) -> None:
@@ -217,6 +321,9 @@ async def on_user_followed(event_data: dict, db: AsyncSession, **_) -> None:
     )
     db.add(notification)
     await db.flush()
+    query_cache.invalidate_on_commit(
+        db, ("user", event_data["follower_id"]), ("user", event_data["following_id"])
+    )
 
 
 async def on_user_unfollowed(event_data: dict, db: AsyncSession, **_) -> None:
@@ -236,6 +343,9 @@ async def on_user_unfollowed(event_data: dict, db: AsyncSession, **_) -> None:
         .where(UserProjection.id == event_data["following_id"])
         .values(follower_count=UserProjection.follower_count - 1)
     )
+    query_cache.invalidate_on_commit(
+        db, ("user", event_data["follower_id"]), ("user", event_data["following_id"])
+    )
 
 
 async def on_story_created(event_data: dict, db: AsyncSession, **_) -> None:
@@ -276,17 +386,67 @@ async def on_message_sent(event_data: dict, db: AsyncSession, **_) -> None:
     db.add(msg)
     await db.flush()
 
+    last = {
+        "last_message_id": msg.id,
+        "last_sender_id": msg.sender_id,
+        "last_content": msg.content,
+        "last_is_read": False,
+        "last_message_at": created_at,
+    }
+    await _update_conversation(db, msg.sender_id, msg.receiver_id, last, unread=0)
+    await _update_conversation(db, msg.receiver_id, msg.sender_id, last, unread=1)
+
+
+async def _update_conversation(
+    db: AsyncSession, user_id: int, other_user_id: int, last: dict, unread: int
+) -> None:
+    stmt = sqlite_insert(ConversationProjection).values(
+        user_id=user_id, other_user_id=other_user_id, unread_count=unread, **last
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "other_user_id"],
+        set_={**last, "unread_count": ConversationProjection.unread_count + unread},
+    )
+    await db.execute(stmt)
+
 
 async def on_messages_marked_read(event_data: dict, db: AsyncSession, **_) -> None:
+    reader_id, sender_id = event_data["user_id"], event_data["sender_id"]
     await db.execute(
         update(MessageProjection)
         .where(
-            MessageProjection.sender_id == event_data["sender_id"],
-            MessageProjection.receiver_id == event_data["user_id"],
+            MessageProjection.sender_id == sender_id,
+            MessageProjection.receiver_id == reader_id,
             MessageProjection.is_read == False,  # noqa: E712
         )
         .values(is_read=True)
     )
+    await db.execute(
+        update(ConversationProjection)
+        .where(
+            ConversationProjection.user_id == reader_id,
+            ConversationProjection.other_user_id == sender_id,
+        )
+        .values(unread_count=0)
+    )
+    # Both participants' rows show whether the last message was read.
+    await db.execute(
+        update(ConversationProjection)
+        .where(
+            or_(
+                and_(
+                    ConversationProjection.user_id == reader_id,
+                    ConversationProjection.other_user_id == sender_id,
+                ),
+                and_(
+                    ConversationProjection.user_id == sender_id,
+                    ConversationProjection.other_user_id == reader_id,
+                ),
+            ),
+            ConversationProjection.last_sender_id == sender_id,
+        )
+        .values(last_is_read=True)
+    )
 
 
 async def on_notification_read(event_data: dict, db: AsyncSession, **_) -> None:
@@ -0,0 +1,54 @@
+from sqlalchemy import event as sa_event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+PENDING_HASHTAGS_KEY = "pending_hashtag_ids"
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+class HashtagIdCache:
+    """Warm ``hashtag_projection`` name-to-id map for ``on_post_created``.
+
+    Ids resolved in a transaction are only cached once it commits, so a
+    rolled-back insert never leaves an id for a row that does not exist.
+    Hashtag rows are never deleted, so entries stay valid until a rebuild
+    replaces the table.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._ids: dict[str, int] = {}
+
+    def lookup(self, names: list[str]) -> dict[str, int]:
+        return {name: self._ids[name] for name in names if name in self._ids}
+
+    def stage(self, db: AsyncSession, ids: dict[str, int]) -> None:
+        db.info.setdefault(PENDING_HASHTAGS_KEY, {}).update(ids)
+
+    def add(self, ids: dict[str, int]) -> None:
+        self._ids.update(ids)
+        # Oldest first: drop the entries cached longest ago.
+        while len(self._ids) > self.max_entries:
+            del self._ids[next(iter(self._ids))]
+
+    def clear(self) -> None:
+        self._ids.clear()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+hashtag_cache = HashtagIdCache()
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _cache_committed(session: Session) -> None:
+    ids = session.info.pop(PENDING_HASHTAGS_KEY, None)
+    if ids:
+        hashtag_cache.add(ids)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_uncommitted(session: Session) -> None:
+    session.info.pop(PENDING_HASHTAGS_KEY, None)
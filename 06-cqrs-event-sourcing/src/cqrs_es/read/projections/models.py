@@ -1,6 +1,15 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from cqrs_es.shared.database import Base
@@ -88,6 +97,26 @@ class MessageProjection(TimestampMixin, Base):
     is_read: Mapped[bool] = mapped_column(Boolean, default=False)
 
 
+class ConversationProjection(Base):
+    """One participant's view of a conversation: a row per user and partner."""
+
+    __tablename__ = "conversation_projection"
+    # Serves the inbox: a user's conversations, most recently active first.
+    __table_args__ = (
+        Index("ix_conversation_inbox", "user_id", "last_message_at", "other_user_id"),
+    )
+
+    user_id: Mapped[int] = mapped_column(primary_key=True)
+    other_user_id: Mapped[int] = mapped_column(primary_key=True)
+    last_message_id: Mapped[int] = mapped_column()
+    last_sender_id: Mapped[int] = mapped_column()
+    last_content: Mapped[str] = mapped_column(Text)
+    last_is_read: Mapped[bool] = mapped_column(Boolean, default=False)
+    last_message_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    # Messages from ``other_user_id`` that ``user_id`` has not read.
+    unread_count: Mapped[int] = mapped_column(Integer, default=0)
+
+
 class NotificationProjection(TimestampMixin, Base):
     __tablename__ = "notification_projection"
 
@@ -78,6 +78,8 @@ class GetStoryFeed:
 @dataclass
 class GetConversations:
     user_id: int
+    limit: int
+    offset: int
     db: AsyncSession
 
 
@@ -0,0 +1,305 @@
+"""Rebuild the projection tables from the event store.
+
+    python -m cqrs_es.rebuild [--batch-size 1000]
+
+Events are streamed in id order and applied through the regular ``on_*``
+handlers into shadow copies of the projection tables, kept in a scratch
+database attached as ``shadow``. Rows the handlers add one at a time are
+written with one multi-row insert per table instead. The live tables are
+replaced from the shadow copies in a single transaction at the end, so
+readers see either the old or the rebuilt read model, never a mix.
+
+Events moved to the archive by ``cqrs_es.archive`` are merged back in by
+position, so the rebuild still replays the full history.
+
+Run it with the projection runner stopped: the runner keeps its position in
+memory and would re-apply events already included in the rebuild.
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Table, func, insert, inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from sqlalchemy.sql.util import find_tables
+
+from cqrs_es.read.projections import models
+from cqrs_es.read.projections.hashtag_cache import hashtag_cache
+from cqrs_es.shared import event_bus
+from cqrs_es.shared.database import Base
+from cqrs_es.shared.event_archive import EventArchive, event_archive
+from cqrs_es.shared.event_codec import decode_event
+from cqrs_es.shared.event_store import EventStoreModel, RecordedEvent
+from cqrs_es.shared.query_cache import query_cache
+
+SHADOW = "shadow"
+
+Progress = Callable[[int, int, float], None]
+
+
+@dataclass
+class RebuildStats:
+    events: int
+    position: int
+    seconds: float
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.seconds if self.seconds else 0.0
+
+
+def projection_tables() -> list[Table]:
+    """Projection tables in dependency order."""
+    owned = {
+        mapper.local_table
+        for mapper in Base.registry.mappers
+        if mapper.class_.__module__ == models.__name__
+    }
+    return [t for t in Base.metadata.sorted_tables if t in owned]
+
+
+class BulkWriter:
+    """Session stand-in that batches the rows handlers ``add`` per table.
+
+    Handlers add projection rows one at a time and flush after each. Here
+    ``add`` only buffers the row and ``flush`` does nothing. A table's
+    buffered rows are written with one multi-row insert right before a
+    statement reads or writes that table, and all of them before a commit
+    or a raw SQL statement. Handlers therefore still see their own writes.
+    Only the session methods defined here are available; anything else
+    raises AttributeError instead of reading past the buffer.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self._pending: dict[Table, list[dict[str, Any]]] = {}
+
+    @property
+    def info(self) -> dict[Any, Any]:
+        return self.db.info
+
+    def add(self, instance: object) -> None:
+        state = inspect(instance)
+        row = {
+            attr.columns[0].key: state.dict[attr.key]
+            for attr in state.mapper.column_attrs
+            if attr.key in state.dict
+        }
+        self._pending.setdefault(state.mapper.local_table, []).append(row)
+
+    async def flush(self) -> None:
+        pass
+
+    async def _write(self, names: set[str] | None = None) -> None:
+        for table in [t for t in self._pending if names is None or t.name in names]:
+            rows = self._pending.pop(table)
+            # One executemany per run of rows that set the same columns.
+            start = 0
+            for end in range(1, len(rows) + 1):
+                if end == len(rows) or rows[end].keys() != rows[start].keys():
+                    await self.db.execute(insert(table), rows[start:end])
+                    start = end
+
+    async def _write_for(self, statement: Any) -> None:
+        if self._pending:
+            # By name: ORM statements refer to annotated copies of the tables.
+            names = {t.name for t in find_tables(statement, include_crud=True)}
+            await self._write(names or None)
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        await self._write_for(statement)
+        return await self.db.execute(statement, *args, **kwargs)
+
+    async def scalar(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        await self._write_for(statement)
+        return await self.db.scalar(statement, *args, **kwargs)
+
+    async def scalars(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        await self._write_for(statement)
+        return await self.db.scalars(statement, *args, **kwargs)
+
+    async def get(self, entity: Any, ident: Any, **kwargs: Any) -> Any:
+        await self._write({inspect(entity).local_table.name})
+        return await self.db.get(entity, ident, **kwargs)
+
+    async def commit(self) -> None:
+        await self._write()
+        await self.db.commit()
+
+    async def rollback(self) -> None:
+        self._pending.clear()
+        await self.db.rollback()
+
+
+async def _apply(db: BulkWriter, events: list[tuple[int, str, dict]]) -> int:
+    await event_bus.dispatch_many(
+        [(event_type, event_data) for _, event_type, event_data in events], db=db
+    )
+    return events[-1][0] if events else 0
+
+
+def _decoded(rows) -> list[tuple[int, str, dict]]:
+    return [(row[0], row[1], decode_event(row[2])) for row in rows]
+
+
+async def _with_archived(
+    partitions: AsyncIterator, archived: Iterator[RecordedEvent]
+) -> AsyncIterator[list[tuple[int, str, dict]]]:
+    """Interleave archived events into the table's batches by position."""
+    pending = next(archived, None)
+    async for rows in partitions:
+        batch = []
+        for position, event_type, event_data in rows:
+            while pending is not None and pending.position <= position:
+                # Equal positions: the archiver stopped before deleting the
+                # row, and the table copy wins.
+                if pending.position < position:
+                    batch.append(
+                        (pending.position, pending.event_type, pending.event_data)
+                    )
+                pending = next(archived, None)
+            batch.append((position, event_type, decode_event(event_data)))
+        yield batch
+    rest = [(e.position, e.event_type, e.event_data) for e in archived]
+    if pending is not None:
+        rest.insert(0, (pending.position, pending.event_type, pending.event_data))
+    if rest:
+        yield rest
+
+
+async def _swap(
+    db: BulkWriter, tables: list[Table], position: int, checkpoint: str
+) -> tuple[int, int]:
+    """Replace the live tables with the shadow copies in one transaction.
+
+    Deleting from the live tables first takes SQLite's write lock, so no
+    event can be appended between catching up on the tail and the copy.
+    """
+    for table in reversed(tables):
+        await db.execute(text(f"DELETE FROM main.{table.name}"))
+
+    tail = await db.execute(
+        text(
+            "SELECT id, event_type, event_data FROM main.event_store "
+            "WHERE id > :position ORDER BY id"
+        ),
+        {"position": position},
+    )
+    rows = tail.all()
+    if rows:
+        position = await _apply(db, _decoded(rows))
+
+    for table in tables:
+        columns = ", ".join(c.name for c in table.columns)
+        await db.execute(
+            text(
+                f"INSERT INTO main.{table.name} ({columns}) "
+                f"SELECT {columns} FROM {SHADOW}.{table.name}"
+            )
+        )
+    await db.execute(
+        text(
+            "INSERT INTO main.projection_checkpoint (name, position) "
+            "VALUES (:name, :position) "
+            "ON CONFLICT (name) DO UPDATE SET position = excluded.position"
+        ),
+        {"name": checkpoint, "position": position},
+    )
+    await db.commit()
+    return len(rows), position
+
+
+async def _open_shadow(conn: AsyncConnection, path: str, tables: list[Table]) -> None:
+    await conn.execute(text(f"ATTACH DATABASE :path AS {SHADOW}"), {"path": path})
+    # Scratch data: a crash just means starting the rebuild over.
+    await conn.execute(text(f"PRAGMA {SHADOW}.journal_mode = OFF"))
+    await conn.execute(text(f"PRAGMA {SHADOW}.synchronous = OFF"))
+    await conn.execution_options(schema_translate_map={None: SHADOW})
+    await conn.run_sync(Base.metadata.create_all, tables=tables)
+    await conn.commit()
+
+
+async def rebuild_projections(
+    engine: AsyncEngine,
+    batch_size: int = 1000,
+    progress: Progress | None = None,
+    checkpoint: str = "read_model",
+    archive: EventArchive = event_archive,
+) -> RebuildStats:
+    tables = projection_tables()
+    # Cached hashtag ids belong to the live tables, not the shadow copies.
+    hashtag_cache.clear()
+    fd, shadow_path = tempfile.mkstemp(prefix="cqrs_es_rebuild_", suffix=".db")
+    os.close(fd)
+    started = time.perf_counter()
+    applied = 0
+    position = 0
+    try:
+        async with engine.connect() as writer:
+            await _open_shadow(writer, shadow_path, tables)
+            async with AsyncSession(bind=writer) as session:
+                db = BulkWriter(session)
+                async with engine.connect() as reader:
+                    target = (
+                        await reader.execute(select(func.max(EventStoreModel.id)))
+                    ).scalar_one_or_none() or 0
+                    result = await reader.stream(
+                        select(
+                            EventStoreModel.id,
+                            EventStoreModel.event_type,
+                            EventStoreModel.event_data,
+                        )
+                        .where(EventStoreModel.id <= target)
+                        .order_by(EventStoreModel.id)
+                        .execution_options(yield_per=batch_size)
+                    )
+                    async for events in _with_archived(
+                        result.partitions(batch_size), archive.iter_events()
+                    ):
+                        position = await _apply(db, events)
+                        await db.commit()
+                        applied += len(events)
+                        if progress:
+                            progress(applied, target, time.perf_counter() - started)
+
+                tail, position = await _swap(db, tables, position, checkpoint)
+                applied += tail
+                # Only this process's caches; app workers keep theirs until
+                # they restart.
+                query_cache.clear()
+                hashtag_cache.clear()
+            await writer.execute(text(f"DETACH DATABASE {SHADOW}"))
+    finally:
+        os.remove(shadow_path)
+    return RebuildStats(applied, position, time.perf_counter() - started)
+
+
+def _print_progress(applied: int, target: int, elapsed: float) -> None:
+    rate = applied / elapsed if elapsed else 0.0
+    print(f"{applied}/{target} events, {rate:,.0f} events/s", flush=True)
+
+
+async def main(batch_size: int) -> None:
+    from cqrs_es.main import _register_event_subscribers
+    from cqrs_es.shared.database import engine
+
+    _register_event_subscribers()
+    stats = await rebuild_projections(engine, batch_size, _print_progress)
+    await engine.dispose()
+    print(
+        f"Rebuilt projections from {stats.events} events up to position "
+        f"{stats.position} in {stats.seconds:.2f}s "
+        f"({stats.events_per_second:,.0f} events/s)"
+    )
+    print("Restart the app workers to drop results cached before the rebuild.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    asyncio.run(main(parser.parse_args().batch_size))
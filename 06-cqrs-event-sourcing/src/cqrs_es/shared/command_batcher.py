@@ -0,0 +1,117 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cqrs_es.shared.event_store import LAST_POSITION_KEY, ConcurrencyError
+
+BatchHandler = Callable[[list[Any], AsyncSession], Awaitable[list[Any]]]
+
+
+@dataclass(frozen=True)
+class BatchPolicy:
+    # Runs the commands in one session and returns one result per command;
+    # an exception in the list is raised to that caller only.
+    handler: BatchHandler
+    # Commands with the same key share a batch, e.g. ``lambda c: c.post_id``.
+    key: Callable[[Any], Hashable]
+    # Longest a command waits behind a batch in flight for its key.
+    window: float = 0.005
+    max_size: int = 100
+
+
+@dataclass
+class _Batch:
+    items: list[tuple[Any, asyncio.Future]] = field(default_factory=list)
+    timer: asyncio.Handle | None = None
+
+
+class CommandBatcher:
+    """Collects commands per key and runs them as one transaction.
+
+    A command for a key with nothing in flight runs right away, together
+    with any others submitted in the same loop iteration, so an idle key
+    adds no latency. Commands arriving while a batch for their key runs
+    collect behind it and run once it finishes, or after ``window``
+    seconds.
+
+    The batch gets a session of its own on the first command's engine and
+    commits it before any caller sees a result. Each caller's session is
+    left untouched except for the event position, so read-your-writes
+    waits for the batch.
+    """
+
+    def __init__(self, policy: BatchPolicy, retries: int = 3) -> None:
+        self.policy = policy
+        self.retries = retries
+        self.batches = 0
+        self._pending: dict[Hashable, _Batch] = {}
+        self._running: dict[Hashable, int] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, command: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        key = self.policy.key(command)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _Batch()
+            if key in self._running:
+                batch.timer = loop.call_later(self.policy.window, self._flush, key)
+            else:
+                batch.timer = loop.call_soon(self._flush, key)
+        future = loop.create_future()
+        batch.items.append((command, future))
+        if len(batch.items) >= self.policy.max_size:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: Hashable) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        self._running[key] = self._running.get(key, 0) + 1
+        task = asyncio.get_running_loop().create_task(self._run(batch.items))
+        self._tasks.add(task)
+        task.add_done_callback(lambda done: self._finish(key, done))
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        self._running[key] -= 1
+        if not self._running[key]:
+            del self._running[key]
+            # Commands that queued behind the batch need not wait any longer.
+            self._flush(key)
+
+    async def _run(self, items: list[tuple[Any, asyncio.Future]]) -> None:
+        commands = [command for command, _ in items]
+        try:
+            async with AsyncSession(commands[0].db.bind, expire_on_commit=False) as db:
+                for attempt in range(self.retries + 1):
+                    try:
+                        results = await self.policy.handler(commands, db)
+                        await db.commit()
+                        break
+                    except ConcurrencyError:
+                        if attempt == self.retries:
+                            raise
+                        await db.rollback()
+                position = db.info.get(LAST_POSITION_KEY)
+        except Exception as exc:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        self.batches += 1
+        for (command, future), result in zip(items, results):
+            if position is not None:
+                command.db.info[LAST_POSITION_KEY] = position
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
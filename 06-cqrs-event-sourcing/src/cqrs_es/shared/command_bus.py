@@ -1,19 +1,50 @@
 from collections.abc import Callable
 from typing import Any
 
+from cqrs_es.shared.command_batcher import BatchPolicy, CommandBatcher
+from cqrs_es.shared.event_store import ConcurrencyError
+
+# How often a command is re-run after losing an optimistic concurrency race.
+MAX_CONCURRENCY_RETRIES = 3
+
 _handlers: dict[type, Callable] = {}
+_batchers: dict[type, CommandBatcher] = {}
 
 
-def register_command_handler(command_type: type, handler: Callable) -> None:
+def register_command_handler(
+    command_type: type, handler: Callable, batch: BatchPolicy | None = None
+) -> None:
+    """Register ``handler``; with ``batch``, concurrent commands of this type
+    with the same key run together through ``batch.handler`` instead."""
     _handlers[command_type] = handler
+    _batchers.pop(command_type, None)
+    if batch is not None:
+        _batchers[command_type] = CommandBatcher(batch, MAX_CONCURRENCY_RETRIES)
+
+
+def get_batcher(command_type: type) -> CommandBatcher | None:
+    return _batchers.get(command_type)
 
 
 async def dispatch_command(command: Any) -> Any:
     handler = _handlers.get(type(command))
     if not handler:
         raise ValueError(f"No handler registered for {type(command).__name__}")
-    return await handler(command)
+    batcher = _batchers.get(type(command))
+    if batcher is not None:
+        return await batcher.submit(command)
+    for attempt in range(MAX_CONCURRENCY_RETRIES + 1):
+        try:
+            return await handler(command)
+        except ConcurrencyError:
+            db = getattr(command, "db", None)
+            if db is None or attempt == MAX_CONCURRENCY_RETRIES:
+                raise
+            # Start over from a clean transaction so the handler re-reads
+            # the stream and its claims.
+            await db.rollback()
 
 
 def clear_handlers() -> None:
     _handlers.clear()
+    _batchers.clear()
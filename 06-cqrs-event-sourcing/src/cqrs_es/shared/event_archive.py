@@ -0,0 +1,185 @@
+import heapq
+import mmap
+import os
+import struct
+import zlib
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from pathlib import Path
+
+from cqrs_es.shared.event_codec import decode_event
+from cqrs_es.shared.event_store import EventStoreModel, RecordedEvent
+
+ARCHIVE_DIR = os.environ.get("CQRS_EVENT_ARCHIVE_DIR", "event_archive")
+# Events older than this, and covered by a snapshot, leave ``event_store``.
+ARCHIVE_HORIZON_DAYS = int(os.environ.get("CQRS_ARCHIVE_HORIZON_DAYS", "365"))
+
+# Events per compressed block; a read decompresses one block at a time.
+BLOCK_EVENTS = 256
+
+# Index entry per block: first position, last position, offset, length.
+_BLOCK = struct.Struct("<qqQI")
+# Record header: position, version, then the byte lengths of aggregate_type,
+# aggregate_id, event_type, created_at, the payload kind and the payload.
+_RECORD = struct.Struct("<qqHHHHBI")
+_TEXT, _BYTES = 0, 1
+
+
+def _encode_record(row: EventStoreModel) -> bytes:
+    aggregate_type = row.aggregate_type.encode()
+    aggregate_id = row.aggregate_id.encode()
+    event_type = row.event_type.encode()
+    created_at = row.created_at.isoformat().encode()
+    if isinstance(row.event_data, str):
+        kind, payload = _TEXT, row.event_data.encode()
+    else:
+        kind, payload = _BYTES, bytes(row.event_data)
+    return b"".join((
+        _RECORD.pack(
+            row.id, row.version, len(aggregate_type), len(aggregate_id),
+            len(event_type), len(created_at), kind, len(payload),
+        ),
+        aggregate_type, aggregate_id, event_type, created_at, payload,
+    ))
+
+
+def _decode_block(block: bytes) -> Iterator[RecordedEvent]:
+    pos = 0
+    while pos < len(block):
+        (
+            position, version, type_len, id_len, event_len, created_len, kind,
+            payload_len,
+        ) = _RECORD.unpack_from(block, pos)
+        pos += _RECORD.size
+        aggregate_type = block[pos:pos + type_len].decode()
+        pos += type_len
+        aggregate_id = block[pos:pos + id_len].decode()
+        pos += id_len
+        event_type = block[pos:pos + event_len].decode()
+        pos += event_len
+        created_at = datetime.fromisoformat(block[pos:pos + created_len].decode())
+        pos += created_len
+        raw = block[pos:pos + payload_len]
+        pos += payload_len
+        yield RecordedEvent(
+            position, aggregate_type, aggregate_id, event_type,
+            decode_event(raw.decode() if kind == _TEXT else raw),
+            version, created_at,
+        )
+
+
+class Segment:
+    """One immutable archive segment, memory-mapped for reading.
+
+    ``<n>.seg`` holds zlib-compressed blocks of events in position order;
+    ``<n>.idx`` holds one fixed-size entry per block, so finding the block
+    for a position is a binary search over the index.
+    """
+
+    def __init__(self, index_path: Path) -> None:
+        self.name = index_path.stem
+        with open(index_path, "rb") as f:
+            index = f.read()
+        self._blocks = [
+            _BLOCK.unpack_from(index, offset)
+            for offset in range(0, len(index), _BLOCK.size)
+        ]
+        self._last_positions = [block[1] for block in self._blocks]
+        with open(index_path.with_suffix(".seg"), "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def first_position(self) -> int:
+        return self._blocks[0][0]
+
+    @property
+    def last_position(self) -> int:
+        return self._blocks[-1][1]
+
+    def iter_events(self, after: int = 0) -> Iterator[RecordedEvent]:
+        for _, _, offset, length in self._blocks[
+            bisect_right(self._last_positions, after):
+        ]:
+            for event in _decode_block(
+                zlib.decompress(self._data[offset:offset + length])
+            ):
+                if event.position > after:
+                    yield event
+
+    def close(self) -> None:
+        self._data.close()
+
+
+class EventArchive:
+    """Append-only directory of segments holding events moved out of
+    ``event_store``.
+
+    A segment becomes visible once its index file is renamed into place,
+    after the data file is complete, so readers never see a partial one.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike = ARCHIVE_DIR,
+        block_events: int = BLOCK_EVENTS,
+    ) -> None:
+        self.directory = Path(directory)
+        self.block_events = block_events
+        self._segments: dict[str, Segment] = {}
+
+    def segments(self) -> list[Segment]:
+        """Segments in the order they were written, picking up new ones."""
+        if self.directory.is_dir():
+            for index_path in sorted(self.directory.glob("*.idx")):
+                if index_path.stem not in self._segments:
+                    self._segments[index_path.stem] = Segment(index_path)
+        return [self._segments[name] for name in sorted(self._segments)]
+
+    def write_segment(self, rows: Sequence[EventStoreModel]) -> Segment:
+        """Write ``rows``, sorted by id, as a new segment."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        existing = sorted(self.directory.glob("*.idx"))
+        name = f"{int(existing[-1].stem) + 1 if existing else 1:08d}"
+        data_path = self.directory / f"{name}.seg"
+        index_path = self.directory / f"{name}.idx"
+        index = bytearray()
+        with open(data_path, "wb") as f:
+            for start in range(0, len(rows), self.block_events):
+                block = rows[start:start + self.block_events]
+                compressed = zlib.compress(
+                    b"".join(_encode_record(row) for row in block)
+                )
+                index += _BLOCK.pack(
+                    block[0].id, block[-1].id, f.tell(), len(compressed)
+                )
+                f.write(compressed)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path = index_path.with_suffix(".idx.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(index)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, index_path)
+        segment = self._segments[name] = Segment(index_path)
+        return segment
+
+    def iter_events(self, after: int = 0) -> Iterator[RecordedEvent]:
+        """Archived events after ``after`` in global order.
+
+        Segments may overlap in position, since an old event is archived
+        only once a snapshot covers it, so they are merged.
+        """
+        return heapq.merge(
+            *(segment.iter_events(after) for segment in self.segments()),
+            key=lambda event: event.position,
+        )
+
+    def close(self) -> None:
+        for segment in self._segments.values():
+            segment.close()
+        self._segments.clear()
+
+
+event_archive = EventArchive()
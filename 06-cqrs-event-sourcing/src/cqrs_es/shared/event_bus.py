@@ -2,6 +2,12 @@ from collections.abc import Callable
 from typing import Any
 
 _subscribers: dict[str, list[Callable]] = {}
+# Handlers taking a run of consecutive events at once, with the per-event
+# subscribers each one stands in for.
+_batch_subscribers: dict[str, tuple[Callable, tuple[Callable, ...]]] = {}
+# When deferred, ``publish`` leaves delivery to the projection runner, which
+# calls ``dispatch`` for each stored event after the command has committed.
+_deferred = False
 
 
 def subscribe(event_type: str, handler: Callable) -> None:
@@ -10,11 +16,79 @@ def subscribe(event_type: str, handler: Callable) -> None:
     _subscribers[event_type].append(handler)
 
 
+def subscribe_batch(
+    event_types: tuple[str, ...], handler: Callable, replaces: tuple[Callable, ...]
+) -> None:
+    """Add a fast path for ``dispatch_many``.
+
+    ``handler(events, **kwargs)`` gets runs of ``(event_type, event_data)``
+    pairs and must have the same effect as the per-event subscribers it
+    ``replaces`` applied in order. It is refused if ``event_types`` have
+    other subscribers, and skipped for runs of a type subscribed to later,
+    which then go through the per-event path.
+    """
+    for event_type in event_types:
+        others = set(_subscribers.get(event_type, [])) - set(replaces)
+        if others:
+            names = ", ".join(sorted(h.__qualname__ for h in others))
+            raise ValueError(
+                f"{handler.__qualname__} does not replace {event_type} "
+                f"subscribers {names}"
+            )
+    for event_type in event_types:
+        _batch_subscribers[event_type] = (handler, replaces)
+
+
+def defer(enabled: bool = True) -> None:
+    global _deferred
+    _deferred = enabled
+
+
 async def publish(event_type: str, event_data: dict, **kwargs: Any) -> None:
+    if _deferred:
+        return
+    await dispatch(event_type, event_data, **kwargs)
+
+
+async def publish_many(events: list[tuple[str, dict]], **kwargs: Any) -> None:
+    if _deferred:
+        return
+    await dispatch_many(events, **kwargs)
+
+
+async def dispatch(event_type: str, event_data: dict, **kwargs: Any) -> None:
     handlers = _subscribers.get(event_type, [])
     for handler in handlers:
         await handler(event_data, **kwargs)
 
 
+def _batch_handler(event_type: str) -> Callable | None:
+    entry = _batch_subscribers.get(event_type)
+    if entry is None:
+        return None
+    handler, replaces = entry
+    if any(h not in replaces for h in _subscribers.get(event_type, [])):
+        return None
+    return handler
+
+
+async def dispatch_many(events: list[tuple[str, dict]], **kwargs: Any) -> None:
+    """Dispatch events in order, handing each run of consecutive events with
+    the same batch subscriber to it in one call."""
+    i = 0
+    while i < len(events):
+        batch_handler = _batch_handler(events[i][0])
+        if batch_handler is None:
+            await dispatch(*events[i], **kwargs)
+            i += 1
+            continue
+        j = i + 1
+        while j < len(events) and _batch_handler(events[j][0]) is batch_handler:
+            j += 1
+        await batch_handler(events[i:j], **kwargs)
+        i = j
+
+
 def clear_subscribers() -> None:
     _subscribers.clear()
+    _batch_subscribers.clear()
@@ -0,0 +1,186 @@
+import json
+import struct
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+# First byte of payloads written by ``BinaryCodec``. Legacy and fallback
+# payloads are JSON objects, so they start with ``{``.
+BINARY_FORMAT = 1
+JSON_FORMAT = ord("{")
+
+_NONE, _FALSE, _TRUE, _INT32, _INT64, _STR8, _STR32, _FLOAT = range(8)
+
+_I32 = struct.Struct("<i")
+_I64 = struct.Struct("<q")
+_U32 = struct.Struct("<I")
+_F64 = struct.Struct("<d")
+
+
+@dataclass(frozen=True)
+class EventSchema:
+    """Positional layout of one event type's payload.
+
+    ``id`` is stored with every event. Never reuse or renumber an id; to
+    change a layout, add a schema with a new id for the same event type.
+    """
+
+    id: int
+    event_type: str
+    fields: tuple[str, ...]
+
+
+class EventCodec(Protocol):
+    def encode(self, event_type: str, data: dict) -> str | bytes: ...
+
+    def decode(self, raw: str | bytes) -> dict: ...
+
+
+class JsonCodec:
+    def encode(self, event_type: str, data: dict) -> str:
+        return json.dumps(data)
+
+    def decode(self, raw: str | bytes) -> dict:
+        return json.loads(raw)
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buf: bytes, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class BinaryCodec:
+    """Schema id followed by the field values, without the keys.
+
+    Values must be ``None``, bool, int, float or str. Events without a
+    schema, or whose keys do not match it exactly (e.g. partial updates),
+    fall back to JSON.
+    """
+
+    def __init__(self, schemas: list[EventSchema]) -> None:
+        self._by_id = {s.id: s for s in schemas}
+        self._by_type: dict[str, EventSchema] = {}
+        for schema in sorted(schemas, key=lambda s: s.id):
+            self._by_type[schema.event_type] = schema
+        self._json = JsonCodec()
+
+    def encode(self, event_type: str, data: dict) -> str | bytes:
+        schema = self._by_type.get(event_type)
+        if schema is None or len(data) != len(schema.fields):
+            return self._json.encode(event_type, data)
+        out = bytearray((BINARY_FORMAT,))
+        _write_varint(out, schema.id)
+        for name in schema.fields:
+            if name not in data:
+                return self._json.encode(event_type, data)
+            value = data[name]
+            if value is None:
+                out.append(_NONE)
+            elif value is True:
+                out.append(_TRUE)
+            elif value is False:
+                out.append(_FALSE)
+            elif isinstance(value, int):
+                if -(1 << 31) <= value < (1 << 31):
+                    out.append(_INT32)
+                    out += _I32.pack(value)
+                elif -(1 << 63) <= value < (1 << 63):
+                    out.append(_INT64)
+                    out += _I64.pack(value)
+                else:
+                    return self._json.encode(event_type, data)
+            elif isinstance(value, str):
+                encoded = value.encode()
+                if len(encoded) < 256:
+                    out.append(_STR8)
+                    out.append(len(encoded))
+                else:
+                    out.append(_STR32)
+                    out += _U32.pack(len(encoded))
+                out += encoded
+            elif isinstance(value, float):
+                out.append(_FLOAT)
+                out += _F64.pack(value)
+            else:
+                return self._json.encode(event_type, data)
+        return bytes(out)
+
+    def decode(self, raw: str | bytes) -> dict:
+        if isinstance(raw, str):
+            return self._json.decode(raw)
+        schema_id, pos = _read_varint(raw, 1)
+        data: dict[str, Any] = {}
+        for name in self._by_id[schema_id].fields:
+            tag = raw[pos]
+            pos += 1
+            if tag == _INT32:
+                data[name] = _I32.unpack_from(raw, pos)[0]
+                pos += 4
+            elif tag == _STR8:
+                end = pos + 1 + raw[pos]
+                data[name] = raw[pos + 1:end].decode()
+                pos = end
+            elif tag == _INT64:
+                data[name] = _I64.unpack_from(raw, pos)[0]
+                pos += 8
+            elif tag == _STR32:
+                end = pos + 4 + _U32.unpack_from(raw, pos)[0]
+                data[name] = raw[pos + 4:end].decode()
+                pos = end
+            elif tag == _FLOAT:
+                data[name] = _F64.unpack_from(raw, pos)[0]
+                pos += 8
+            else:
+                data[name] = (None, False, True)[tag]
+        return data
+
+
+_codec: EventCodec | None = None
+_binary: BinaryCodec | None = None
+
+
+def _binary_codec() -> BinaryCodec:
+    global _binary
+    if _binary is None:
+        from cqrs_es.write.events.events import EVENT_SCHEMAS
+
+        _binary = BinaryCodec(EVENT_SCHEMAS)
+    return _binary
+
+
+def get_codec() -> EventCodec:
+    return _codec if _codec is not None else _binary_codec()
+
+
+def set_codec(codec: EventCodec | None) -> None:
+    """Codec used for new events; ``None`` restores the binary default."""
+    global _codec
+    _codec = codec
+
+
+def encode_event(event_type: str, data: dict) -> bytes:
+    """Payload bytes to store; text from a codec is stored as UTF-8."""
+    raw = get_codec().encode(event_type, data)
+    return raw.encode() if isinstance(raw, str) else raw
+
+
+def decode_event(raw: str | bytes) -> dict:
+    """Decode a stored payload, whichever codec wrote it; its first byte
+    tells JSON and binary payloads apart."""
+    if isinstance(raw, str) or raw[0] == JSON_FORMAT:
+        return json.loads(raw)
+    if raw[0] == BINARY_FORMAT:
+        return _binary_codec().decode(raw)
+    return get_codec().decode(raw)
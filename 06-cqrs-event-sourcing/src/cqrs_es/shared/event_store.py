@@ -1,56 +1,246 @@
 import json
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Integer, String, Text, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+    cast,
+    func,
+    select,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column
 
 from cqrs_es.shared.database import Base
+from cqrs_es.shared.event_codec import decode_event, encode_event
+
+# Take a snapshot of an aggregate every N events, so loading it replays at
+# most N - 1 events on top of the snapshot.
+SNAPSHOT_INTERVAL = 50
+
+# Session.info key holding the global id of the last event appended in it.
+LAST_POSITION_KEY = "last_position"
+# Session.info key collecting the events appended in the open transaction.
+APPENDED_EVENTS_KEY = "appended_events"
+
+
+@dataclass(frozen=True)
+class RecordedEvent:
+    position: int
+    aggregate_type: str
+    aggregate_id: str
+    event_type: str
+    event_data: dict
+    version: int
+    created_at: datetime
+
+
+class ConcurrencyError(Exception):
+    """Another command appended to the stream since it was read."""
+
+    def __init__(self, aggregate_type: str, aggregate_id: str, expected_version: int):
+        super().__init__(
+            f"{aggregate_type} {aggregate_id} is no longer at version {expected_version}"
+        )
+        self.aggregate_type = aggregate_type
+        self.aggregate_id = aggregate_id
+        self.expected_version = expected_version
 
 
 class EventStoreModel(Base):
     __tablename__ = "event_store"
+    # Also serves per-stream reads ordered by version.
+    __table_args__ = (
+        UniqueConstraint(
+            "aggregate_type", "aggregate_id", "version", name="uq_event_stream_version"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     aggregate_type: Mapped[str] = mapped_column(String(100))
-    aggregate_id: Mapped[str] = mapped_column(String(100), index=True)
+    aggregate_id: Mapped[str] = mapped_column(String(100))
     event_type: Mapped[str] = mapped_column(String(100))
-    event_data: Mapped[str] = mapped_column(Text)
+    # JSON or binary-codec bytes, told apart by the first byte; always read
+    # through ``decode_event``.
+    event_data: Mapped[bytes] = mapped_column(LargeBinary)
     version: Mapped[int] = mapped_column(Integer)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
 
 
+async def upgrade_event_data(conn: AsyncConnection) -> None:
+    """Turn JSON text payloads into blobs.
+
+    ``event_data`` used to be a Text column. SQLite keeps each value's own
+    storage class, so rows written back then are still text. Converting
+    them in place leaves only blobs, which is what a database with a
+    strict binary type expects when the store moves off SQLite. Running
+    this again is a no-op.
+    """
+    await conn.execute(
+        update(EventStoreModel)
+        .where(func.typeof(EventStoreModel.event_data) == "text")
+        .values(event_data=cast(EventStoreModel.event_data, LargeBinary))
+    )
+
+
+class StreamHeadModel(Base):
+    """Current version of each stream, bumped on every append."""
+
+    __tablename__ = "event_stream"
+
+    aggregate_type: Mapped[str] = mapped_column(String(100), primary_key=True)
+    aggregate_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer)
+
+
+class SnapshotModel(Base):
+    __tablename__ = "aggregate_snapshot"
+    __table_args__ = (
+        UniqueConstraint("aggregate_type", "aggregate_id", name="uq_snapshot_stream"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    aggregate_type: Mapped[str] = mapped_column(String(100))
+    aggregate_id: Mapped[str] = mapped_column(String(100))
+    version: Mapped[int] = mapped_column(Integer)
+    state: Mapped[str] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+
+
+def _stream_max_version(aggregate_type: str, aggregate_id: str):
+    return select(func.coalesce(func.max(EventStoreModel.version), 0)).where(
+        EventStoreModel.aggregate_type == aggregate_type,
+        EventStoreModel.aggregate_id == aggregate_id,
+    )
+
+
+async def _bump_stream_head(
+    db: AsyncSession,
+    aggregate_type: str,
+    aggregate_id: str,
+    expected_version: int | None,
+    count: int = 1,
+) -> int:
+    """Advance the head by ``count`` and return the new head version."""
+    if expected_version != 0:
+        stmt = update(StreamHeadModel).where(
+            StreamHeadModel.aggregate_type == aggregate_type,
+            StreamHeadModel.aggregate_id == aggregate_id,
+        )
+        if expected_version is not None:
+            stmt = stmt.where(StreamHeadModel.version == expected_version)
+        result = await db.execute(
+            stmt.values(version=StreamHeadModel.version + count)
+            .returning(StreamHeadModel.version)
+        )
+        version = result.scalar_one_or_none()
+        if version is not None:
+            return version
+
+    # No head yet: a new stream, or one written before heads existed, which
+    # is seeded from its highest stored version. A stale expectation is
+    # rejected before the insert, so it leaves no head behind.
+    stored = _stream_max_version(aggregate_type, aggregate_id)
+    if expected_version is not None:
+        result = await db.execute(stored)
+        if result.scalar_one() != expected_version:
+            raise ConcurrencyError(aggregate_type, aggregate_id, expected_version)
+    seed = stored.scalar_subquery() + count
+    result = await db.execute(
+        sqlite_insert(StreamHeadModel)
+        .values(aggregate_type=aggregate_type, aggregate_id=aggregate_id, version=seed)
+        .on_conflict_do_nothing()
+        .returning(StreamHeadModel.version)
+    )
+    version = result.scalar_one_or_none()
+    if version is None or (
+        expected_version is not None and version != expected_version + count
+    ):
+        raise ConcurrencyError(aggregate_type, aggregate_id, expected_version)
+    return version
+
+
 async def append_event(
     db: AsyncSession,
     aggregate_type: str,
     aggregate_id: str,
     event_type: str,
     event_data: dict,
-    version: int,
+    version: int | None = None,
+    expected_version: int | None = None,
 ) -> EventStoreModel:
-    entry = EventStoreModel(
-        aggregate_type=aggregate_type,
-        aggregate_id=aggregate_id,
-        event_type=event_type,
-        event_data=json.dumps(event_data),
-        version=version,
-        created_at=datetime.now(timezone.utc),
+    """Append an event, bumping the stream head.
+
+    ``expected_version`` is the version the caller last saw (0 for a new
+    stream); passing ``version`` implies ``expected_version = version - 1``.
+    With neither, the event goes on top of whatever is there. A stale
+    expectation raises ``ConcurrencyError``.
+    """
+    if expected_version is None and version is not None:
+        expected_version = version - 1
+    entries = await append_events(
+        db, aggregate_type, aggregate_id, [(event_type, event_data)], expected_version
     )
-    db.add(entry)
+    return entries[0]
+
+
+async def append_events(
+    db: AsyncSession,
+    aggregate_type: str,
+    aggregate_id: str,
+    events: list[tuple[str, dict]],
+    expected_version: int | None = None,
+) -> list[EventStoreModel]:
+    """Append consecutive events to one stream with a single head bump."""
+    last = await _bump_stream_head(
+        db, aggregate_type, aggregate_id, expected_version, count=len(events)
+    )
+    entries = [
+        EventStoreModel(
+            aggregate_type=aggregate_type,
+            aggregate_id=aggregate_id,
+            event_type=event_type,
+            event_data=encode_event(event_type, event_data),
+            version=version,
+            created_at=datetime.now(timezone.utc),
+        )
+        for version, (event_type, event_data) in enumerate(
+            events, start=last - len(events) + 1
+        )
+    ]
+    db.add_all(entries)
     await db.flush()
-    return entry
+    db.info[LAST_POSITION_KEY] = entries[-1].id
+    db.info.setdefault(APPENDED_EVENTS_KEY, []).extend(
+        RecordedEvent(
+            entry.id, aggregate_type, aggregate_id, entry.event_type, event_data,
+            entry.version, entry.created_at,
+        )
+        for entry, (_, event_data) in zip(entries, events)
+    )
+    return entries
 
 
 async def load_events(
-    db: AsyncSession, aggregate_type: str, aggregate_id: str
+    db: AsyncSession, aggregate_type: str, aggregate_id: str, after_version: int = 0
 ) -> list[dict]:
     stmt = (
         select(EventStoreModel)
         .where(
             EventStoreModel.aggregate_type == aggregate_type,
             EventStoreModel.aggregate_id == aggregate_id,
+            EventStoreModel.version > after_version,
         )
         .order_by(EventStoreModel.version)
     )
@@ -59,7 +249,7 @@ async def load_events(
     return [
         {
             "event_type": row.event_type,
-            "event_data": json.loads(row.event_data),
+            "event_data": decode_event(row.event_data),
             "version": row.version,
             "created_at": row.created_at,
         }
@@ -70,7 +260,74 @@ async def load_events(
 async def get_next_version(
     db: AsyncSession, aggregate_type: str, aggregate_id: str
 ) -> int:
-    events = await load_events(db, aggregate_type, aggregate_id)
-    if not events:
-        return 1
-    return events[-1]["version"] + 1
+    result = await db.execute(
+        select(StreamHeadModel.version).where(
+            StreamHeadModel.aggregate_type == aggregate_type,
+            StreamHeadModel.aggregate_id == aggregate_id,
+        )
+    )
+    version = result.scalar_one_or_none()
+    if version is None:
+        result = await db.execute(_stream_max_version(aggregate_type, aggregate_id))
+        version = result.scalar_one()
+    return version + 1
+
+
+async def load_snapshot(
+    db: AsyncSession, aggregate_type: str, aggregate_id: str
+) -> dict | None:
+    result = await db.execute(
+        select(SnapshotModel).where(
+            SnapshotModel.aggregate_type == aggregate_type,
+            SnapshotModel.aggregate_id == aggregate_id,
+        )
+    )
+    row = result.scalar_one_or_none()
+    if not row:
+        return None
+    return {"version": row.version, "state": json.loads(row.state)}
+
+
+async def save_snapshot(
+    db: AsyncSession,
+    aggregate_type: str,
+    aggregate_id: str,
+    version: int,
+    state: dict,
+) -> None:
+    """Store the latest snapshot for a stream, replacing any older one."""
+    now = datetime.now(timezone.utc)
+    stmt = sqlite_insert(SnapshotModel).values(
+        aggregate_type=aggregate_type,
+        aggregate_id=aggregate_id,
+        version=version,
+        state=json.dumps(state),
+        created_at=now,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["aggregate_type", "aggregate_id"],
+        set_={"version": version, "state": stmt.excluded.state, "created_at": now},
+        where=SnapshotModel.version < version,
+    )
+    await db.execute(stmt)
+
+
+def should_snapshot(version: int) -> bool:
+    return version % SNAPSHOT_INTERVAL == 0
+
+
+async def read_all(db: AsyncSession, after: int, limit: int) -> list[RecordedEvent]:
+    """Events of every stream in global order, starting after ``after``."""
+    result = await db.execute(
+        select(EventStoreModel)
+        .where(EventStoreModel.id > after)
+        .order_by(EventStoreModel.id)
+        .limit(limit)
+    )
+    return [
+        RecordedEvent(
+            row.id, row.aggregate_type, row.aggregate_id, row.event_type,
+            decode_event(row.event_data), row.version, row.created_at,
+        )
+        for row in result.scalars().all()
+    ]
@@ -0,0 +1,83 @@
+import asyncio
+from collections import defaultdict
+
+from sqlalchemy import Integer, String, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, Mapped, mapped_column
+
+from cqrs_es.shared.database import Base
+
+DEFAULT_BLOCK_SIZE = 100
+
+
+class IdSequenceModel(Base):
+    """High-water mark of the ids reserved for each sequence."""
+
+    __tablename__ = "id_sequence"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    value: Mapped[int] = mapped_column(Integer)
+
+
+class IdAllocator:
+    """Hands out ids from blocks reserved in ``id_sequence`` (hi/lo).
+
+    A reservation bumps the high-water mark by ``block_size`` in a
+    transaction of its own, so an id is never issued twice even when the
+    command that took it rolls back; ids left in a block at shutdown are
+    skipped. Take ids before the command writes anything, as on SQLite the
+    reservation needs the write lock.
+    """
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        self.block_size = block_size
+        self.reservations = 0
+        self._seeds: dict[str, InstrumentedAttribute] = {}
+        self._blocks: dict[str, tuple[int, int]] = {}
+        self._locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def register(self, name: str, seed: InstrumentedAttribute) -> None:
+        """Start a new sequence after ``max(seed)``, for databases whose
+        ids were assigned before the sequence existed."""
+        self._seeds[name] = seed
+
+    async def next_id(self, db: AsyncSession, name: str) -> int:
+        async with self._locks[name]:
+            next_id, hi = self._blocks.get(name, (1, 0))
+            if next_id > hi:
+                hi = await self._reserve(db, name)
+                next_id = hi - self.block_size + 1
+            self._blocks[name] = (next_id + 1, hi)
+            return next_id
+
+    async def _reserve(self, db: AsyncSession, name: str) -> int:
+        seed = self._seeds.get(name)
+        start = (
+            select(func.coalesce(func.max(seed), 0)).scalar_subquery()
+            if seed is not None
+            else 0
+        )
+        stmt = sqlite_insert(IdSequenceModel).values(
+            name=name, value=start + self.block_size
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={"value": IdSequenceModel.value + self.block_size},
+        ).returning(IdSequenceModel.value)
+        async with AsyncSession(db.bind) as session:
+            hi = (await session.execute(stmt)).scalar_one()
+            await session.commit()
+        self.reservations += 1
+        return hi
+
+    def reset(self) -> None:
+        """Forget the blocks held in memory."""
+        self._blocks.clear()
+
+
+id_allocator = IdAllocator()
+
+
+async def next_id(db: AsyncSession, name: str) -> int:
+    return await id_allocator.next_id(db, name)
@@ -0,0 +1,268 @@
+import asyncio
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Integer, String, Text, delete, func, select
+from sqlalchemy import event as sa_event
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from cqrs_es.shared.database import Base
+from cqrs_es.shared.event_codec import decode_event
+from cqrs_es.shared.event_store import LAST_POSITION_KEY, EventStoreModel
+
+logger = logging.getLogger(__name__)
+
+# "1" (the default) runs projections on a background task after commit; "0"
+# keeps the original behaviour of projecting inside the command's transaction.
+ASYNC_PROJECTIONS = os.environ.get("CQRS_ASYNC_PROJECTIONS", "1") == "1"
+
+# Applies a batch of ``(event_type, event_data)`` pairs in stored order.
+Apply = Callable[[list[tuple[str, dict]], AsyncSession], Awaitable[None]]
+
+
+class ProjectionCheckpoint(Base):
+    __tablename__ = "projection_checkpoint"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class ProjectionDeadLetter(Base):
+    """An event a projection could not apply and skipped."""
+
+    __tablename__ = "projection_dead_letter"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    position: Mapped[int] = mapped_column(Integer)
+    event_type: Mapped[str] = mapped_column(String(100))
+    error: Mapped[str] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+
+
+async def head_position(db: AsyncSession | AsyncConnection) -> int:
+    result = await db.execute(select(func.max(EventStoreModel.id)))
+    return result.scalar_one_or_none() or 0
+
+
+async def _save_checkpoint(db: AsyncSession, name: str, position: int) -> None:
+    stmt = sqlite_insert(ProjectionCheckpoint).values(name=name, position=position)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["name"], set_={"position": position}
+    )
+    await db.execute(stmt)
+
+
+class ProjectionRunner:
+    """Tails ``event_store`` by global id and applies events to one projection.
+
+    Each batch and its checkpoint are committed together, so a restart
+    resumes exactly after the last applied event. When a batch fails, its
+    events are applied one at a time, and one that still fails is recorded
+    in ``projection_dead_letter`` and skipped rather than retried forever.
+    Operational errors, such as a locked database, are retried instead.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        apply: Apply,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        batch_size: int = 200,
+        poll_interval: float = 1.0,
+    ) -> None:
+        self.name = name
+        self.apply = apply
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.position = 0
+        self._session_factory = session_factory
+        self._wakeup = asyncio.Event()
+        self._advanced = asyncio.Condition()
+        self._task: asyncio.Task | None = None
+
+    def _sessions(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_factory is None:
+            from cqrs_es.shared.database import async_session_factory
+
+            self._session_factory = async_session_factory
+        return self._session_factory
+
+    async def load_checkpoint(self) -> int:
+        async with self._sessions()() as db:
+            result = await db.execute(
+                select(ProjectionCheckpoint.position).where(
+                    ProjectionCheckpoint.name == self.name
+                )
+            )
+            self.position = result.scalar_one_or_none() or 0
+        return self.position
+
+    async def reset(self, position: int) -> None:
+        """Move the checkpoint, e.g. to the head when the projection is
+        already up to date from inline projecting."""
+        async with self._sessions()() as db:
+            await _save_checkpoint(db, self.name, position)
+            await db.commit()
+        await self._advance(position)
+
+    async def run_once(self) -> int:
+        """Apply the next batch; returns how many events were applied."""
+        async with self._sessions()() as db:
+            result = await db.execute(
+                select(EventStoreModel)
+                .where(EventStoreModel.id > self.position)
+                .order_by(EventStoreModel.id)
+                .limit(self.batch_size)
+            )
+            # Plain tuples, as a rollback expires the rows.
+            batch = [
+                (row.id, row.event_type, decode_event(row.event_data))
+                for row in result.scalars().all()
+            ]
+            if not batch:
+                return 0
+            try:
+                await self.apply([(t, data) for _, t, data in batch], db)
+                await _save_checkpoint(db, self.name, batch[-1][0])
+                await db.commit()
+            except OperationalError:
+                await db.rollback()
+                raise
+            except Exception:
+                await db.rollback()
+                await self._apply_each(batch, db)
+                return len(batch)
+        await self._advance(batch[-1][0])
+        return len(batch)
+
+    async def _apply_each(
+        self, batch: list[tuple[int, str, dict]], db: AsyncSession
+    ) -> None:
+        for position, event_type, event_data in batch:
+            try:
+                await self.apply([(event_type, event_data)], db)
+            except OperationalError:
+                await db.rollback()
+                raise
+            except Exception as exc:
+                await db.rollback()
+                logger.exception(
+                    "Projection %s skipped %s at %s", self.name, event_type, position
+                )
+                db.add(
+                    ProjectionDeadLetter(
+                        name=self.name,
+                        position=position,
+                        event_type=event_type,
+                        error=repr(exc),
+                    )
+                )
+            await _save_checkpoint(db, self.name, position)
+            await db.commit()
+            await self._advance(position)
+
+    async def _advance(self, position: int) -> None:
+        async with self._advanced:
+            self.position = position
+            self._advanced.notify_all()
+
+    async def _run(self) -> None:
+        await self.load_checkpoint()
+        while True:
+            self._wakeup.clear()
+            try:
+                applied = await self.run_once()
+            except Exception:
+                logger.exception("Projection %s failed after %s", self.name, self.position)
+                applied = 0
+            if applied < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except TimeoutError:
+                    pass
+
+    def notify(self) -> None:
+        self._wakeup.set()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def wait_for(self, position: int, timeout: float = 5.0) -> None:
+        """Block until events up to ``position`` are projected."""
+        async with asyncio.timeout(timeout):
+            async with self._advanced:
+                await self._advanced.wait_for(lambda: self.position >= position)
+
+
+_runners: dict[str, ProjectionRunner] = {}
+
+
+def register_runner(runner: ProjectionRunner) -> None:
+    _runners[runner.name] = runner
+
+
+def unregister_runner(name: str) -> None:
+    _runners.pop(name, None)
+
+
+def start_runners() -> None:
+    for runner in _runners.values():
+        runner.start()
+
+
+async def stop_runners() -> None:
+    for runner in _runners.values():
+        await runner.stop()
+
+
+def notify_runners() -> None:
+    for runner in _runners.values():
+        runner.notify()
+
+
+async def wait_for_position(position: int, timeout: float = 5.0) -> None:
+    for runner in list(_runners.values()):
+        await runner.wait_for(position, timeout)
+
+
+async def adopt_checkpoint(conn: AsyncConnection, name: str) -> None:
+    """Start ``name`` at the head unless it already has a checkpoint.
+
+    A projection without one was kept up to date inline, so replaying the
+    store onto it would apply every event twice.
+    """
+    head = await head_position(conn)
+    await conn.execute(
+        sqlite_insert(ProjectionCheckpoint)
+        .values(name=name, position=head)
+        .on_conflict_do_nothing()
+    )
+
+
+async def drop_checkpoint(conn: AsyncConnection, name: str) -> None:
+    """Forget ``name``'s checkpoint while it is projected inline, so that
+    switching back to a runner starts from the head again."""
+    await conn.execute(
+        delete(ProjectionCheckpoint).where(ProjectionCheckpoint.name == name)
+    )
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _wake_runners(session: Session) -> None:
+    if LAST_POSITION_KEY in session.info:
+        notify_runners()
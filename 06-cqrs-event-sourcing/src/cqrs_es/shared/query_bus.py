@@ -1,19 +1,37 @@
 from collections.abc import Callable
 from typing import Any
 
+from cqrs_es.shared.query_cache import CachePolicy, query_cache
+
 _handlers: dict[type, Callable] = {}
 
 
-def register_query_handler(query_type: type, handler: Callable) -> None:
+def register_query_handler(
+    query_type: type, handler: Callable, cache: CachePolicy | None = None
+) -> None:
     _handlers[query_type] = handler
+    if cache is not None:
+        query_cache.configure(query_type, cache)
 
 
 async def dispatch_query(query: Any) -> Any:
     handler = _handlers.get(type(query))
     if not handler:
         raise ValueError(f"No handler registered for {type(query).__name__}")
-    return await handler(query)
+    if query_cache.policy(type(query)) is None:
+        return await handler(query)
+    hit, result = query_cache.get(query)
+    if hit:
+        return result
+    # Taken before the read, so a result invalidated meanwhile is not cached.
+    token = query_cache.token()
+    result = await handler(query)
+    # Misses are not cached: nothing would invalidate them once the row appears.
+    if result is not None:
+        query_cache.put(query, result, token)
+    return result
 
 
 def clear_handlers() -> None:
     _handlers.clear()
+    query_cache.reset()
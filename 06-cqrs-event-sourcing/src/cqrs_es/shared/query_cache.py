@@ -0,0 +1,175 @@
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, fields
+from typing import Any
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+PENDING_TAGS_KEY = "pending_cache_tags"
+# How many invalidated tags keep their stamp before the stamps are dropped.
+MAX_TRACKED_TAGS = 10_000
+
+Tag = tuple[str, Hashable]
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    ttl: float
+    max_entries: int
+    # Rows a cached result was read from, e.g. ``[("post", query.post_id)]``;
+    # projection handlers invalidate by the same tags when they change them.
+    tags: Callable[[Any], list[Tag]]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    tags: list[Tag]
+
+
+def query_params(query: Any) -> tuple:
+    return tuple(getattr(query, f.name) for f in fields(query) if f.name != "db")
+
+
+class QueryCache:
+    """Per-query-type LRU caches with TTLs and tag-based invalidation.
+
+    Every invalidation stamps its tags with a counter. A result is read
+    before it is put, so ``put`` takes the ``token()`` from before the read
+    and skips the result if one of its tags was invalidated since.
+    """
+
+    def __init__(self) -> None:
+        self._policies: dict[type, CachePolicy] = {}
+        self._entries: dict[type, OrderedDict[tuple, _Entry]] = {}
+        self._by_tag: dict[Tag, set[tuple[type, tuple]]] = defaultdict(set)
+        self._clock = 0
+        self._invalidated_at: dict[Tag, int] = {}
+        # Stamps up to here were dropped; older tokens cannot be checked.
+        self._forgotten = 0
+        self.stats: dict[str, CacheStats] = {}
+
+    def configure(self, query_type: type, policy: CachePolicy) -> None:
+        self._policies[query_type] = policy
+        self._entries[query_type] = OrderedDict()
+        self.stats[query_type.__name__] = CacheStats()
+
+    def policy(self, query_type: type) -> CachePolicy | None:
+        return self._policies.get(query_type)
+
+    def get(self, query: Any) -> tuple[bool, Any]:
+        query_type = type(query)
+        entries = self._entries[query_type]
+        stats = self.stats[query_type.__name__]
+        key = query_params(query)
+        entry = entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                self._drop(query_type, key)
+            stats.misses += 1
+            return False, None
+        entries.move_to_end(key)
+        stats.hits += 1
+        return True, entry.value
+
+    def token(self) -> int:
+        """Take before reading a result that will be passed to ``put``."""
+        return self._clock
+
+    def put(self, query: Any, value: Any, token: int | None = None) -> None:
+        query_type = type(query)
+        policy = self._policies[query_type]
+        tags = policy.tags(query)
+        if token is not None and self._stale(tags, token):
+            return
+        entries = self._entries[query_type]
+        key = query_params(query)
+        if key in entries:
+            self._drop(query_type, key)
+        entries[key] = _Entry(value, time.monotonic() + policy.ttl, tags)
+        for tag in tags:
+            self._by_tag[tag].add((query_type, key))
+        while len(entries) > policy.max_entries:
+            oldest = next(iter(entries))
+            self._drop(query_type, oldest)
+            self.stats[query_type.__name__].evictions += 1
+
+    def _drop(self, query_type: type, key: tuple) -> None:
+        entry = self._entries[query_type].pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard((query_type, key))
+                if not keys:
+                    del self._by_tag[tag]
+
+    def _stale(self, tags: list[Tag], token: int) -> bool:
+        return token < self._forgotten or any(
+            self._invalidated_at.get(tag, 0) > token for tag in tags
+        )
+
+    def _forget_stamps(self) -> None:
+        self._clock += 1
+        self._invalidated_at.clear()
+        self._forgotten = self._clock
+
+    def invalidate(self, *tags: Tag) -> None:
+        for tag in tags:
+            self._clock += 1
+            self._invalidated_at[tag] = self._clock
+            for query_type, key in list(self._by_tag.get(tag, ())):
+                self._drop(query_type, key)
+                self.stats[query_type.__name__].invalidations += 1
+        if len(self._invalidated_at) > MAX_TRACKED_TAGS:
+            self._forget_stamps()
+
+    def invalidate_on_commit(self, db: AsyncSession, *tags: Tag) -> None:
+        """Invalidate now and again once ``db`` commits, dropping anything
+        cached from the pre-commit state in between."""
+        self.invalidate(*tags)
+        db.info.setdefault(PENDING_TAGS_KEY, []).extend(tags)
+
+    def clear(self) -> None:
+        for entries in self._entries.values():
+            entries.clear()
+        self._by_tag.clear()
+        self._forget_stamps()
+
+    def reset(self) -> None:
+        self._policies.clear()
+        self._entries.clear()
+        self._by_tag.clear()
+        self._forget_stamps()
+        self.stats.clear()
+
+
+query_cache = QueryCache()
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    query_cache.invalidate(*session.info.pop(PENDING_TAGS_KEY, ()))
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(PENDING_TAGS_KEY, None)
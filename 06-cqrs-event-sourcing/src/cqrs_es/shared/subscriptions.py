@@ -0,0 +1,106 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from cqrs_es.shared.event_archive import EventArchive, event_archive
+from cqrs_es.shared.event_store import APPENDED_EVENTS_KEY, RecordedEvent, read_all
+
+
+class _LiveQueue(asyncio.Queue):
+    overflowed = False
+
+
+class EventHub:
+    """Fans committed events out to live subscribers in this process."""
+
+    def __init__(self, max_queue_size: int = 1000) -> None:
+        self.max_queue_size = max_queue_size
+        self._queues: set[_LiveQueue] = set()
+
+    def open(self) -> _LiveQueue:
+        queue = _LiveQueue(maxsize=self.max_queue_size)
+        self._queues.add(queue)
+        return queue
+
+    def close(self, queue: _LiveQueue) -> None:
+        self._queues.discard(queue)
+
+    def publish(self, events: list[RecordedEvent]) -> None:
+        for queue in list(self._queues):
+            for event in events:
+                try:
+                    queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    # The subscriber fell behind: stop feeding it and let it
+                    # catch up from the store instead.
+                    queue.overflowed = True
+                    self.close(queue)
+                    break
+
+
+hub = EventHub()
+
+
+async def subscribe(
+    bind: AsyncEngine,
+    from_position: int = 0,
+    batch_size: int = 500,
+    live: bool = True,
+    archive: EventArchive = event_archive,
+) -> AsyncIterator[RecordedEvent]:
+    """Every event after ``from_position`` in global order.
+
+    Reads the store in batches until caught up, then switches to events
+    pushed by ``hub`` as they commit. With ``live=False`` it stops once
+    caught up. Archived events are merged into the first catch-up by
+    position.
+    """
+    position = from_position
+    archived = archive.iter_events(from_position)
+    pending = next(archived, None)
+    while True:
+        # Listen before the last catch-up read so nothing committed in
+        # between is missed; duplicates are skipped by position.
+        queue = hub.open() if live else None
+        try:
+            while True:
+                async with AsyncSession(bind) as db:
+                    batch = await read_all(db, position, batch_size)
+                for event in batch:
+                    while pending is not None and pending.position <= event.position:
+                        if pending.position < event.position:
+                            yield pending
+                        pending = next(archived, None)
+                    position = event.position
+                    yield event
+                if len(batch) < batch_size:
+                    break
+            while pending is not None:
+                position = pending.position
+                yield pending
+                pending = next(archived, None)
+            if queue is None:
+                return
+            while not (queue.overflowed and queue.empty()):
+                event = await queue.get()
+                if event.position > position:
+                    position = event.position
+                    yield event
+        finally:
+            if queue is not None:
+                hub.close(queue)
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _publish_committed(session: Session) -> None:
+    events = session.info.pop(APPENDED_EVENTS_KEY, None)
+    if events:
+        hub.publish(events)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_uncommitted(session: Session) -> None:
+    session.info.pop(APPENDED_EVENTS_KEY, None)
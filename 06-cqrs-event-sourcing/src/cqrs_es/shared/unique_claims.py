@@ -0,0 +1,64 @@
+from sqlalchemy import Integer, String, delete, inspect, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from cqrs_es.shared.database import Base
+
+
+class UniqueClaimModel(Base):
+    """Values a command must hold exclusively, such as a username.
+
+    The read model may lag behind the event store, so commands check these
+    claims instead. A claim is written in the command's own transaction, so
+    of two concurrent commands the second fails there instead of appending
+    an event the projections cannot apply. ``owner_id`` names the aggregate
+    that holds the value, so a command can find it from the value alone:
+    the user with an email, or the post a comment is on.
+    """
+
+    __tablename__ = "unique_claim"
+
+    scope: Mapped[str] = mapped_column(String(50), primary_key=True)
+    value: Mapped[str] = mapped_column(String(255), primary_key=True)
+    owner_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+
+async def claim(
+    db: AsyncSession, scope: str, value: str, owner_id: int | None = None
+) -> bool:
+    """Claim ``value`` in ``scope``; False if it is already taken."""
+    result = await db.execute(
+        sqlite_insert(UniqueClaimModel)
+        .values(scope=scope, value=value, owner_id=owner_id)
+        .on_conflict_do_nothing()
+    )
+    return result.rowcount == 1
+
+
+async def release(db: AsyncSession, scope: str, value: str) -> bool:
+    """Release ``value`` in ``scope``; False if it was not claimed."""
+    result = await db.execute(
+        delete(UniqueClaimModel).where(
+            UniqueClaimModel.scope == scope, UniqueClaimModel.value == value
+        )
+    )
+    return result.rowcount == 1
+
+
+async def claim_owner(db: AsyncSession, scope: str, value: str) -> int | None:
+    result = await db.execute(
+        select(UniqueClaimModel.owner_id).where(
+            UniqueClaimModel.scope == scope, UniqueClaimModel.value == value
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def upgrade_claim_table(conn: AsyncConnection) -> None:
+    """Add ``owner_id`` to a table created before it existed."""
+    columns = await conn.run_sync(
+        lambda sync_conn: inspect(sync_conn).get_columns("unique_claim")
+    )
+    if all(column["name"] != "owner_id" for column in columns):
+        await conn.execute(text("ALTER TABLE unique_claim ADD COLUMN owner_id INTEGER"))
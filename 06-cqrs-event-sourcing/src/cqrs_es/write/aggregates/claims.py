@@ -0,0 +1,104 @@
+"""Rebuilds ``unique_claim`` rows from the event store.
+
+Commands write their claims as they go, so events appended before a kind
+of claim existed have none, and duplicate checks would miss them.
+``backfill_claims`` replays the events that imply a claim, starting from
+its own checkpoint, so running it on every start only reads the events
+appended since the last run.
+"""
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from cqrs_es.shared.event_codec import decode_event
+from cqrs_es.shared.event_store import EventStoreModel
+from cqrs_es.shared.projection_runner import ProjectionCheckpoint
+from cqrs_es.shared.unique_claims import UniqueClaimModel, upgrade_claim_table
+from cqrs_es.write.events.events import (
+    COMMENT_CREATED,
+    COMMENT_DELETED,
+    USER_FOLLOWED,
+    USER_REGISTERED,
+    USER_UNFOLLOWED,
+)
+
+CHECKPOINT = "unique_claim"
+BATCH_SIZE = 500
+CLAIM_EVENTS = (
+    USER_REGISTERED,
+    USER_FOLLOWED,
+    USER_UNFOLLOWED,
+    COMMENT_CREATED,
+    COMMENT_DELETED,
+)
+
+
+async def _hold(
+    conn: AsyncConnection, scope: str, value: str, owner_id: int | None = None
+) -> None:
+    stmt = sqlite_insert(UniqueClaimModel).values(
+        scope=scope, value=value, owner_id=owner_id
+    )
+    await conn.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["scope", "value"], set_={"owner_id": owner_id}
+        )
+    )
+
+
+async def _drop(conn: AsyncConnection, scope: str, value: str) -> None:
+    await conn.execute(
+        delete(UniqueClaimModel).where(
+            UniqueClaimModel.scope == scope, UniqueClaimModel.value == value
+        )
+    )
+
+
+async def _apply(conn: AsyncConnection, event_type: str, data: dict) -> None:
+    if event_type == USER_REGISTERED:
+        await _hold(conn, "email", data["email"], data["user_id"])
+        await _hold(conn, "username", data["username"], data["user_id"])
+    elif event_type == USER_FOLLOWED:
+        await _hold(conn, "follow", f"{data['follower_id']}:{data['following_id']}")
+    elif event_type == USER_UNFOLLOWED:
+        await _drop(conn, "follow", f"{data['follower_id']}:{data['following_id']}")
+    elif event_type == COMMENT_CREATED:
+        await _hold(conn, "comment", str(data["comment_id"]), data["post_id"])
+    elif event_type == COMMENT_DELETED:
+        await _drop(conn, "comment", str(data["comment_id"]))
+
+
+async def backfill_claims(conn: AsyncConnection) -> None:
+    await upgrade_claim_table(conn)
+    result = await conn.execute(
+        select(ProjectionCheckpoint.position).where(
+            ProjectionCheckpoint.name == CHECKPOINT
+        )
+    )
+    position = result.scalar_one_or_none() or 0
+    head = (await conn.execute(select(func.max(EventStoreModel.id)))).scalar() or 0
+    while position < head:
+        result = await conn.execute(
+            select(
+                EventStoreModel.id,
+                EventStoreModel.event_type,
+                EventStoreModel.event_data,
+            )
+            .where(
+                EventStoreModel.id > position,
+                EventStoreModel.id <= head,
+                EventStoreModel.event_type.in_(CLAIM_EVENTS),
+            )
+            .order_by(EventStoreModel.id)
+            .limit(BATCH_SIZE)
+        )
+        rows = result.all()
+        if not rows:
+            break
+        for row in rows:
+            await _apply(conn, row.event_type, decode_event(row.event_data))
+        position = rows[-1].id
+    stmt = sqlite_insert(ProjectionCheckpoint).values(name=CHECKPOINT, position=head)
+    await conn.execute(
+        stmt.on_conflict_do_update(index_elements=["name"], set_={"position": head})
+    )
@@ -39,6 +39,30 @@ class PostAggregate:
             self.comments.pop(data["comment_id"], None)
         self.version += 1
 
+    def to_snapshot(self) -> dict:
+        return {
+            "id": self.id,
+            "author_id": self.author_id,
+            "content": self.content,
+            "image_url": self.image_url,
+            "deleted": self.deleted,
+            "likes": sorted(self.likes),
+            "comments": list(self.comments.values()),
+        }
+
+    @classmethod
+    def from_snapshot(cls, state: dict, version: int) -> "PostAggregate":
+        post = cls()
+        post.id = state["id"]
+        post.author_id = state["author_id"]
+        post.content = state["content"]
+        post.image_url = state["image_url"]
+        post.deleted = state["deleted"]
+        post.likes = set(state["likes"])
+        post.comments = {c["comment_id"]: c for c in state["comments"]}
+        post.version = version
+        return post
+
     @staticmethod
     def create(post_id: int, author_id: int, content: str | None,
                image_url: str | None) -> tuple[str, dict]:
@@ -0,0 +1,83 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cqrs_es.shared.event_store import (
+    append_event,
+    append_events,
+    get_next_version,
+    load_events,
+    load_snapshot,
+    save_snapshot,
+    should_snapshot,
+)
+from cqrs_es.write.aggregates.post import PostAggregate
+from cqrs_es.write.aggregates.social import StoryAggregate
+from cqrs_es.write.aggregates.user import UserAggregate
+
+POST = "Post"
+
+
+async def load_post(db: AsyncSession, post_id: int) -> PostAggregate:
+    """Rebuild a post from its latest snapshot plus the events after it."""
+    snapshot = await load_snapshot(db, POST, str(post_id))
+    if snapshot:
+        post = PostAggregate.from_snapshot(snapshot["state"], snapshot["version"])
+    else:
+        post = PostAggregate()
+    for event in await load_events(db, POST, str(post_id), after_version=post.version):
+        post.apply(event["event_type"], event["event_data"])
+    return post
+
+
+async def append_post_event(
+    db: AsyncSession,
+    post_id: int,
+    event_type: str,
+    event_data: dict,
+    expected_version: int | None = None,
+) -> int:
+    if expected_version is None:
+        expected_version = await get_next_version(db, POST, str(post_id)) - 1
+    entry = await append_event(
+        db, POST, str(post_id), event_type, event_data,
+        expected_version=expected_version,
+    )
+    version = entry.version
+    if should_snapshot(version):
+        post = await load_post(db, post_id)
+        await save_snapshot(db, POST, str(post_id), post.version, post.to_snapshot())
+    return version
+
+
+async def append_post_events(
+    db: AsyncSession,
+    post: PostAggregate,
+    events: list[tuple[str, dict]],
+    expected_version: int,
+) -> list[int]:
+    """Append events already applied to ``post`` in one reservation.
+
+    ``post`` must be at ``expected_version + len(events)``; it is
+    snapshotted if the batch crosses a snapshot interval.
+    """
+    entries = await append_events(
+        db, POST, str(post.id), events, expected_version=expected_version
+    )
+    versions = [entry.version for entry in entries]
+    if any(should_snapshot(version) for version in versions):
+        await save_snapshot(db, POST, str(post.id), post.version, post.to_snapshot())
+    return versions
+
+
+async def load_user(db: AsyncSession, user_id: int) -> UserAggregate:
+    """Rebuild a user from its stream; ``id`` is None if there is none."""
+    user = UserAggregate()
+    for event in await load_events(db, "User", str(user_id)):
+        user.apply(event["event_type"], event["event_data"])
+    return user
+
+
+async def load_story(db: AsyncSession, story_id: int) -> StoryAggregate:
+    story = StoryAggregate()
+    for event in await load_events(db, "Story", str(story_id)):
+        story.apply(event["event_type"], event["event_data"])
+    return story
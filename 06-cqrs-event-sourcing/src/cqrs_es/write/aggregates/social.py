@@ -40,6 +40,20 @@ class FollowAggregate:
 
 
 class StoryAggregate:
+    def __init__(self) -> None:
+        self.id: int | None = None
+        self.author_id: int | None = None
+        self.deleted: bool = False
+        self.version: int = 0
+
+    def apply(self, event_type: str, data: dict) -> None:
+        if event_type == STORY_CREATED:
+            self.id = data["story_id"]
+            self.author_id = data["author_id"]
+        elif event_type == STORY_DELETED:
+            self.deleted = True
+        self.version += 1
+
     @staticmethod
     def create(story_id: int, author_id: int, image_url: str | None,
                content: str | None) -> tuple[str, dict]:
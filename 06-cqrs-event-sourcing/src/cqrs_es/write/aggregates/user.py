@@ -13,6 +13,7 @@ class UserAggregate:
         self.bio: str | None = None
         self.profile_image_url: str | None = None
         self.is_active: bool = True
+        self.created_at: str | None = None
         self.version: int = 0
 
     def apply(self, event_type: str, data: dict) -> None:
@@ -23,6 +24,7 @@ class UserAggregate:
             self.hashed_password = data["hashed_password"]
             self.full_name = data.get("full_name")
             self.is_active = True
+            self.created_at = data.get("created_at")
         elif event_type == USER_UPDATED:
             if "full_name" in data:
                 self.full_name = data["full_name"]
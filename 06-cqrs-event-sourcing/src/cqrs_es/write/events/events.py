@@ -1,3 +1,5 @@
+from cqrs_es.shared.event_codec import EventSchema
+
 USER_REGISTERED = "UserRegistered"
 USER_UPDATED = "UserUpdated"
 
@@ -22,3 +24,34 @@ MESSAGES_MARKED_READ = "MessagesMarkedRead"
 NOTIFICATION_CREATED = "NotificationCreated"
 NOTIFICATION_READ = "NotificationRead"
 ALL_NOTIFICATIONS_READ = "AllNotificationsRead"
+
+# Positional payload layouts for the binary event codec. Ids are stored in
+# every event: append new schemas, never edit or renumber existing ones.
+# USER_UPDATED carries only the changed fields and is stored as JSON.
+EVENT_SCHEMAS = [
+    EventSchema(1, USER_REGISTERED, (
+        "user_id", "username", "email", "hashed_password", "full_name", "created_at",
+    )),
+    EventSchema(2, POST_CREATED, (
+        "post_id", "author_id", "content", "image_url", "created_at",
+    )),
+    EventSchema(3, POST_DELETED, ("post_id", "author_id")),
+    EventSchema(4, LIKE_ADDED, ("post_id", "user_id", "post_author_id")),
+    EventSchema(5, LIKE_REMOVED, ("post_id", "user_id")),
+    EventSchema(6, COMMENT_CREATED, (
+        "comment_id", "post_id", "author_id", "content", "post_author_id", "created_at",
+    )),
+    EventSchema(7, COMMENT_DELETED, ("comment_id", "post_id")),
+    EventSchema(8, USER_FOLLOWED, ("follower_id", "following_id")),
+    EventSchema(9, USER_UNFOLLOWED, ("follower_id", "following_id")),
+    EventSchema(10, STORY_CREATED, (
+        "story_id", "author_id", "image_url", "content", "created_at",
+    )),
+    EventSchema(11, STORY_DELETED, ("story_id", "author_id")),
+    EventSchema(12, MESSAGE_SENT, (
+        "message_id", "sender_id", "receiver_id", "content", "created_at",
+    )),
+    EventSchema(13, MESSAGES_MARKED_READ, ("user_id", "sender_id")),
+    EventSchema(14, NOTIFICATION_READ, ("notification_id", "user_id")),
+    EventSchema(15, ALL_NOTIFICATIONS_READ, ("user_id",)),
+]
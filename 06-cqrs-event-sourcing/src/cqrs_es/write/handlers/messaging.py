@@ -1,13 +1,9 @@
 from fastapi import HTTPException, status
-from sqlalchemy import select
 
-from cqrs_es.read.projections.models import (
-    MessageProjection,
-    NotificationProjection,
-    UserProjection,
-)
 from cqrs_es.shared import event_bus
 from cqrs_es.shared.event_store import append_event, get_next_version
+from cqrs_es.shared.id_sequence import next_id
+from cqrs_es.write.aggregates.repository import load_user
 from cqrs_es.write.aggregates.social import MessageAggregate, NotificationAggregate
 from cqrs_es.write.commands.commands import (
     MarkAllNotificationsRead,
@@ -18,17 +14,10 @@ from cqrs_es.write.commands.commands import (
 
 
 async def handle_send_message(cmd: SendMessage) -> dict:
-    result = await cmd.db.execute(
-        select(UserProjection).where(UserProjection.id == cmd.receiver_id)
-    )
-    if not result.scalar_one_or_none():
+    if (await load_user(cmd.db, cmd.receiver_id)).id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Receiver not found")
 
-    msg_result = await cmd.db.execute(
-        select(MessageProjection.id).order_by(MessageProjection.id.desc()).limit(1)
-    )
-    max_id = msg_result.scalar_one_or_none() or 0
-    message_id = max_id + 1
+    message_id = await next_id(cmd.db, "message")
 
     event_type, event_data = MessageAggregate.send(
         message_id, cmd.sender_id, cmd.receiver_id, cmd.content
@@ -37,14 +26,10 @@ async def handle_send_message(cmd: SendMessage) -> dict:
     await append_event(cmd.db, "Message", str(message_id), event_type, event_data, version)
     await event_bus.publish(event_type, event_data, db=cmd.db)
 
-    result = await cmd.db.execute(
-        select(MessageProjection).where(MessageProjection.id == message_id)
-    )
-    msg = result.scalar_one()
     return {
-        "id": msg.id, "sender_id": msg.sender_id,
-        "receiver_id": msg.receiver_id, "content": msg.content,
-        "is_read": msg.is_read, "created_at": msg.created_at,
+        "id": message_id, "sender_id": cmd.sender_id,
+        "receiver_id": cmd.receiver_id, "content": cmd.content,
+        "is_read": False, "created_at": event_data["created_at"],
     }
 
 
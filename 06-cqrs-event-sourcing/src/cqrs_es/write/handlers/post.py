@@ -1,15 +1,16 @@
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from cqrs_es.read.projections.models import (
-    CommentProjection,
-    LikeProjection,
-    PostProjection,
-    UserProjection,
-)
 from cqrs_es.shared import event_bus
-from cqrs_es.shared.event_store import append_event, get_next_version
+from cqrs_es.shared.id_sequence import next_id
+from cqrs_es.shared.unique_claims import claim, claim_owner, release
 from cqrs_es.write.aggregates.post import PostAggregate
+from cqrs_es.write.aggregates.repository import (
+    append_post_event,
+    append_post_events,
+    load_post,
+    load_user,
+)
 from cqrs_es.write.commands.commands import (
     CreateComment,
     CreatePost,
@@ -20,131 +21,124 @@ from cqrs_es.write.commands.commands import (
 
 
 async def handle_create_post(cmd: CreatePost) -> dict:
-    result = await cmd.db.execute(
-        select(PostProjection.id).order_by(PostProjection.id.desc()).limit(1)
-    )
-    max_id = result.scalar_one_or_none() or 0
-    post_id = max_id + 1
+    post_id = await next_id(cmd.db, "post")
 
     event_type, event_data = PostAggregate.create(
         post_id, cmd.author_id, cmd.content, cmd.image_url
     )
 
-    version = await get_next_version(cmd.db, "Post", str(post_id))
-    await append_event(cmd.db, "Post", str(post_id), event_type, event_data, version)
+    await append_post_event(cmd.db, post_id, event_type, event_data)
     await event_bus.publish(event_type, event_data, db=cmd.db)
 
-    result = await cmd.db.execute(
-        select(PostProjection).where(PostProjection.id == post_id)
-    )
-    post = result.scalar_one()
+    # Built from the event: the projection may not have caught up yet.
     return {
-        "id": post.id, "author_id": post.author_id,
-        "author_username": post.author_username,
-        "content": post.content, "image_url": post.image_url,
-        "like_count": post.like_count, "comment_count": post.comment_count,
-        "created_at": post.created_at,
+        "id": post_id, "author_id": cmd.author_id,
+        "author_username": await _username(cmd.db, cmd.author_id),
+        "content": cmd.content, "image_url": cmd.image_url,
+        "like_count": 0, "comment_count": 0,
+        "created_at": event_data["created_at"],
     }
 
 
 async def handle_delete_post(cmd: DeletePost) -> None:
-    result = await cmd.db.execute(
-        select(PostProjection).where(PostProjection.id == cmd.post_id)
-    )
-    post = result.scalar_one_or_none()
-    if not post:
+    post = await load_post(cmd.db, cmd.post_id)
+    if post.id is None or post.deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
     if post.author_id != cmd.user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your post")
 
     event_type, event_data = PostAggregate.delete(cmd.post_id, post.author_id)
-    version = await get_next_version(cmd.db, "Post", str(cmd.post_id))
-    await append_event(cmd.db, "Post", str(cmd.post_id), event_type, event_data, version)
+    await append_post_event(cmd.db, cmd.post_id, event_type, event_data)
     await event_bus.publish(event_type, event_data, db=cmd.db)
 
 
 async def handle_toggle_like(cmd: ToggleLike) -> dict:
-    result = await cmd.db.execute(
-        select(PostProjection).where(PostProjection.id == cmd.post_id)
-    )
-    post = result.scalar_one_or_none()
-    if not post:
+    post = await load_post(cmd.db, cmd.post_id)
+    if post.id is None or post.deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
 
-    existing = await cmd.db.execute(
-        select(LikeProjection).where(
-            LikeProjection.post_id == cmd.post_id,
-            LikeProjection.user_id == cmd.user_id,
-        )
-    )
-    like = existing.scalar_one_or_none()
-
-    if like:
+    if cmd.user_id in post.likes:
         event_type, event_data = PostAggregate.remove_like(cmd.post_id, cmd.user_id)
-        version = await get_next_version(cmd.db, "Post", str(cmd.post_id))
-        await append_event(cmd.db, "Post", str(cmd.post_id), event_type, event_data, version)
-        await event_bus.publish(event_type, event_data, db=cmd.db)
-        liked = False
     else:
         event_type, event_data = PostAggregate.add_like(
             cmd.post_id, cmd.user_id, post.author_id
         )
-        version = await get_next_version(cmd.db, "Post", str(cmd.post_id))
-        await append_event(cmd.db, "Post", str(cmd.post_id), event_type, event_data, version)
-        await event_bus.publish(event_type, event_data, db=cmd.db)
-        liked = True
-
-    result = await cmd.db.execute(
-        select(PostProjection).where(PostProjection.id == cmd.post_id)
+    await append_post_event(
+        cmd.db, cmd.post_id, event_type, event_data, expected_version=post.version
     )
-    post = result.scalar_one()
-    return {"liked": liked, "like_count": post.like_count}
+    await event_bus.publish(event_type, event_data, db=cmd.db)
+    post.apply(event_type, event_data)
+
+    return {"liked": cmd.user_id in post.likes, "like_count": len(post.likes)}
+
+
+async def handle_toggle_likes(cmds: list[ToggleLike], db: AsyncSession) -> list:
+    """Batched ``handle_toggle_like`` for commands on one post, applied in
+    arrival order; each caller gets the state right after its own toggle."""
+    post = await load_post(db, cmds[0].post_id)
+    if post.id is None or post.deleted:
+        return [
+            HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
+            for _ in cmds
+        ]
+
+    expected_version = post.version
+    events = []
+    results = []
+    for cmd in cmds:
+        if cmd.user_id in post.likes:
+            event = PostAggregate.remove_like(cmd.post_id, cmd.user_id)
+        else:
+            event = PostAggregate.add_like(cmd.post_id, cmd.user_id, post.author_id)
+        post.apply(*event)
+        events.append(event)
+        results.append(
+            {"liked": cmd.user_id in post.likes, "like_count": len(post.likes)}
+        )
+
+    await append_post_events(db, post, events, expected_version)
+    await event_bus.publish_many(events, db=db)
+    return results
 
 
 async def handle_create_comment(cmd: CreateComment) -> dict:
-    result = await cmd.db.execute(
-        select(PostProjection).where(PostProjection.id == cmd.post_id)
-    )
-    post = result.scalar_one_or_none()
-    if not post:
+    post = await load_post(cmd.db, cmd.post_id)
+    if post.id is None or post.deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
 
-    cmt_result = await cmd.db.execute(
-        select(CommentProjection.id).order_by(CommentProjection.id.desc()).limit(1)
-    )
-    max_id = cmt_result.scalar_one_or_none() or 0
-    comment_id = max_id + 1
+    comment_id = await next_id(cmd.db, "comment")
+    # Lets a delete find the comment's post without the read model.
+    await claim(cmd.db, "comment", str(comment_id), owner_id=cmd.post_id)
 
     event_type, event_data = PostAggregate.add_comment(
         comment_id, cmd.post_id, cmd.author_id, cmd.content, post.author_id
     )
-    version = await get_next_version(cmd.db, "Post", str(cmd.post_id))
-    await append_event(cmd.db, "Post", str(cmd.post_id), event_type, event_data, version)
+    await append_post_event(cmd.db, cmd.post_id, event_type, event_data)
     await event_bus.publish(event_type, event_data, db=cmd.db)
 
-    result = await cmd.db.execute(
-        select(CommentProjection).where(CommentProjection.id == comment_id)
-    )
-    comment = result.scalar_one()
     return {
-        "id": comment.id, "post_id": comment.post_id,
-        "author_id": comment.author_id,
-        "author_username": comment.author_username,
-        "content": comment.content, "created_at": comment.created_at,
+        "id": comment_id, "post_id": cmd.post_id,
+        "author_id": cmd.author_id,
+        "author_username": await _username(cmd.db, cmd.author_id),
+        "content": cmd.content, "created_at": event_data["created_at"],
     }
 
 
 async def handle_delete_comment(cmd: DeleteComment) -> None:
-    result = await cmd.db.execute(
-        select(CommentProjection).where(CommentProjection.id == cmd.comment_id)
-    )
-    comment = result.scalar_one_or_none()
+    post_id = await claim_owner(cmd.db, "comment", str(cmd.comment_id))
+    post = await load_post(cmd.db, post_id) if post_id is not None else None
+    comment = post.comments.get(cmd.comment_id) if post and not post.deleted else None
     if not comment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
-    if comment.author_id != cmd.user_id:
+    if comment["author_id"] != cmd.user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your comment")
+    await release(cmd.db, "comment", str(cmd.comment_id))
 
-    event_type, event_data = PostAggregate.remove_comment(cmd.comment_id, comment.post_id)
-    version = await get_next_version(cmd.db, "Post", str(comment.post_id))
-    await append_event(cmd.db, "Post", str(comment.post_id), event_type, event_data, version)
+    event_type, event_data = PostAggregate.remove_comment(cmd.comment_id, post_id)
+    await append_post_event(cmd.db, post_id, event_type, event_data)
     await event_bus.publish(event_type, event_data, db=cmd.db)
+
+
+async def _username(db: AsyncSession, user_id: int) -> str | None:
+    user = await load_user(db, user_id)
+    return user.username if user.id is not None else None
@@ -1,13 +1,10 @@
 from fastapi import HTTPException, status
-from sqlalchemy import select
 
-from cqrs_es.read.projections.models import (
-    FollowProjection,
-    StoryProjection,
-    UserProjection,
-)
 from cqrs_es.shared import event_bus
 from cqrs_es.shared.event_store import append_event, get_next_version
+from cqrs_es.shared.id_sequence import next_id
+from cqrs_es.shared.unique_claims import claim, release
+from cqrs_es.write.aggregates.repository import load_story, load_user
 from cqrs_es.write.aggregates.social import FollowAggregate, StoryAggregate
 from cqrs_es.write.commands.commands import (
     CreateStory,
@@ -21,19 +18,10 @@ async def handle_follow_user(cmd: FollowUser) -> dict:
     if cmd.follower_id == cmd.following_id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot follow yourself")
 
-    result = await cmd.db.execute(
-        select(UserProjection).where(UserProjection.id == cmd.following_id)
-    )
-    if not result.scalar_one_or_none():
+    if (await load_user(cmd.db, cmd.following_id)).id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    existing = await cmd.db.execute(
-        select(FollowProjection).where(
-            FollowProjection.follower_id == cmd.follower_id,
-            FollowProjection.following_id == cmd.following_id,
-        )
-    )
-    if existing.scalar_one_or_none():
+    if not await claim(cmd.db, "follow", f"{cmd.follower_id}:{cmd.following_id}"):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Already following")
 
     event_type, event_data = FollowAggregate.follow(cmd.follower_id, cmd.following_id)
@@ -46,13 +34,7 @@ async def handle_follow_user(cmd: FollowUser) -> dict:
 
 
 async def handle_unfollow_user(cmd: UnfollowUser) -> dict:
-    existing = await cmd.db.execute(
-        select(FollowProjection).where(
-            FollowProjection.follower_id == cmd.follower_id,
-            FollowProjection.following_id == cmd.following_id,
-        )
-    )
-    if not existing.scalar_one_or_none():
+    if not await release(cmd.db, "follow", f"{cmd.follower_id}:{cmd.following_id}"):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Not following")
 
     event_type, event_data = FollowAggregate.unfollow(cmd.follower_id, cmd.following_id)
@@ -65,11 +47,7 @@ async def handle_unfollow_user(cmd: UnfollowUser) -> dict:
 
 
 async def handle_create_story(cmd: CreateStory) -> dict:
-    result = await cmd.db.execute(
-        select(StoryProjection.id).order_by(StoryProjection.id.desc()).limit(1)
-    )
-    max_id = result.scalar_one_or_none() or 0
-    story_id = max_id + 1
+    story_id = await next_id(cmd.db, "story")
 
     event_type, event_data = StoryAggregate.create(
         story_id, cmd.author_id, cmd.image_url, cmd.content
@@ -78,24 +56,18 @@ async def handle_create_story(cmd: CreateStory) -> dict:
     await append_event(cmd.db, "Story", str(story_id), event_type, event_data, version)
     await event_bus.publish(event_type, event_data, db=cmd.db)
 
-    result = await cmd.db.execute(
-        select(StoryProjection).where(StoryProjection.id == story_id)
-    )
-    story = result.scalar_one()
+    author = await load_user(cmd.db, cmd.author_id)
     return {
-        "id": story.id, "author_id": story.author_id,
-        "author_username": story.author_username,
-        "image_url": story.image_url, "content": story.content,
-        "created_at": story.created_at,
+        "id": story_id, "author_id": cmd.author_id,
+        "author_username": author.username if author.id is not None else None,
+        "image_url": cmd.image_url, "content": cmd.content,
+        "created_at": event_data["created_at"],
     }
 
 
 async def handle_delete_story(cmd: DeleteStory) -> None:
-    result = await cmd.db.execute(
-        select(StoryProjection).where(StoryProjection.id == cmd.story_id)
-    )
-    story = result.scalar_one_or_none()
-    if not story:
+    story = await load_story(cmd.db, cmd.story_id)
+    if story.id is None or story.deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Story not found")
     if story.author_id != cmd.user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your story")
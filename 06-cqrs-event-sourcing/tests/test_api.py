@@ -337,6 +337,40 @@ class TestMessage:
         )
         assert mark_resp.status_code == 200
 
+    async def test_inbox_summarizes_each_conversation(
+        self, auth_client: AsyncClient, second_user_token: str
+    ):
+        other_headers = {"Authorization": f"Bearer {second_user_token}"}
+        other_me = await auth_client.get("/api/auth/me", headers=other_headers)
+        other_id = other_me.json()["id"]
+        my_id = (await auth_client.get("/api/auth/me")).json()["id"]
+        await auth_client.post(f"/api/messages/{my_id}/read", headers=other_headers)
+
+        for content in ("First", "Second"):
+            await auth_client.post(
+                "/api/messages", json={"receiver_id": other_id, "content": content}
+            )
+
+        inbox = await auth_client.get("/api/messages", headers=other_headers)
+        (conversation,) = [c for c in inbox.json() if c["other_user_id"] == my_id]
+        assert conversation["unread_count"] == 2
+        assert conversation["last_message"]["content"] == "Second"
+        assert conversation["last_message"]["sender_id"] == my_id
+        assert conversation["last_message"]["receiver_id"] == other_id
+
+        mine = await auth_client.get("/api/messages", params={"limit": 1})
+        assert len(mine.json()) == 1
+        assert mine.json()[0]["other_user_id"] == other_id
+        assert mine.json()[0]["unread_count"] == 0
+        assert mine.json()[0]["last_message"]["is_read"] is False
+
+        await auth_client.post(f"/api/messages/{my_id}/read", headers=other_headers)
+        inbox = await auth_client.get("/api/messages", headers=other_headers)
+        (conversation,) = [c for c in inbox.json() if c["other_user_id"] == my_id]
+        assert conversation["unread_count"] == 0
+        mine = await auth_client.get("/api/messages", params={"limit": 1})
+        assert mine.json()[0]["last_message"]["is_read"] is True
+
 
 class TestNotification:
     async def test_list_notifications(self, auth_client: AsyncClient):
@@ -432,3 +466,848 @@ class TestSearch:
         assert resp.status_code == 200
         assert isinstance(resp.json(), list)
         assert len(resp.json()) >= 1
+
+    async def test_hashtags_resolve_in_bulk_through_warm_cache(
+        self, auth_client: AsyncClient
+    ):
+        from cqrs_es.read.projections.hashtag_cache import hashtag_cache
+        from cqrs_es.read.projections.handlers import _resolve_hashtags
+        from tests.conftest import test_session_factory
+
+        first = await auth_client.post(
+            "/api/posts",
+            json={"content": "#Bulk #bulk #warmtag twice", "image_url": None},
+        )
+        assert first.status_code == 201
+        cached = hashtag_cache.lookup(["bulk", "warmtag"])
+        assert set(cached) == {"bulk", "warmtag"}
+
+        second = await auth_client.post(
+            "/api/posts", json={"content": "#warmtag again", "image_url": None}
+        )
+        resp = await auth_client.get("/api/search/posts/hashtag/warmtag")
+        assert {p["id"] for p in resp.json()} >= {
+            first.json()["id"], second.json()["id"]
+        }
+
+        async with test_session_factory() as db:
+            ids = await _resolve_hashtags(db, ["warmtag", "rolledback"])
+            assert ids["warmtag"] == cached["warmtag"]
+            await db.rollback()
+        assert hashtag_cache.lookup(["rolledback"]) == {}
+
+
+class TestSnapshots:
+    async def test_post_snapshot_plus_tail_matches_full_replay(
+        self, auth_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        from cqrs_es.shared import event_store
+        from cqrs_es.write.aggregates.post import PostAggregate
+        from cqrs_es.write.aggregates.repository import load_post
+        from tests.conftest import test_session_factory
+
+        monkeypatch.setattr(event_store, "SNAPSHOT_INTERVAL", 4)
+        post = await auth_client.post(
+            "/api/posts", json={"content": "Snap", "image_url": None}
+        )
+        post_id = post.json()["id"]
+        for _ in range(4):
+            await auth_client.post(f"/api/posts/{post_id}/likes")
+        await auth_client.post(
+            f"/api/posts/{post_id}/comments", json={"content": "tail"}
+        )
+
+        async with test_session_factory() as db:
+            snapshot = await event_store.load_snapshot(db, "Post", str(post_id))
+            assert snapshot["version"] == 4
+
+            replayed = PostAggregate()
+            for event in await event_store.load_events(db, "Post", str(post_id)):
+                replayed.apply(event["event_type"], event["event_data"])
+            loaded = await load_post(db, post_id)
+
+        assert loaded.version == replayed.version == 6
+        assert loaded.likes == replayed.likes == set()
+        assert loaded.comments == replayed.comments
+        assert len(loaded.comments) == 1
+
+
+class TestConcurrency:
+    async def test_stale_expected_version_is_rejected(self):
+        from cqrs_es.shared.event_store import (
+            ConcurrencyError,
+            append_event,
+            get_next_version,
+        )
+        from tests.conftest import test_session_factory
+
+        async with test_session_factory() as db:
+            await append_event(db, "Test", "occ", "Ping", {}, expected_version=0)
+            await append_event(db, "Test", "occ", "Ping", {}, expected_version=1)
+            assert await get_next_version(db, "Test", "occ") == 3
+            with pytest.raises(ConcurrencyError):
+                await append_event(db, "Test", "occ", "Ping", {}, expected_version=1)
+            with pytest.raises(ConcurrencyError):
+                await append_event(db, "Test", "occ", "Ping", {}, version=1)
+            await db.rollback()
+
+    async def test_stream_without_head_is_seeded_from_stored_events(self):
+        from sqlalchemy import delete
+
+        from cqrs_es.shared.event_store import (
+            ConcurrencyError,
+            StreamHeadModel,
+            append_event,
+            get_next_version,
+        )
+        from tests.conftest import test_session_factory
+
+        async with test_session_factory() as db:
+            for _ in range(3):
+                await append_event(db, "Test", "legacy", "Ping", {})
+            # As if the stream was written before heads existed.
+            await db.execute(
+                delete(StreamHeadModel).where(StreamHeadModel.aggregate_id == "legacy")
+            )
+            assert await get_next_version(db, "Test", "legacy") == 4
+            with pytest.raises(ConcurrencyError):
+                await append_event(db, "Test", "legacy", "Ping", {}, expected_version=0)
+            entry = await append_event(db, "Test", "legacy", "Ping", {}, version=4)
+            assert entry.version == 4
+            await db.execute(
+                delete(StreamHeadModel).where(StreamHeadModel.aggregate_id == "legacy")
+            )
+            entry = await append_event(db, "Test", "legacy", "Ping", {})
+            assert entry.version == 5
+            await db.rollback()
+
+    async def test_command_bus_retries_on_conflict(self):
+        from dataclasses import dataclass
+
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        from cqrs_es.shared import command_bus
+        from cqrs_es.shared.event_store import append_event
+        from tests.conftest import test_session_factory
+
+        @dataclass
+        class Bump:
+            db: AsyncSession
+
+        attempts = []
+
+        async def handle_bump(cmd: Bump) -> int:
+            attempts.append(1)
+            # The first attempt works from a version someone else already took.
+            expected = 0 if len(attempts) == 1 else 1
+            entry = await append_event(
+                cmd.db, "Test", "retry", "Bump", {}, expected_version=expected
+            )
+            return entry.version
+
+        async with test_session_factory() as db:
+            await append_event(db, "Test", "retry", "Bump", {})
+            await db.commit()
+
+        command_bus.register_command_handler(Bump, handle_bump)
+        async with test_session_factory() as db:
+            assert await command_bus.dispatch_command(Bump(db=db)) == 2
+            await db.commit()
+        assert len(attempts) == 2
+
+
+class TestCommandBatching:
+    async def test_concurrent_likes_share_one_batch(
+        self,
+        auth_client: AsyncClient,
+        second_user_token: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        import asyncio
+
+        from cqrs_es.shared import command_bus, event_store
+        from cqrs_es.write.commands.commands import ToggleLike
+        from tests.conftest import test_session_factory
+
+        monkeypatch.setattr(event_store, "SNAPSHOT_INTERVAL", 4)
+        post = await auth_client.post(
+            "/api/posts", json={"content": "Viral", "image_url": None}
+        )
+        post_id = post.json()["id"]
+        me = (await auth_client.get("/api/auth/me")).json()["id"]
+        other_me = await auth_client.get(
+            "/api/auth/me", headers={"Authorization": f"Bearer {second_user_token}"}
+        )
+        other = other_me.json()["id"]
+
+        batcher = command_bus.get_batcher(ToggleLike)
+        batches = batcher.batches
+        users = [me, other, me, me, other]
+        sessions = [test_session_factory() for _ in users]
+        try:
+            results = await asyncio.gather(*(
+                command_bus.dispatch_command(
+                    ToggleLike(post_id=post_id, user_id=user_id, db=db)
+                )
+                for user_id, db in zip(users, sessions)
+            ))
+        finally:
+            for db in sessions:
+                await db.close()
+
+        assert batcher.batches == batches + 1
+        assert [(r["liked"], r["like_count"]) for r in results] == [
+            (True, 1), (True, 2), (False, 1), (True, 2), (False, 1),
+        ]
+        positions = {db.info[event_store.LAST_POSITION_KEY] for db in sessions}
+        assert len(positions) == 1
+
+        async with test_session_factory() as db:
+            events = await event_store.load_events(db, "Post", str(post_id))
+            snapshot = await event_store.load_snapshot(db, "Post", str(post_id))
+        assert [e["version"] for e in events] == [1, 2, 3, 4, 5, 6]
+        assert snapshot["version"] == 6
+        assert snapshot["state"]["likes"] == [me]
+
+        resp = await auth_client.get(f"/api/posts/{post_id}")
+        assert resp.json()["like_count"] == 1
+
+
+    async def test_idle_key_runs_without_waiting_for_the_window(self):
+        import asyncio
+        from dataclasses import dataclass
+
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        from cqrs_es.shared.command_batcher import BatchPolicy, CommandBatcher
+        from tests.conftest import test_session_factory
+
+        @dataclass
+        class Bump:
+            value: int
+            db: AsyncSession
+
+        batches = []
+        release = asyncio.Event()
+
+        async def handle_bumps(commands, db):
+            batches.append([c.value for c in commands])
+            if len(batches) == 1:
+                await release.wait()
+            return [c.value for c in commands]
+
+        batcher = CommandBatcher(BatchPolicy(handle_bumps, key=lambda c: 0, window=60))
+        async with test_session_factory() as db:
+            first = asyncio.ensure_future(batcher.submit(Bump(1, db)))
+            while not batches:
+                await asyncio.sleep(0)
+            # Commands behind the batch in flight run as soon as it is done.
+            queued = [asyncio.ensure_future(batcher.submit(Bump(v, db))) for v in (2, 3)]
+            await asyncio.sleep(0.01)
+            assert batches == [[1]]
+            release.set()
+            results = await asyncio.wait_for(asyncio.gather(first, *queued), 1)
+        assert results == [1, 2, 3]
+        assert batches == [[1], [2, 3]]
+
+    async def test_batch_subscriber_steps_aside_for_other_subscribers(self):
+        from cqrs_es.main import _register_event_subscribers
+        from cqrs_es.shared import event_bus
+
+        seen = []
+
+        async def on_each(data, **kwargs):
+            seen.append(("each", data["n"]))
+
+        async def on_other(data, **kwargs):
+            seen.append(("other", data["n"]))
+
+        async def on_run(events, **kwargs):
+            seen.append(("run", [data["n"] for _, data in events]))
+
+        events = [("Bumped", {"n": 1}), ("Bumped", {"n": 2})]
+        event_bus.clear_subscribers()
+        try:
+            event_bus.subscribe("Bumped", on_each)
+            event_bus.subscribe("Bumped", on_other)
+            with pytest.raises(ValueError):
+                event_bus.subscribe_batch(("Bumped",), on_run, replaces=(on_each,))
+
+            event_bus.clear_subscribers()
+            event_bus.subscribe("Bumped", on_each)
+            event_bus.subscribe_batch(("Bumped",), on_run, replaces=(on_each,))
+            await event_bus.dispatch_many(events)
+            assert seen == [("run", [1, 2])]
+
+            # A subscriber added later is not skipped.
+            seen.clear()
+            event_bus.subscribe("Bumped", on_other)
+            await event_bus.dispatch_many(events)
+            assert seen == [("each", 1), ("other", 1), ("each", 2), ("other", 2)]
+        finally:
+            _register_event_subscribers()
+
+
+@pytest.fixture
+async def async_projections():
+    """Run the read model on a projection runner, as the app does unless
+    ``CQRS_ASYNC_PROJECTIONS=0``."""
+    from cqrs_es.main import _apply_read_model
+    from cqrs_es.shared import event_bus, projection_runner
+    from tests.conftest import test_session_factory
+
+    runner = projection_runner.ProjectionRunner(
+        "test_read_model", _apply_read_model,
+        session_factory=test_session_factory, poll_interval=0.05,
+    )
+    async with test_session_factory() as db:
+        await runner.reset(await projection_runner.head_position(db))
+    projection_runner.register_runner(runner)
+    event_bus.defer()
+    runner.start()
+    try:
+        yield runner
+    finally:
+        event_bus.defer(False)
+        await runner.stop()
+        projection_runner.unregister_runner("test_read_model")
+
+
+class TestProjectionRunner:
+    async def test_async_projection_with_read_your_writes(
+        self, auth_client: AsyncClient, async_projections
+    ):
+        resp = await auth_client.post(
+            "/api/posts", json={"content": "Later #async", "image_url": None}
+        )
+        assert resp.status_code == 201
+        position = resp.headers["x-event-position"]
+        post_id = resp.json()["id"]
+
+        resp = await auth_client.get(
+            f"/api/posts/{post_id}", headers={"X-Min-Position": position}
+        )
+        assert resp.status_code == 200
+        assert resp.json()["content"] == "Later #async"
+        assert async_projections.position >= int(position)
+        assert await async_projections.load_checkpoint() >= int(position)
+
+    async def test_commands_see_earlier_commands(
+        self, client: AsyncClient, async_projections
+    ):
+        resp = await client.post(
+            "/api/auth/register",
+            json={
+                "username": "asyncuser",
+                "email": "async@example.com",
+                "password": "password123",
+            },
+        )
+        assert resp.status_code == 201
+        resp = await client.post(
+            "/api/auth/login",
+            json={"email": "async@example.com", "password": "password123"},
+        )
+        assert resp.status_code == 200
+        headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+        post = await client.post(
+            "/api/posts", json={"content": "Right away", "image_url": None},
+            headers=headers,
+        )
+        resp = await client.post(
+            f"/api/posts/{post.json()['id']}/comments",
+            json={"content": "First"}, headers=headers,
+        )
+        assert resp.status_code == 201
+
+    async def test_concurrent_duplicate_registrations(
+        self, client: AsyncClient, async_projections
+    ):
+        import asyncio
+
+        body = {
+            "username": "raceuser",
+            "email": "race@example.com",
+            "password": "password123",
+        }
+        responses = await asyncio.gather(
+            client.post("/api/auth/register", json=body),
+            client.post("/api/auth/register", json=body),
+        )
+        assert sorted(r.status_code for r in responses) == [201, 400]
+
+    async def test_backfill_claims_covers_older_accounts(self, client: AsyncClient):
+        from cqrs_es.shared import event_store, security
+        from cqrs_es.shared.id_sequence import next_id
+        from cqrs_es.write.aggregates.claims import backfill_claims
+        from cqrs_es.write.aggregates.user import UserAggregate
+        from tests.conftest import test_engine, test_session_factory
+
+        # Registered before emails were claimed: only the event exists.
+        async with test_session_factory() as db:
+            user_id = await next_id(db, "user")
+            await event_store.append_event(
+                db, "User", str(user_id),
+                *UserAggregate.register(
+                    user_id, "olduser", "old@example.com",
+                    security.hash_password("password123"), None,
+                ),
+            )
+            await db.commit()
+        async with test_engine.begin() as conn:
+            await backfill_claims(conn)
+
+        resp = await client.post(
+            "/api/auth/register",
+            json={
+                "username": "newuser",
+                "email": "old@example.com",
+                "password": "password123",
+            },
+        )
+        assert resp.status_code == 400
+        resp = await client.post(
+            "/api/auth/login",
+            json={"email": "old@example.com", "password": "password123"},
+        )
+        assert resp.status_code == 200
+
+    async def test_inline_read_model_is_adopted_at_head(self):
+        from sqlalchemy import select
+
+        from cqrs_es.shared import projection_runner
+        from cqrs_es.shared.projection_runner import ProjectionCheckpoint
+        from tests.conftest import test_engine
+
+        async def checkpoint(conn):
+            result = await conn.execute(
+                select(ProjectionCheckpoint.position).where(
+                    ProjectionCheckpoint.name == "test_adopted"
+                )
+            )
+            return result.scalar_one_or_none()
+
+        async with test_engine.begin() as conn:
+            head = await projection_runner.head_position(conn)
+            await projection_runner.adopt_checkpoint(conn, "test_adopted")
+            assert await checkpoint(conn) == head
+            await projection_runner._save_checkpoint(conn, "test_adopted", 1)
+            await projection_runner.adopt_checkpoint(conn, "test_adopted")
+            assert await checkpoint(conn) == 1
+            await projection_runner.drop_checkpoint(conn, "test_adopted")
+            assert await checkpoint(conn) is None
+
+    async def test_failing_event_is_dead_lettered(
+        self, auth_client: AsyncClient, second_user_token: str, async_projections
+    ):
+        from sqlalchemy import delete, select
+
+        from cqrs_es.shared import event_store
+        from cqrs_es.shared.projection_runner import ProjectionDeadLetter
+        from cqrs_es.write.events.events import USER_FOLLOWED
+        from tests.conftest import test_session_factory
+
+        me = (await auth_client.get("/api/auth/me")).json()["id"]
+        other = await auth_client.get(
+            "/api/auth/me", headers={"Authorization": f"Bearer {second_user_token}"}
+        )
+        other_id = other.json()["id"]
+        await auth_client.post(f"/api/follow/{other_id}")
+
+        # A second follow that slipped past the command's checks.
+        async with test_session_factory() as db:
+            await event_store.append_event(
+                db, "Follow", str(me), USER_FOLLOWED,
+                {"follower_id": me, "following_id": other_id},
+            )
+            await db.commit()
+            position = db.info[event_store.LAST_POSITION_KEY]
+
+        resp = await auth_client.post(
+            "/api/posts", json={"content": "After poison", "image_url": None}
+        )
+        assert resp.status_code == 201
+        resp = await auth_client.get(
+            f"/api/posts/{resp.json()['id']}",
+            headers={"X-Min-Position": resp.headers["x-event-position"]},
+        )
+        assert resp.status_code == 200
+
+        async with test_session_factory() as db:
+            result = await db.execute(
+                select(ProjectionDeadLetter).where(
+                    ProjectionDeadLetter.position == position
+                )
+            )
+            dead = result.scalar_one()
+            # Keep later replays of the shared store clean.
+            await db.execute(
+                delete(event_store.EventStoreModel).where(
+                    event_store.EventStoreModel.id == position
+                )
+            )
+            await db.commit()
+        assert dead.name == "test_read_model"
+        assert dead.event_type == USER_FOLLOWED
+        assert "IntegrityError" in dead.error
+
+
+class TestRebuild:
+    async def test_rebuild_repairs_corrupted_projections(
+        self, auth_client: AsyncClient
+    ):
+        from sqlalchemy import func, select, update
+
+        from cqrs_es.read.projections.models import PostProjection
+        from cqrs_es.rebuild import rebuild_projections
+        from cqrs_es.shared.event_store import EventStoreModel
+        from tests.conftest import test_engine, test_session_factory
+
+        post = await auth_client.post(
+            "/api/posts", json={"content": "Rebuild #me", "image_url": None}
+        )
+        post_id = post.json()["id"]
+        await auth_client.post(f"/api/posts/{post_id}/likes")
+
+        async with test_session_factory() as db:
+            await db.execute(
+                update(PostProjection)
+                .where(PostProjection.id == post_id)
+                .values(like_count=99, content="corrupted")
+            )
+            await db.commit()
+            total = (await db.execute(select(func.count(EventStoreModel.id)))).scalar_one()
+
+        reports = []
+        stats = await rebuild_projections(
+            test_engine, batch_size=7,
+            progress=lambda applied, target, elapsed: reports.append(applied),
+        )
+        assert stats.events == total
+        assert reports and reports == sorted(reports)
+
+        resp = await auth_client.get(f"/api/posts/{post_id}")
+        assert resp.json()["like_count"] == 1
+        assert resp.json()["content"] == "Rebuild #me"
+        resp = await auth_client.get("/api/search/posts/hashtag/me")
+        assert [p["id"] for p in resp.json()] == [post_id]
+
+
+    async def test_bulk_writer_writes_buffered_rows_before_reads(self):
+        from sqlalchemy import func, select
+
+        from cqrs_es.read.projections.models import CommentProjection
+        from cqrs_es.rebuild import BulkWriter
+        from tests.conftest import test_session_factory
+
+        async with test_session_factory() as session:
+            db = BulkWriter(session)
+            for comment_id in (-1, -2):
+                db.add(CommentProjection(
+                    id=comment_id, post_id=-1, author_id=-1, content="buffered"
+                ))
+            await db.flush()
+            count = select(func.count()).where(CommentProjection.post_id == -1)
+            assert await db.scalar(count) == 2
+            db.add(CommentProjection(id=-3, post_id=-1, author_id=-1, content="x"))
+            assert (await db.get(CommentProjection, -3)).content == "x"
+            # Methods it does not define are not passed to the session.
+            with pytest.raises(AttributeError):
+                db.refresh
+            await db.rollback()
+
+class TestEventCodec:
+    async def test_binary_events_and_legacy_json_rows(self):
+        import json
+
+        from sqlalchemy import text
+
+        from cqrs_es.shared.event_codec import decode_event, encode_event
+        from cqrs_es.shared.event_store import (
+            append_event,
+            load_events,
+            upgrade_event_data,
+        )
+        from tests.conftest import test_session_factory
+
+        like = {"post_id": 7, "user_id": -3, "post_author_id": 12}
+        encoded = encode_event("LikeAdded", like)
+        assert isinstance(encoded, bytes)
+        assert len(encoded) < len(json.dumps(like))
+        assert decode_event(encoded) == like
+
+        partial = {"user_id": 1, "bio": "hi"}
+        assert encode_event("UserUpdated", partial) == json.dumps(partial).encode()
+
+        async with test_session_factory() as db:
+            # A row from when event_data was a Text column, stored as text.
+            await db.execute(
+                text(
+                    "INSERT INTO event_store (aggregate_type, aggregate_id,"
+                    " event_type, event_data, version, created_at)"
+                    " VALUES ('Codec', '1', 'LikeAdded', :data, 1,"
+                    " '2024-01-01 00:00:00.000000')"
+                ),
+                {"data": json.dumps(like)},
+            )
+            await append_event(db, "Codec", "1", "LikeRemoved", {"post_id": 7, "user_id": -3})
+            await append_event(db, "Codec", "1", "UserUpdated", partial)
+            await upgrade_event_data(await db.connection())
+            kinds = await db.execute(
+                text("SELECT DISTINCT typeof(event_data) FROM event_store")
+            )
+            assert kinds.scalars().all() == ["blob"]
+            events = await load_events(db, "Codec", "1")
+            await db.rollback()
+
+        assert [e["event_data"] for e in events] == [
+            like, {"post_id": 7, "user_id": -3}, partial,
+        ]
+
+
+class TestIdAllocator:
+    async def test_ids_come_from_reserved_blocks(self):
+        from sqlalchemy import select
+
+        from cqrs_es.shared.id_sequence import IdAllocator, IdSequenceModel
+        from tests.conftest import test_session_factory
+
+        allocator = IdAllocator(block_size=3)
+        async with test_session_factory() as db:
+            ids = [await allocator.next_id(db, "test_block") for _ in range(7)]
+            # Reservations commit on their own, whatever the caller does.
+            await db.rollback()
+            hi = (await db.execute(
+                select(IdSequenceModel.value).where(IdSequenceModel.name == "test_block")
+            )).scalar_one()
+
+        assert ids == list(range(1, 8))
+        assert allocator.reservations == 3
+        assert hi == 9
+
+        fresh = IdAllocator(block_size=3)
+        async with test_session_factory() as db:
+            assert await fresh.next_id(db, "test_block") == 10
+
+
+class TestQueryCache:
+    async def test_post_reads_are_cached_until_projection_changes(
+        self, auth_client: AsyncClient
+    ):
+        from cqrs_es.shared.query_cache import query_cache
+
+        stats = query_cache.stats["GetPost"]
+        post = await auth_client.post(
+            "/api/posts", json={"content": "Cache me", "image_url": None}
+        )
+        post_id = post.json()["id"]
+
+        await auth_client.get(f"/api/posts/{post_id}")
+        hits = stats.hits
+        resp = await auth_client.get(f"/api/posts/{post_id}")
+        assert resp.json()["like_count"] == 0
+        assert stats.hits == hits + 1
+
+        await auth_client.post(f"/api/posts/{post_id}/likes")
+        misses = stats.misses
+        resp = await auth_client.get(f"/api/posts/{post_id}")
+        assert resp.json()["like_count"] == 1
+        assert stats.misses == misses + 1
+        assert 0 < stats.hit_ratio < 1
+
+    async def test_ttl_and_size_limit(self):
+        from dataclasses import dataclass
+
+        from cqrs_es.shared.query_cache import CachePolicy, QueryCache
+
+        @dataclass
+        class Probe:
+            key: int
+            db: object = None
+
+        cache = QueryCache()
+        cache.configure(Probe, CachePolicy(ttl=60, max_entries=2, tags=lambda q: []))
+        for key in range(3):
+            cache.put(Probe(key), key)
+        assert cache.get(Probe(0)) == (False, None)
+        assert cache.get(Probe(2)) == (True, 2)
+        assert cache.stats["Probe"].evictions == 1
+
+        cache.configure(Probe, CachePolicy(ttl=0, max_entries=2, tags=lambda q: []))
+        cache.put(Probe(1), 1)
+        assert cache.get(Probe(1)) == (False, None)
+
+
+    async def test_result_invalidated_during_read_is_not_cached(self, monkeypatch):
+        from dataclasses import dataclass
+
+        from cqrs_es.shared import query_cache as query_cache_module
+        from cqrs_es.shared.query_cache import CachePolicy, QueryCache
+
+        @dataclass
+        class Probe:
+            key: int
+            db: object = None
+
+        cache = QueryCache()
+        cache.configure(
+            Probe, CachePolicy(ttl=60, max_entries=10, tags=lambda q: [("probe", q.key)])
+        )
+        token = cache.token()
+        # A projection changes row 1 while both reads are in flight.
+        cache.invalidate(("probe", 1))
+        cache.put(Probe(1), "old", token)
+        cache.put(Probe(2), "fresh", token)
+        assert cache.get(Probe(1)) == (False, None)
+        assert cache.get(Probe(2)) == (True, "fresh")
+
+        token = cache.token()
+        monkeypatch.setattr(query_cache_module, "MAX_TRACKED_TAGS", 1)
+        cache.invalidate(("probe", 3), ("probe", 4))
+        # The stamps were dropped, so a read from before cannot be trusted.
+        cache.put(Probe(5), "unknown", token)
+        assert cache.get(Probe(5)) == (False, None)
+        cache.put(Probe(5), "after", cache.token())
+        assert cache.get(Probe(5)) == (True, "after")
+
+class TestEventSubscriptions:
+    async def test_sse_catch_up_resumes_after_last_event_id(
+        self, auth_client: AsyncClient
+    ):
+        resp = await auth_client.post(
+            "/api/posts", json={"content": "Streamed", "image_url": None}
+        )
+        position = int(resp.headers["x-event-position"])
+
+        resp = await auth_client.get(
+            "/api/events/stream",
+            params={"follow": "false"},
+            headers={"Last-Event-ID": str(position - 1)},
+        )
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        frames = [f for f in resp.text.split("\n\n") if f]
+        assert frames[0].startswith(f"id: {position}\nevent: PostCreated\n")
+        assert '"Streamed"' in frames[0]
+
+        resp = await auth_client.get(
+            "/api/events/stream", params={"follow": "false", "types": "UserRegistered"}
+        )
+        assert "event: UserRegistered" in resp.text
+        assert "event: PostCreated" not in resp.text
+        assert "hashed_password" not in resp.text
+
+    async def test_subscription_switches_from_catch_up_to_live(
+        self, auth_client: AsyncClient
+    ):
+        import asyncio
+
+        from cqrs_es.shared.subscriptions import subscribe
+        from tests.conftest import test_engine
+
+        resp = await auth_client.post(
+            "/api/posts", json={"content": "Before", "image_url": None}
+        )
+        start = int(resp.headers["x-event-position"]) - 1
+        events = subscribe(test_engine, start, batch_size=2)
+        try:
+            first = await asyncio.wait_for(anext(events), 5)
+            assert first.position == start + 1
+
+            pending = asyncio.ensure_future(anext(events))
+            await asyncio.sleep(0.05)
+            assert not pending.done()
+            resp = await auth_client.post(
+                "/api/posts", json={"content": "Live", "image_url": None}
+            )
+            live = await asyncio.wait_for(pending, 5)
+            assert live.position == int(resp.headers["x-event-position"])
+            assert live.event_data["content"] == "Live"
+        finally:
+            await events.aclose()
+
+
+class TestEventArchive:
+    async def test_old_events_move_to_segments_and_still_replay(
+        self,
+        auth_client: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path,
+    ):
+        from datetime import datetime, timedelta, timezone
+
+        from sqlalchemy import select, update
+
+        from cqrs_es.archive import archive_events
+        from cqrs_es.rebuild import rebuild_projections
+        from cqrs_es.shared import event_store
+        from cqrs_es.shared.event_archive import EventArchive
+        from cqrs_es.shared.event_store import EventStoreModel
+        from cqrs_es.shared.projection_runner import ProjectionCheckpoint, head_position
+        from cqrs_es.shared.subscriptions import subscribe
+        from cqrs_es.write.aggregates.repository import load_post
+        from tests.conftest import test_engine, test_session_factory
+
+        monkeypatch.setattr(event_store, "SNAPSHOT_INTERVAL", 4)
+        post = await auth_client.post(
+            "/api/posts", json={"content": "Cold", "image_url": None}
+        )
+        post_id = post.json()["id"]
+        for _ in range(4):
+            await auth_client.post(f"/api/posts/{post_id}/likes")
+        await auth_client.post(
+            f"/api/posts/{post_id}/comments", json={"content": "recent"}
+        )
+
+        stream = (
+            EventStoreModel.aggregate_type == "Post",
+            EventStoreModel.aggregate_id == str(post_id),
+        )
+        async with test_session_factory() as db:
+            await db.execute(
+                update(EventStoreModel)
+                .where(*stream)
+                .values(created_at=datetime.now(timezone.utc) - timedelta(days=400))
+            )
+            # Runners are stopped in tests; treat them as caught up.
+            await db.execute(
+                update(ProjectionCheckpoint).values(position=await head_position(db))
+            )
+            await db.commit()
+
+        archive = EventArchive(tmp_path, block_events=2)
+        try:
+            stats = await archive_events(test_engine, archive)
+            assert stats.events == 4
+            assert (await archive_events(test_engine, archive)).events == 0
+
+            archived = [
+                e for e in archive.iter_events() if e.aggregate_id == str(post_id)
+            ]
+            assert [e.version for e in archived] == [1, 2, 3, 4]
+            assert archived[0].event_type == "PostCreated"
+            assert archived[0].event_data["content"] == "Cold"
+            async with test_session_factory() as db:
+                result = await db.execute(
+                    select(EventStoreModel.version).where(*stream)
+                )
+                assert sorted(result.scalars()) == [5, 6]
+                loaded = await load_post(db, post_id)
+            assert loaded.version == 6
+            assert len(loaded.comments) == 1
+
+            await rebuild_projections(test_engine, archive=archive)
+            resp = await auth_client.get(f"/api/posts/{post_id}")
+            assert resp.json()["content"] == "Cold"
+            assert resp.json()["like_count"] == 0
+
+            replayed = [
+                e async for e in subscribe(
+                    test_engine, archived[0].position - 1, live=False, archive=archive
+                )
+            ]
+            positions = [e.position for e in replayed]
+            assert positions == sorted(set(positions))
+            assert {e.position for e in archived} <= set(positions)
+        finally:
+            archive.close()
@@ -0,0 +1,102 @@
+"""Slice statement benchmark: CPU per call with and without SliceStatement.
+
+Runs the get_post, get_profile and get_comments queries under cProfile on a
+small in-memory database, once building the statement on every call as the
+slices used to, and once executing their cached ``SliceStatement``.
+
+    uv run python benchmarks/slice_statements.py [--calls 2000] [--top 0]
+"""
+import argparse
+import asyncio
+import cProfile
+import pstats
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+from vertical_slice.features.comment.get_comments import COMMENTS  # noqa: E402
+from vertical_slice.features.post.get_post import POST  # noqa: E402
+from vertical_slice.features.user.get_profile import PROFILE  # noqa: E402
+from vertical_slice.models.base import Base  # noqa: E402
+from vertical_slice.models.tables import Comment, Follow, Like, Post, User  # noqa: E402
+
+QUERIES = {
+    "get_post": (POST, {"post_id": 1}),
+    "get_profile": (PROFILE, {"user_id": 1}),
+    "get_comments": (COMMENTS, {"post_id": 1, "limit": 50, "offset": 0}),
+}
+
+
+async def seed(db: AsyncSession) -> None:
+    users = [
+        User(username=f"user{i}", email=f"user{i}@example.com", hashed_password="x")
+        for i in range(1, 21)
+    ]
+    db.add_all(users)
+    await db.flush()
+    db.add(Post(author_id=1, content="Benchmark post #bench"))
+    await db.flush()
+    for user in users[1:]:
+        db.add_all([
+            Like(post_id=1, user_id=user.id),
+            Comment(post_id=1, author_id=user.id, content="Nice"),
+            Follow(follower_id=user.id, following_id=1),
+        ])
+    await db.commit()
+
+
+async def run(db: AsyncSession, statement, params: dict, calls: int, rebuild: bool):
+    for _ in range(calls):
+        if rebuild:
+            result = await db.execute(statement.build(), params)
+        else:
+            result = await statement.execute(db, **params)
+        result.all()
+
+
+def profile(loop, db, statement, params, calls, rebuild) -> pstats.Stats:
+    loop.run_until_complete(run(db, statement, params, 10, rebuild))
+    profiler = cProfile.Profile()
+    profiler.enable()
+    loop.run_until_complete(run(db, statement, params, calls, rebuild))
+    profiler.disable()
+    return pstats.Stats(profiler)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument(
+        "--top", type=int, default=0, help="also print the N costliest functions"
+    )
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    engine = create_async_engine("sqlite+aiosqlite://")
+
+    async def setup() -> AsyncSession:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        db = AsyncSession(engine)
+        await seed(db)
+        return db
+
+    db = loop.run_until_complete(setup())
+    print(f"{'slice':<14}{'mode':<10}{'us/call':>10}{'calls/call':>12}")
+    for name, (statement, params) in QUERIES.items():
+        for mode, rebuild in (("rebuilt", True), ("cached", False)):
+            stats = profile(loop, db, statement, params, args.calls, rebuild)
+            per_call = stats.total_tt / args.calls * 1e6
+            functions = stats.total_calls / args.calls
+            print(f"{name:<14}{mode:<10}{per_call:>10,.0f}{functions:>12,.0f}")
+            if args.top:
+                stats.sort_stats("cumulative").print_stats(args.top)
+    loop.run_until_complete(db.close())
+    loop.run_until_complete(engine.dispose())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import os
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import Response
+from fastapi.exceptions import ResponseValidationError
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_json
+
+# Debug mode checks every response against its route's response_model, as
+# FastAPI does by default. Otherwise slice results are trusted to match it.
+VALIDATE_RESPONSES = os.getenv("VERTICAL_SLICE_DEBUG", "").lower() in ("1", "true")
+
+
+def validate_response(adapter: TypeAdapter, result: Any) -> Any:
+    try:
+        return adapter.validate_python(result, from_attributes=True)
+    except ValidationError as exc:
+        raise ResponseValidationError(exc.errors(include_url=False)) from exc
+
+
+class SliceRoute(APIRoute):
+    """Writes whatever the endpoint returns straight to JSON bytes.
+
+    Endpoints return slice dataclasses as they are; pydantic-core encodes
+    them in one pass instead of copying them with ``asdict``, validating the
+    copy against ``response_model`` and encoding the result. The model still
+    documents the endpoint and is enforced when ``VALIDATE_RESPONSES`` is on.
+    Responses returned by the endpoint are passed through untouched.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, self._encoding(endpoint), **kwargs)
+
+    @functools.cached_property
+    def _adapter(self) -> TypeAdapter | None:
+        return TypeAdapter(self.response_model) if self.response_model else None
+
+    def _encoding(self, endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(endpoint)
+        async def encode(*args: Any, **kwargs: Any) -> Any:
+            result = await endpoint(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+            if VALIDATE_RESPONSES and self._adapter is not None:
+                content = self._adapter.dump_json(
+                    validate_response(self._adapter, result)
+                )
+            else:
+                content = to_json(result)
+            return Response(
+                content, status_code=self.status_code or 200, media_type="application/json"
+            )
+
+        # Resolved here, since the annotations refer to the endpoint's module.
+        encode.__signature__ = inspect.signature(endpoint, eval_str=True)
+        return encode
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-
-from fastapi import APIRouter, Depends, Response
-from sqlalchemy.ext.asyncio import AsyncSession
-
+import asyncio
+import logging
+from dataclasses import dataclass, field, fields
+from functools import cache
+from typing import Any, get_type_hints
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError, create_model
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from vertical_slice.api.responses import (
+    VALIDATE_RESPONSES,
+    SliceRoute,
+    validate_response,
+)
 from vertical_slice.api.schemas import (
+    BatchBody,
+    BatchItemBody,
+    BatchItemOut,
     CommentCreateBody,
     CommentOut,
     ConversationOut,
@@ -64,9 +78,11 @@ from vertical_slice.features.search.search_users import SearchUsersRequest
 from vertical_slice.features.search.search_hashtags import SearchHashtagsRequest
 from vertical_slice.features.search.get_posts_by_hashtag import GetPostsByHashtagRequest
 
+logger = logging.getLogger(__name__)
+
 # ── Auth ──
 
-auth_router = APIRouter(prefix="/api/auth", tags=["auth"])
+auth_router = APIRouter(prefix="/api/auth", tags=["auth"], route_class=SliceRoute)
 
 
 @auth_router.post("/register", response_model=UserOut, status_code=201)
@@ -75,30 +91,30 @@ async def register(body: UserCreateBody, db: AsyncSession = Depends(get_db)):
         username=body.username, email=body.email,
         password=body.password, full_name=body.full_name, db=db,
     ))
-    return asdict(result)
+    return result
 
 
 @auth_router.post("/login", response_model=TokenOut)
 async def login(body: LoginBody, db: AsyncSession = Depends(get_db)):
     result = await mediator.send(LoginRequest(email=body.email, password=body.password, db=db))
-    return asdict(result)
+    return result
 
 
 @auth_router.get("/me", response_model=UserOut)
 async def me(user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
     result = await mediator.send(GetMeRequest(user_id=user_id, db=db))
-    return asdict(result)
+    return result
 
 
 # ── User ──
 
-user_router = APIRouter(prefix="/api/users", tags=["users"])
+user_router = APIRouter(prefix="/api/users", tags=["users"], route_class=SliceRoute)
 
 
 @user_router.get("/{user_id}", response_model=UserProfileOut)
 async def get_profile(user_id: int, db: AsyncSession = Depends(get_db)):
     result = await mediator.send(GetProfileRequest(user_id=user_id, db=db))
-    return asdict(result)
+    return result
 
 
 @user_router.put("/me", response_model=UserOut)
@@ -106,30 +122,30 @@ async def update_me(body: UserUpdateBody, user_id: int = Depends(get_current_use
     result = await mediator.send(UpdateProfileRequest(
         user_id=user_id, data=body.model_dump(exclude_unset=True), db=db,
     ))
-    return asdict(result)
+    return result
 
 
 @user_router.get("/{user_id}/posts", response_model=list[PostOut])
 async def get_user_posts(user_id: int, limit: int = 20, offset: int = 0, db: AsyncSession = Depends(get_db)):
     result = await mediator.send(GetUserPostsRequest(user_id=user_id, limit=limit, offset=offset, db=db))
-    return [asdict(p) for p in result]
+    return result
 
 
 @user_router.get("/{user_id}/followers", response_model=list[UserOut])
 async def get_followers(user_id: int, db: AsyncSession = Depends(get_db)):
     result = await mediator.send(GetFollowersRequest(user_id=user_id, db=db))
-    return [asdict(u) for u in result]
+    return result
 
 
 @user_router.get("/{user_id}/following", response_model=list[UserOut])
 async def get_following(user_id: int, db: AsyncSession = Depends(get_db)):
     result = await mediator.send(GetFollowingRequest(user_id=user_id, db=db))
-    return [asdict(u) for u in result]
+    return result
 
 
 # ── Post ──
 
-post_router = APIRouter(prefix="/api/posts", tags=["posts"])
+post_router = APIRouter(prefix="/api/posts", tags=["posts"], route_class=SliceRoute)
 
 
 @post_router.post("", response_model=PostOut, status_code=201)
@@ -137,13 +153,13 @@ async def create_post(body: PostCreateBody, user_id: int = Depends(get_current_u
     result = await mediator.send(CreatePostRequest(
         author_id=user_id, content=body.content, image_url=body.image_url, db=db,
     ))
-    return asdict(result)
+    return result
 
 
 @post_router.get("/{post_id}", response_model=PostOut)
 async def get_post(post_id: int, db: AsyncSession = Depends(get_db)):
     result = await mediator.send(GetPostRequest(post_id=post_id, db=db))
-    return asdict(result)
+    return result
 
 
 @post_router.delete("/{post_id}", status_code=204)
@@ -159,13 +175,13 @@ async def create_comment(post_id: int, body: CommentCreateBody, user_id: int = D
     result = await mediator.send(CreateCommentRequest(
         post_id=post_id, author_id=user_id, content=body.content, db=db,
     ))
-    return asdict(result)
+    return result
 
 
 @post_router.get("/{post_id}/comments", response_model=list[CommentOut])
 async def get_comments(post_id: int, limit: int = 50, offset: int = 0, db: AsyncSession = Depends(get_db)):
     result = await mediator.send(GetCommentsRequest(post_id=post_id, limit=limit, offset=offset, db=db))
-    return [asdict(c) for c in result]
+    return result
 
 
 @post_router.delete("/comments/{comment_id}", status_code=204)
@@ -179,40 +195,44 @@ async def delete_comment(comment_id: int, user_id: int = Depends(get_current_use
 @post_router.post("/{post_id}/likes", response_model=LikeOut)
 async def toggle_like(post_id: int, user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
     result = await mediator.send(ToggleLikeRequest(post_id=post_id, user_id=user_id, db=db))
-    return asdict(result)
+    return result
 
 
 # ── Follow ──
 
-follow_router = APIRouter(prefix="/api/follow", tags=["follow"])
+follow_router = APIRouter(
+    prefix="/api/follow", tags=["follow"], route_class=SliceRoute
+)
 
 
 @follow_router.post("/{following_id}", response_model=FollowOut)
 async def follow_user(following_id: int, user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
     result = await mediator.send(FollowUserRequest(follower_id=user_id, following_id=following_id, db=db))
-    return asdict(result)
+    return result
 
 
 @follow_router.delete("/{following_id}", response_model=FollowOut)
 async def unfollow_user(following_id: int, user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
     result = await mediator.send(UnfollowUserRequest(follower_id=user_id, following_id=following_id, db=db))
-    return asdict(result)
+    return result
 
 
 # ── Feed ──
 
-feed_router = APIRouter(prefix="/api/feed", tags=["feed"])
+feed_router = APIRouter(prefix="/api/feed", tags=["feed"], route_class=SliceRoute)
 
 
 @feed_router.get("", response_model=list[PostOut])
 async def get_feed(limit: int = 20, offset: int = 0, user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
     result = await mediator.send(GetFeedRequest(user_id=user_id, limit=limit, offset=offset, db=db))
-    return [asdict(p) for p in result]
+    return result
 
 
 # ── Story ──
 
-story_router = APIRouter(prefix="/api/stories", tags=["stories"])
+story_router = APIRouter(
+    prefix="/api/stories", tags=["stories"], route_class=SliceRoute
+)
 
 
 @story_router.post("", response_model=StoryOut, status_code=201)
@@ -220,19 +240,19 @@ async def create_story(body: StoryCreateBody, user_id: int = Depends(get_current
     result = await mediator.send(CreateStoryRequest(
         author_id=user_id, image_url=body.image_url, content=body.content, db=db,
     ))
-    return asdict(result)
+    return result
 
 
 @story_router.get("", response_model=list[StoryOut])
 async def get_my_stories(user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
     result = await mediator.send(GetMyStoriesRequest(user_id=user_id, db=db))
-    return [asdict(s) for s in result]
+    return result
 
 
 @story_router.get("/feed", response_model=list[StoryOut])
 async def get_story_feed(user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
     result = await mediator.send(GetStoryFeedRequest(user_id=user_id, db=db))
-    return [asdict(s) for s in result]
+    return result
 
 
 @story_router.delete("/{story_id}", status_code=204)
@@ -243,7 +263,9 @@ async def delete_story(story_id: int, user_id: int = Depends(get_current_user_id
 
 # ── Message ──
 
-message_router = APIRouter(prefix="/api/messages", tags=["messages"])
+message_router = APIRouter(
+    prefix="/api/messages", tags=["messages"], route_class=SliceRoute
+)
 
 
 @message_router.post("", response_model=MessageOut, status_code=201)
@@ -251,13 +273,13 @@ async def send_message(body: MessageCreateBody, user_id: int = Depends(get_curre
     result = await mediator.send(SendMessageRequest(
         sender_id=user_id, receiver_id=body.receiver_id, content=body.content, db=db,
     ))
-    return asdict(result)
+    return result
 
 
 @message_router.get("", response_model=list[ConversationOut])
 async def get_conversations(user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
     result = await mediator.send(GetConversationsRequest(user_id=user_id, db=db))
-    return [asdict(c) for c in result]
+    return result
 
 
 @message_router.get("/{other_user_id}", response_model=list[MessageOut])
@@ -265,7 +287,7 @@ async def get_conversation(other_user_id: int, limit: int = 50, offset: int = 0,
     result = await mediator.send(GetConversationRequest(
         user_id=user_id, other_user_id=other_user_id, limit=limit, offset=offset, db=db,
     ))
-    return [asdict(m) for m in result]
+    return result
 
 
 @message_router.post("/{sender_id}/read", response_model=StatusOut)
@@ -276,13 +298,15 @@ async def mark_messages_read(sender_id: int, user_id: int = Depends(get_current_
 
 # ── Notification ──
 
-notification_router = APIRouter(prefix="/api/notifications", tags=["notifications"])
+notification_router = APIRouter(
+    prefix="/api/notifications", tags=["notifications"], route_class=SliceRoute
+)
 
 
 @notification_router.get("", response_model=list[NotificationOut])
 async def get_notifications(limit: int = 50, offset: int = 0, user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
     result = await mediator.send(GetNotificationsRequest(user_id=user_id, limit=limit, offset=offset, db=db))
-    return [asdict(n) for n in result]
+    return result
 
 
 @notification_router.post("/{notification_id}/read", response_model=StatusOut)
@@ -299,22 +323,138 @@ async def mark_all_read(user_id: int = Depends(get_current_user_id), db: AsyncSe
 
 # ── Search ──
 
-search_router = APIRouter(prefix="/api/search", tags=["search"])
+search_router = APIRouter(prefix="/api/search", tags=["search"], route_class=SliceRoute)
 
 
 @search_router.get("/users", response_model=list[UserOut])
 async def search_users(q: str = "", limit: int = 20, db: AsyncSession = Depends(get_db)):
     result = await mediator.send(SearchUsersRequest(query=q, limit=limit, db=db))
-    return [asdict(u) for u in result]
+    return result
 
 
 @search_router.get("/hashtags", response_model=list[HashtagOut])
 async def search_hashtags(q: str = "", limit: int = 20, db: AsyncSession = Depends(get_db)):
     result = await mediator.send(SearchHashtagsRequest(query=q, limit=limit, db=db))
-    return [asdict(h) for h in result]
+    return result
 
 
 @search_router.get("/posts/hashtag/{tag}", response_model=list[PostOut])
 async def get_posts_by_hashtag(tag: str, limit: int = 20, offset: int = 0, db: AsyncSession = Depends(get_db)):
     result = await mediator.send(GetPostsByHashtagRequest(tag=tag, limit=limit, offset=offset, db=db))
-    return [asdict(p) for p in result]
+    return result
+
+
+# ── Batch ──
+
+batch_router = APIRouter(prefix="/api/batch", tags=["batch"], route_class=SliceRoute)
+
+
+@dataclass(frozen=True)
+class BatchOperation:
+    request_type: type
+    response_model: Any
+    # Request field set to the caller's id instead of taken from params.
+    user_field: str | None = None
+    defaults: dict[str, Any] = field(default_factory=dict)
+
+
+PAGE = {"limit": 20, "offset": 0}
+LONG_PAGE = {"limit": 50, "offset": 0}
+
+# The read endpoints a batch can call, with the same defaults as their
+# query parameters. Writes are left out: a batch never commits.
+BATCH_OPERATIONS: dict[str, BatchOperation] = {
+    "me": BatchOperation(GetMeRequest, UserOut, "user_id"),
+    "profile": BatchOperation(GetProfileRequest, UserProfileOut),
+    "user_posts": BatchOperation(GetUserPostsRequest, list[PostOut], defaults=PAGE),
+    "followers": BatchOperation(GetFollowersRequest, list[UserOut]),
+    "following": BatchOperation(GetFollowingRequest, list[UserOut]),
+    "post": BatchOperation(GetPostRequest, PostOut),
+    "comments": BatchOperation(
+        GetCommentsRequest, list[CommentOut], defaults=LONG_PAGE
+    ),
+    "feed": BatchOperation(GetFeedRequest, list[PostOut], "user_id", PAGE),
+    "my_stories": BatchOperation(GetMyStoriesRequest, list[StoryOut], "user_id"),
+    "story_feed": BatchOperation(GetStoryFeedRequest, list[StoryOut], "user_id"),
+    "conversations": BatchOperation(
+        GetConversationsRequest, list[ConversationOut], "user_id"
+    ),
+    "conversation": BatchOperation(
+        GetConversationRequest, list[MessageOut], "user_id", LONG_PAGE
+    ),
+    "notifications": BatchOperation(
+        GetNotificationsRequest, list[NotificationOut], "user_id", LONG_PAGE
+    ),
+    "search_users": BatchOperation(
+        SearchUsersRequest, list[UserOut], defaults={"query": "", "limit": 20}
+    ),
+    "search_hashtags": BatchOperation(
+        SearchHashtagsRequest, list[HashtagOut], defaults={"query": "", "limit": 20}
+    ),
+    "posts_by_hashtag": BatchOperation(
+        GetPostsByHashtagRequest, list[PostOut], defaults=PAGE
+    ),
+}
+
+
+@cache
+def _batch_schemas(op: str) -> tuple[type[BaseModel], TypeAdapter]:
+    """The params model and response adapter of ``op``, built on first use."""
+    operation = BATCH_OPERATIONS[op]
+    hints = get_type_hints(operation.request_type)
+    params = {
+        f.name: (hints[f.name], operation.defaults.get(f.name, ...))
+        for f in fields(operation.request_type)
+        if f.name not in ("db", operation.user_field)
+    }
+    model = create_model(
+        f"{operation.request_type.__name__}Params",
+        __config__=ConfigDict(extra="forbid"),
+        **params,
+    )
+    return model, TypeAdapter(operation.response_model)
+
+
+async def _run_batch_item(
+    item: BatchItemBody, user_id: int, bind: AsyncEngine
+) -> BatchItemOut:
+    operation = BATCH_OPERATIONS.get(item.op)
+    if operation is None:
+        detail = f"Unknown operation {item.op!r}"
+        return BatchItemOut(status=404, body={"detail": detail})
+    params_model, response = _batch_schemas(item.op)
+    try:
+        params = params_model.model_validate(item.params).model_dump()
+    except ValidationError as exc:
+        return BatchItemOut(
+            status=422, body={"detail": jsonable_encoder(exc.errors(include_url=False))}
+        )
+    if operation.user_field:
+        params[operation.user_field] = user_id
+
+    async with AsyncSession(bind, expire_on_commit=False) as db:
+        try:
+            result = await mediator.send(operation.request_type(**params, db=db))
+        except HTTPException as exc:
+            return BatchItemOut(status=exc.status_code, body={"detail": exc.detail})
+        except Exception:
+            logger.exception("Batch operation %s failed", item.op)
+            return BatchItemOut(status=500, body={"detail": "Internal Server Error"})
+    if VALIDATE_RESPONSES:
+        result = response.dump_python(validate_response(response, result), mode="json")
+    return BatchItemOut(status=200, body=result)
+
+
+@batch_router.post("", response_model=list[BatchItemOut])
+async def batch(body: BatchBody, user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
+    """Run several read operations in one round trip.
+
+    The token is checked once and the items run concurrently through the
+    mediator, each on its own session over the request's engine: an
+    ``AsyncSession`` cannot run two queries at the same time. Results come
+    back in request order with a status per item, so one failing item does
+    not fail the others.
+    """
+    return await asyncio.gather(
+        *(_run_batch_item(item, user_id, db.bind) for item in body.requests)
+    )
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
+
+MAX_BATCH_SIZE = 20
 
 
 class UserCreateBody(BaseModel):
@@ -147,3 +150,17 @@ class HashtagOut(BaseModel):
 
 class StatusOut(BaseModel):
     status: str
+
+
+class BatchItemBody(BaseModel):
+    op: str
+    params: dict[str, Any] = {}
+
+
+class BatchBody(BaseModel):
+    requests: list[BatchItemBody] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class BatchItemOut(BaseModel):
+    status: int
+    body: Any
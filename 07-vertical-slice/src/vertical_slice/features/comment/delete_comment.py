@@ -15,12 +15,15 @@ class DeleteCommentRequest:
     db: AsyncSession
 
 
-async def delete_comment_handler(request: DeleteCommentRequest) -> None:
+async def delete_comment_handler(request: DeleteCommentRequest) -> int:
+    """Returns the comment's post id, whose cached reads the delete changes."""
     db = request.db
     comment = await db.get(Comment, request.comment_id)
     if not comment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
     if comment.author_id != request.user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your comment")
+    post_id = comment.post_id
     await db.delete(comment)
     await db.flush()
+    return post_id
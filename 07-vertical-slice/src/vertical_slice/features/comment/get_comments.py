@@ -3,10 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from vertical_slice.models.tables import Comment, User
+from vertical_slice.shared.statements import SliceStatement
 
 
 @dataclass
@@ -27,24 +28,28 @@ class CommentItem:
     created_at: datetime
 
 
+COMMENTS = SliceStatement(lambda: (
+    select(
+        Comment.id,
+        Comment.post_id,
+        Comment.author_id,
+        User.username.label("author_username"),
+        Comment.content,
+        Comment.created_at,
+    )
+    .outerjoin(User, User.id == Comment.author_id)
+    .where(Comment.post_id == bindparam("post_id"))
+    .order_by(Comment.created_at.desc())
+    .limit(bindparam("limit"))
+    .offset(bindparam("offset"))
+))
+
+
 async def get_comments_handler(request: GetCommentsRequest) -> list[CommentItem]:
-    db = request.db
-    result = await db.execute(
-        select(Comment)
-        .where(Comment.post_id == request.post_id)
-        .order_by(Comment.created_at.desc())
-        .limit(request.limit)
-        .offset(request.offset)
+    result = await COMMENTS.execute(
+        request.db,
+        post_id=request.post_id,
+        limit=request.limit,
+        offset=request.offset,
     )
-    comments = []
-    for c in result.scalars().all():
-        user = await db.get(User, c.author_id)
-        comments.append(CommentItem(
-            id=c.id,
-            post_id=c.post_id,
-            author_id=c.author_id,
-            author_username=user.username if user else None,
-            content=c.content,
-            created_at=c.created_at,
-        ))
-    return comments
+    return [CommentItem(**row._mapping) for row in result]
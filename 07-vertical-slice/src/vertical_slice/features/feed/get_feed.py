@@ -3,10 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from vertical_slice.models.tables import Comment, Follow, Like, Post, User
+from vertical_slice.shared.statements import SliceStatement
 
 
 @dataclass
@@ -29,39 +30,55 @@ class FeedPostItem:
     created_at: datetime
 
 
-async def get_feed_handler(request: GetFeedRequest) -> list[FeedPostItem]:
-    db = request.db
-    result = await db.execute(
-        select(Follow.following_id).where(Follow.follower_id == request.user_id)
-    )
-    following_ids = list(result.scalars().all())
-    following_ids.append(request.user_id)
-
-    result = await db.execute(
+def _page_statement():
+    # The page of posts is picked first, so the author join and the counts
+    # only run for the rows returned, all in one statement.
+    page = (
         select(Post)
-        .where(Post.author_id.in_(following_ids))
+        .where(
+            or_(
+                Post.author_id == bindparam("user_id"),
+                Post.author_id.in_(
+                    select(Follow.following_id)
+                    .where(Follow.follower_id == bindparam("user_id"))
+                ),
+            )
+        )
         .order_by(Post.created_at.desc())
-        .limit(request.limit)
-        .offset(request.offset)
+        .limit(bindparam("limit"))
+        .offset(bindparam("offset"))
+        .subquery()
+    )
+    like_count = (
+        select(func.count()).where(Like.post_id == page.c.id).scalar_subquery()
+    )
+    comment_count = (
+        select(func.count()).where(Comment.post_id == page.c.id).scalar_subquery()
+    )
+    return (
+        select(
+            page.c.id,
+            page.c.author_id,
+            User.username.label("author_username"),
+            page.c.content,
+            page.c.image_url,
+            like_count.label("like_count"),
+            comment_count.label("comment_count"),
+            page.c.created_at,
+        )
+        .outerjoin(User, User.id == page.c.author_id)
+        .order_by(page.c.created_at.desc())
     )
 
-    posts = []
-    for post in result.scalars().all():
-        user = await db.get(User, post.author_id)
-        like_count = (await db.execute(
-            select(func.count()).select_from(Like).where(Like.post_id == post.id)
-        )).scalar_one()
-        comment_count = (await db.execute(
-            select(func.count()).select_from(Comment).where(Comment.post_id == post.id)
-        )).scalar_one()
-        posts.append(FeedPostItem(
-            id=post.id,
-            author_id=post.author_id,
-            author_username=user.username if user else None,
-            content=post.content,
-            image_url=post.image_url,
-            like_count=like_count,
-            comment_count=comment_count,
-            created_at=post.created_at,
-        ))
-    return posts
+
+FEED = SliceStatement(_page_statement)
+
+
+async def get_feed_handler(request: GetFeedRequest) -> list[FeedPostItem]:
+    result = await FEED.execute(
+        request.db,
+        user_id=request.user_id,
+        limit=request.limit,
+        offset=request.offset,
+    )
+    return [FeedPostItem(**row._mapping) for row in result]
@@ -4,10 +4,11 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from vertical_slice.models.tables import Comment, Like, Post, User
+from vertical_slice.shared.statements import SliceStatement
 
 
 @dataclass
@@ -28,27 +29,35 @@ class GetPostResponse:
     created_at: datetime
 
 
+def _post_statement():
+    like_count = (
+        select(func.count()).where(Like.post_id == Post.id).scalar_subquery()
+    )
+    comment_count = (
+        select(func.count()).where(Comment.post_id == Post.id).scalar_subquery()
+    )
+    return (
+        select(
+            Post.id,
+            Post.author_id,
+            User.username.label("author_username"),
+            Post.content,
+            Post.image_url,
+            like_count.label("like_count"),
+            comment_count.label("comment_count"),
+            Post.created_at,
+        )
+        .outerjoin(User, User.id == Post.author_id)
+        .where(Post.id == bindparam("post_id"))
+    )
+
+
+POST = SliceStatement(_post_statement)
+
+
 async def get_post_handler(request: GetPostRequest) -> GetPostResponse:
-    db = request.db
-    post = await db.get(Post, request.post_id)
-    if not post:
+    result = await POST.execute(request.db, post_id=request.post_id)
+    row = result.one_or_none()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
-
-    user = await db.get(User, post.author_id)
-    like_count = (await db.execute(
-        select(func.count()).select_from(Like).where(Like.post_id == post.id)
-    )).scalar_one()
-    comment_count = (await db.execute(
-        select(func.count()).select_from(Comment).where(Comment.post_id == post.id)
-    )).scalar_one()
-
-    return GetPostResponse(
-        id=post.id,
-        author_id=post.author_id,
-        author_username=user.username if user else None,
-        content=post.content,
-        image_url=post.image_url,
-        like_count=like_count,
-        comment_count=comment_count,
-        created_at=post.created_at,
-    )
+    return GetPostResponse(**row._mapping)
@@ -3,10 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from vertical_slice.models.tables import Follow, Post, User
+from vertical_slice.shared.statements import SliceStatement
 
 
 @dataclass
@@ -27,29 +28,28 @@ class GetProfileResponse:
     following_count: int
 
 
+def _profile_statement():
+    def count(column):
+        return select(func.count()).where(column == User.id).scalar_subquery()
+
+    return select(
+        User.id,
+        User.username,
+        User.full_name,
+        User.bio,
+        User.profile_image_url,
+        count(Post.author_id).label("post_count"),
+        count(Follow.following_id).label("follower_count"),
+        count(Follow.follower_id).label("following_count"),
+    ).where(User.id == bindparam("user_id"))
+
+
+PROFILE = SliceStatement(_profile_statement)
+
+
 async def get_profile_handler(request: GetProfileRequest) -> GetProfileResponse:
-    db = request.db
-    user = await db.get(User, request.user_id)
-    if not user:
+    result = await PROFILE.execute(request.db, user_id=request.user_id)
+    row = result.one_or_none()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-
-    post_count = (await db.execute(
-        select(func.count()).select_from(Post).where(Post.author_id == request.user_id)
-    )).scalar_one()
-    follower_count = (await db.execute(
-        select(func.count()).select_from(Follow).where(Follow.following_id == request.user_id)
-    )).scalar_one()
-    following_count = (await db.execute(
-        select(func.count()).select_from(Follow).where(Follow.follower_id == request.user_id)
-    )).scalar_one()
-
-    return GetProfileResponse(
-        id=user.id,
-        username=user.username,
-        full_name=user.full_name,
-        bio=user.bio,
-        profile_image_url=user.profile_image_url,
-        post_count=post_count,
-        follower_count=follower_count,
-        following_count=following_count,
-    )
+    return GetProfileResponse(**row._mapping)
@@ -6,6 +6,7 @@ from fastapi import FastAPI
 
 from vertical_slice.api.routers import (
     auth_router,
+    batch_router,
     feed_router,
     follow_router,
     message_router,
@@ -28,6 +29,12 @@ from vertical_slice.models.tables import (  # noqa: F401
     Story,
     User,
 )
+from vertical_slice.shared.behaviors import (
+    CachingBehavior,
+    InvalidationBehavior,
+    single_flight,
+    timing,
+)
 from vertical_slice.shared.database import engine
 from vertical_slice.shared.mediator import mediator
 
@@ -100,7 +107,50 @@ def _register_handlers() -> None:
     mediator.register(GetPostsByHashtagRequest, get_posts_by_hashtag_handler)
 
 
+def _register_behaviors() -> None:
+    mediator.clear_behaviors()
+    mediator.add_behavior(timing)
+    mediator.add_behavior(CachingBehavior(ttl=30), GetPostRequest, GetProfileRequest)
+    # Cache misses for the same post or profile at the same moment (a
+    # celebrity posting) run the handler once.
+    mediator.add_behavior(single_flight, GetPostRequest, GetProfileRequest)
+
+    # Writes evict the cached reads whose response they change.
+    mediator.add_behavior(
+        InvalidationBehavior(lambda r, _: [(GetPostRequest, {"post_id": r.post_id})]),
+        ToggleLikeRequest, CreateCommentRequest,
+    )
+    # The request does not carry the comment's post; the handler returns it.
+    mediator.add_behavior(
+        InvalidationBehavior(lambda _, post_id: [(GetPostRequest, {"post_id": post_id})]),
+        DeleteCommentRequest,
+    )
+    mediator.add_behavior(
+        InvalidationBehavior(lambda r, _: [
+            (GetPostRequest, {"post_id": r.post_id}),
+            (GetProfileRequest, {"user_id": r.user_id}),
+        ]),
+        DeletePostRequest,
+    )
+    mediator.add_behavior(
+        InvalidationBehavior(lambda r, _: [(GetProfileRequest, {"user_id": r.author_id})]),
+        CreatePostRequest,
+    )
+    mediator.add_behavior(
+        InvalidationBehavior(lambda r, _: [(GetProfileRequest, {"user_id": r.user_id})]),
+        UpdateProfileRequest,
+    )
+    mediator.add_behavior(
+        InvalidationBehavior(lambda r, _: [
+            (GetProfileRequest, {"user_id": r.follower_id}),
+            (GetProfileRequest, {"user_id": r.following_id}),
+        ]),
+        FollowUserRequest, UnfollowUserRequest,
+    )
+
+
 _register_handlers()
+_register_behaviors()
 
 
 @asynccontextmanager
@@ -122,3 +172,4 @@ app.include_router(story_router)
 app.include_router(message_router)
 app.include_router(notification_router)
 app.include_router(search_router)
+app.include_router(batch_router)
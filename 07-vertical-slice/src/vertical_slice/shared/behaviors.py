@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, fields
+from typing import Any
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from vertical_slice.shared.mediator import Next
+
+logger = logging.getLogger(__name__)
+
+PENDING_EVICTIONS_KEY = "pending_cache_evictions"
+# How many evicted matches keep their stamp before the stamps are dropped.
+MAX_TRACKED_EVICTIONS = 10_000
+
+# ``(GetPostRequest, {"post_id": 1})``: the cached responses of that request
+# type whose fields match; an empty dict matches every entry of the type.
+Eviction = tuple[type, dict[str, Any]]
+
+
+def request_key(request: Any) -> tuple:
+    """The request's field values, leaving out the session."""
+    return tuple(getattr(request, f.name) for f in fields(request) if f.name != "db")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """LRU of handler responses keyed by request type and fields.
+
+    Every eviction stamps its match with a counter. ``put`` takes the
+    ``token()`` read before the handler ran and skips a response if an
+    eviction matching its request happened since, as the response may
+    predate it. Evictions of other keys do not affect it.
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[type, tuple], tuple[float, Any]] = OrderedDict()
+        self._clock = 0
+        # ``(request_type, field names, values)`` of each match -> its stamp.
+        self._evicted_at: dict[tuple[type, tuple, tuple], int] = {}
+        self._match_names: dict[type, set[tuple[str, ...]]] = defaultdict(set)
+        # Stamps up to here were dropped; older tokens cannot be checked.
+        self._forgotten = 0
+        self.stats: dict[str, CacheStats] = defaultdict(CacheStats)
+
+    def token(self) -> int:
+        """Take before running the handler whose response goes to ``put``."""
+        return self._clock
+
+    def get(self, request: Any) -> tuple[bool, Any]:
+        key = (type(request), request_key(request))
+        stats = self.stats[type(request).__name__]
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            stats.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        stats.hits += 1
+        return True, entry[1]
+
+    def put(
+        self, request: Any, response: Any, ttl: float, token: int | None = None
+    ) -> None:
+        if token is not None and self._stale(request, token):
+            return
+        key = (type(request), request_key(request))
+        self._entries[key] = (time.monotonic() + ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            (request_type, _), _ = self._entries.popitem(last=False)
+            self.stats[request_type.__name__].evictions += 1
+
+    def _stale(self, request: Any, token: int) -> bool:
+        if token < self._forgotten:
+            return True
+        request_type = type(request)
+        return any(
+            self._evicted_at.get(
+                (request_type, names, tuple(getattr(request, n) for n in names)), 0
+            ) > token
+            for names in self._match_names.get(request_type, ())
+        )
+
+    def _forget_stamps(self) -> None:
+        self._clock += 1
+        self._evicted_at.clear()
+        self._match_names.clear()
+        self._forgotten = self._clock
+
+    def evict(self, request_type: type, **match: Any) -> None:
+        self._clock += 1
+        match_names = tuple(sorted(match))
+        self._match_names[request_type].add(match_names)
+        stamp_key = (request_type, match_names, tuple(match[n] for n in match_names))
+        self._evicted_at[stamp_key] = self._clock
+        if len(self._evicted_at) > MAX_TRACKED_EVICTIONS:
+            self._forget_stamps()
+        names = [f.name for f in fields(request_type) if f.name != "db"]
+        if set(match) == set(names):
+            keys = [(request_type, tuple(match[name] for name in names))]
+        else:
+            positions = {names.index(name): value for name, value in match.items()}
+            keys = [
+                key for key in self._entries
+                if key[0] is request_type
+                and all(key[1][i] == value for i, value in positions.items())
+            ]
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self.stats[request_type.__name__].invalidations += 1
+
+    def evict_on_commit(self, db: AsyncSession, request_type: type, **match: Any) -> None:
+        """Evict now and again once ``db`` commits, so nothing cached from
+        the pre-commit state in between survives."""
+        self.evict(request_type, **match)
+        db.info.setdefault(PENDING_EVICTIONS_KEY, []).append((self, request_type, match))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._forget_stamps()
+        self.stats.clear()
+
+
+response_cache = ResponseCache()
+
+
+class CachingBehavior:
+    """Serves repeated read requests from ``cache`` for ``ttl`` seconds.
+
+    Only successful responses are cached; errors such as a 404 are raised
+    again on every request.
+    """
+
+    def __init__(self, ttl: float, cache: ResponseCache = response_cache) -> None:
+        self.ttl = ttl
+        self.cache = cache
+
+    async def __call__(self, request: Any, next: Next) -> Any:
+        hit, response = self.cache.get(request)
+        if hit:
+            return response
+        token = self.cache.token()
+        response = await next()
+        self.cache.put(request, response, self.ttl, token)
+        return response
+
+
+class InvalidationBehavior:
+    """Evicts the cached reads a write request affects once it succeeds.
+
+    ``affects(request, response)`` names them as ``(request_type, fields)``
+    pairs.
+    """
+
+    def __init__(
+        self,
+        affects: Callable[[Any, Any], Iterable[Eviction]],
+        cache: ResponseCache = response_cache,
+    ) -> None:
+        self.affects = affects
+        self.cache = cache
+
+    async def __call__(self, request: Any, next: Next) -> Any:
+        response = await next()
+        for request_type, match in self.affects(request, response):
+            self.cache.evict_on_commit(request.db, request_type, **match)
+        return response
+
+
+@dataclass
+class SingleFlightStats:
+    executions: int = 0
+    # Requests that joined an identical one already in flight instead of
+    # running the handler again.
+    coalesced: int = 0
+
+
+class SingleFlightBehavior:
+    """Lets concurrent identical read requests share one handler run.
+
+    The first request runs the rest of the pipeline; identical requests
+    arriving before it finishes await the same result, or the same error.
+    The run uses a session of its own on the caller's engine, as it may
+    outlive the caller's session: it is shielded, so one caller going away
+    does not cancel it for the others. Only add it to side-effect-free
+    requests.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[tuple[type, tuple], asyncio.Task] = {}
+        self.stats: dict[str, SingleFlightStats] = defaultdict(SingleFlightStats)
+
+    async def __call__(self, request: Any, next: Next) -> Any:
+        key = (type(request), request_key(request))
+        stats = self.stats[type(request).__name__]
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run(request, next))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            stats.executions += 1
+        else:
+            stats.coalesced += 1
+        return await asyncio.shield(task)
+
+    @staticmethod
+    async def _run(request: Any, next: Next) -> Any:
+        db = getattr(request, "db", None)
+        if db is None:
+            return await next()
+        async with AsyncSession(db.bind, expire_on_commit=False) as own:
+            return await next(dataclasses.replace(request, db=own))
+
+    def _finish(self, key: tuple[type, tuple], task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the error as seen even if every caller has gone away.
+            task.exception()
+
+
+single_flight = SingleFlightBehavior()
+
+
+@dataclass
+class RequestTiming:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class TimingBehavior:
+    """Records handling time per request type and logs slow requests."""
+
+    def __init__(self, slow_threshold: float = 0.5) -> None:
+        self.slow_threshold = slow_threshold
+        self.stats: dict[str, RequestTiming] = defaultdict(RequestTiming)
+
+    async def __call__(self, request: Any, next: Next) -> Any:
+        started = time.perf_counter()
+        try:
+            return await next()
+        finally:
+            elapsed = time.perf_counter() - started
+            timing = self.stats[type(request).__name__]
+            timing.count += 1
+            timing.total += elapsed
+            timing.max = max(timing.max, elapsed)
+            if elapsed >= self.slow_threshold:
+                logger.warning(
+                    "Slow request %s took %.3fs", type(request).__name__, elapsed
+                )
+
+
+timing = TimingBehavior()
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _evict_committed(session: Session) -> None:
+    for cache, request_type, match in session.info.pop(PENDING_EVICTIONS_KEY, ()):
+        cache.evict(request_type, **match)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(PENDING_EVICTIONS_KEY, None)
@@ -1,20 +1,68 @@
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Awaitable, Callable
+from typing import Any, Protocol
+
+Handler = Callable[[Any], Awaitable[Any]]
+Next = Callable[..., Awaitable[Any]]
+
+
+class PipelineBehavior(Protocol):
+    """Wraps handling of a request; call ``next()`` to continue the chain,
+    or ``next(other)`` to continue it with a replacement request."""
+
+    async def __call__(self, request: Any, next: Next) -> Any: ...
 
 
 class Mediator:
     def __init__(self) -> None:
         self._handlers: dict[type, Any] = {}
+        self._behaviors: list[tuple[PipelineBehavior, tuple[type, ...]]] = []
+        self._pipelines: dict[type, list[PipelineBehavior]] = {}
 
     def register(self, request_type: type, handler: Any) -> None:
         self._handlers[request_type] = handler
 
+    def add_behavior(self, behavior: PipelineBehavior, *request_types: type) -> None:
+        """Run ``behavior`` around the handlers of ``request_types``, or of
+        every request when none are given. Behaviors added first run
+        outermost."""
+        self._behaviors.append((behavior, request_types))
+        self._pipelines.clear()
+
+    def clear_behaviors(self) -> None:
+        self._behaviors.clear()
+        self._pipelines.clear()
+
+    def _pipeline(self, request_type: type) -> list[PipelineBehavior]:
+        pipeline = self._pipelines.get(request_type)
+        if pipeline is None:
+            pipeline = self._pipelines[request_type] = [
+                behavior
+                for behavior, types in self._behaviors
+                if not types or request_type in types
+            ]
+        return pipeline
+
     async def send(self, request: Any) -> Any:
         handler = self._handlers.get(type(request))
         if handler is None:
             raise ValueError(f"No handler registered for {type(request).__name__}")
-        return await handler(request)
+        pipeline = self._pipeline(type(request))
+        if not pipeline:
+            return await handler(request)
+
+        async def invoke(index: int, request: Any) -> Any:
+            if index == len(pipeline):
+                return await handler(request)
+            return await pipeline[index](
+                request,
+                lambda replaced=None: invoke(
+                    index + 1, request if replaced is None else replaced
+                ),
+            )
+
+        return await invoke(0, request)
 
 
 mediator = Mediator()
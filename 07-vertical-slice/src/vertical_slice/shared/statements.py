@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from sqlalchemy import Executable, Result
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class SliceStatement:
+    """A slice's query, built once with ``bindparam`` placeholders.
+
+    Executing the same statement object on every request skips rebuilding
+    the ``select()``, and its SQL compiles once into the engine's statement
+    cache. Request values are passed as parameters:
+
+        POST_BY_ID = SliceStatement(
+            lambda: select(Post).where(Post.id == bindparam("post_id"))
+        )
+        result = await POST_BY_ID.execute(db, post_id=request.post_id)
+    """
+
+    def __init__(self, build: Callable[[], Executable]) -> None:
+        self.build = build
+        self._statement: Executable | None = None
+
+    @property
+    def statement(self) -> Executable:
+        if self._statement is None:
+            self._statement = self.build()
+        return self._statement
+
+    async def execute(self, db: AsyncSession, **params) -> Result:
+        return await db.execute(self.statement, params)
@@ -433,3 +433,417 @@ class TestSearch:
         assert isinstance(posts, list)
         assert len(posts) >= 1
         assert any("findme" in (p["content"] or "") for p in posts)
+
+
+class TestPostListingQueries:
+    """Each post-listing slice builds its page in a single statement."""
+
+    async def _seed(self, auth_client: AsyncClient) -> tuple[int, list[int]]:
+        me = (await auth_client.get("/api/auth/me")).json()
+        post_ids = []
+        for i in range(3):
+            resp = await auth_client.post(
+                "/api/posts", json={"content": f"Counted {i} #querycount"}
+            )
+            post_ids.append(resp.json()["id"])
+        await auth_client.post(f"/api/posts/{post_ids[0]}/likes")
+        for content in ("one", "two"):
+            await auth_client.post(
+                f"/api/posts/{post_ids[0]}/comments", json={"content": content}
+            )
+        return me["id"], post_ids
+
+    async def _run(self, handler, request_type, statements: list[str], **fields):
+        from tests.conftest import test_session
+
+        async with test_session() as db:
+            statements.clear()
+            result = await handler(request_type(**fields, db=db))
+        assert len(statements) == 1, statements
+        return result
+
+    def _assert_page(self, posts, post_ids: list[int]):
+        by_id = {p.id: p for p in posts}
+        assert set(post_ids) <= set(by_id)
+        assert by_id[post_ids[0]].like_count == 1
+        assert by_id[post_ids[0]].comment_count == 2
+        assert by_id[post_ids[1]].like_count == 0
+        assert by_id[post_ids[0]].author_username == "testuser"
+
+    async def test_feed_is_one_query(self, auth_client: AsyncClient, statements):
+        from vertical_slice.features.feed.get_feed import (
+            GetFeedRequest,
+            get_feed_handler,
+        )
+
+        user_id, post_ids = await self._seed(auth_client)
+        posts = await self._run(
+            get_feed_handler, GetFeedRequest, statements,
+            user_id=user_id, limit=20, offset=0,
+        )
+        self._assert_page(posts, post_ids)
+
+    async def test_user_posts_is_one_query(self, auth_client: AsyncClient, statements):
+        from vertical_slice.features.user.get_user_posts import (
+            GetUserPostsRequest,
+            get_user_posts_handler,
+        )
+
+        user_id, post_ids = await self._seed(auth_client)
+        posts = await self._run(
+            get_user_posts_handler, GetUserPostsRequest, statements,
+            user_id=user_id, limit=20, offset=0,
+        )
+        self._assert_page(posts, post_ids)
+        assert [p.created_at for p in posts] == sorted(
+            (p.created_at for p in posts), reverse=True
+        )
+
+    async def test_posts_by_hashtag_is_one_query(
+        self, auth_client: AsyncClient, statements
+    ):
+        from vertical_slice.features.search.get_posts_by_hashtag import (
+            GetPostsByHashtagRequest,
+            get_posts_by_hashtag_handler,
+        )
+
+        _, post_ids = await self._seed(auth_client)
+        for limit in (2, 20):
+            posts = await self._run(
+                get_posts_by_hashtag_handler, GetPostsByHashtagRequest, statements,
+                tag="querycount", limit=limit, offset=0,
+            )
+        assert len(posts) > 2
+        self._assert_page(posts, post_ids)
+
+    async def test_get_post_is_one_query(self, auth_client: AsyncClient, statements):
+        from fastapi import HTTPException
+
+        from vertical_slice.features.post.get_post import (
+            GetPostRequest,
+            get_post_handler,
+        )
+
+        _, post_ids = await self._seed(auth_client)
+        post = await self._run(
+            get_post_handler, GetPostRequest, statements, post_id=post_ids[0]
+        )
+        assert (post.like_count, post.comment_count) == (1, 2)
+        assert post.author_username == "testuser"
+        with pytest.raises(HTTPException):
+            await self._run(
+                get_post_handler, GetPostRequest, statements, post_id=999999
+            )
+
+
+class TestSliceStatements:
+    async def test_profile_reuses_one_statement(
+        self, auth_client: AsyncClient, second_user_token: str, statements
+    ):
+        from tests.conftest import test_session
+
+        from vertical_slice.features.user.get_profile import (
+            PROFILE,
+            GetProfileRequest,
+            get_profile_handler,
+        )
+
+        me = (await auth_client.get("/api/auth/me")).json()
+        await auth_client.post("/api/posts", json={"content": "Profile count"})
+        await auth_client.post(
+            f"/api/follow/{me['id']}",
+            headers={"Authorization": f"Bearer {second_user_token}"},
+        )
+
+        async with test_session() as db:
+            request = GetProfileRequest(user_id=me["id"], db=db)
+            statements.clear()
+            first = await get_profile_handler(request)
+            statement = PROFILE.statement
+            second = await get_profile_handler(request)
+        assert PROFILE.statement is statement
+        assert len(statements) == 2
+        assert first == second
+        assert first.post_count >= 1
+        assert first.follower_count >= 1
+
+
+class TestResponseEncoding:
+    async def test_trusted_and_validated_responses_match(
+        self, auth_client: AsyncClient, second_user_token: str, monkeypatch
+    ):
+        from vertical_slice.api import responses
+        from vertical_slice.shared.behaviors import response_cache
+
+        me = (await auth_client.get("/api/auth/me")).json()
+        post = (await auth_client.post(
+            "/api/posts", json={"content": "Encoded #encoding"}
+        )).json()
+        await auth_client.post(f"/api/posts/{post['id']}/comments", json={
+            "content": "Encoded comment",
+        })
+        second = {"Authorization": f"Bearer {second_user_token}"}
+        await auth_client.post("/api/messages", headers=second, json={
+            "receiver_id": me["id"], "content": "Encoded message",
+        })
+        paths = [
+            "/api/auth/me",
+            f"/api/users/{me['id']}",
+            f"/api/posts/{post['id']}",
+            f"/api/posts/{post['id']}/comments",
+            "/api/feed",
+            "/api/messages",
+            "/api/notifications",
+            "/api/search/posts/hashtag/encoding",
+        ]
+        trusted = [await auth_client.get(path) for path in paths]
+        response_cache.clear()
+        monkeypatch.setattr(responses, "VALIDATE_RESPONSES", True)
+        validated = [await auth_client.get(path) for path in paths]
+
+        for path, fast, checked in zip(paths, trusted, validated):
+            assert fast.status_code == checked.status_code == 200, path
+            assert fast.headers["content-type"] == "application/json"
+            assert fast.json() == checked.json(), path
+        assert (await auth_client.get("/openapi.json")).status_code == 200
+
+    async def test_validation_mode_rejects_a_mismatched_result(self, monkeypatch):
+        from dataclasses import dataclass
+
+        from fastapi import APIRouter, FastAPI
+        from fastapi.exceptions import ResponseValidationError
+        from httpx import ASGITransport
+
+        from vertical_slice.api import responses
+        from vertical_slice.api.schemas import StatusOut
+
+        @dataclass
+        class Wrong:
+            state: str
+
+        router = APIRouter(route_class=responses.SliceRoute)
+
+        @router.get("/status", response_model=StatusOut, status_code=202)
+        async def status():
+            return Wrong(state="ok")
+
+        app = FastAPI()
+        app.include_router(router)
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://testserver"
+        ) as client:
+            resp = await client.get("/status")
+            assert resp.status_code == 202
+            assert resp.json() == {"state": "ok"}
+            monkeypatch.setattr(responses, "VALIDATE_RESPONSES", True)
+            with pytest.raises(ResponseValidationError):
+                await client.get("/status")
+
+
+class TestBatch:
+    async def test_batch_returns_each_result_in_order(self, auth_client: AsyncClient):
+        resp = await auth_client.post("/api/posts", json={"content": "Batched #batch"})
+        post = resp.json()
+        me = (await auth_client.get("/api/auth/me")).json()
+
+        resp = await auth_client.post("/api/batch", json={"requests": [
+            {"op": "feed", "params": {"limit": 5}},
+            {"op": "profile", "params": {"user_id": me["id"]}},
+            {"op": "post", "params": {"post_id": 999999}},
+            {"op": "post", "params": {"post_id": "not-an-id"}},
+            {"op": "notifications"},
+            {"op": "create_post", "params": {"content": "nope"}},
+            {"op": "me"},
+        ]})
+        assert resp.status_code == 200
+        feed, profile, missing, invalid, notifications, unknown, who = resp.json()
+        assert feed["status"] == 200
+        assert feed["body"][0]["id"] == post["id"]
+        assert profile == {
+            "status": 200,
+            "body": (await auth_client.get(f"/api/users/{me['id']}")).json(),
+        }
+        assert missing == {"status": 404, "body": {"detail": "Post not found"}}
+        assert invalid["status"] == 422
+        assert notifications["status"] == 200
+        assert unknown["status"] == 404
+        assert who == {"status": 200, "body": me}
+
+    async def test_batch_requires_auth_and_a_bounded_list(
+        self, auth_client: AsyncClient
+    ):
+        resp = await auth_client.post("/api/batch", json={
+            "requests": [{"op": "me"}] * 21,
+        })
+        assert resp.status_code == 422
+        del auth_client.headers["Authorization"]
+        resp = await auth_client.post("/api/batch", json={"requests": [{"op": "me"}]})
+        assert resp.status_code == 401
+
+
+class TestMediatorPipeline:
+    async def test_behaviors_wrap_handlers_in_order(self):
+        from dataclasses import dataclass
+
+        from vertical_slice.shared.behaviors import TimingBehavior
+        from vertical_slice.shared.mediator import Mediator
+
+        @dataclass
+        class Ping:
+            value: int
+
+        @dataclass
+        class Other:
+            value: int
+
+        calls = []
+
+        def recording(name):
+            async def behavior(request, next):
+                calls.append(f"{name}:before")
+                response = await next()
+                calls.append(f"{name}:after")
+                return response
+            return behavior
+
+        async def handler(request):
+            calls.append("handler")
+            return request.value * 2
+
+        timing = TimingBehavior()
+        local = Mediator()
+        local.register(Ping, handler)
+        local.register(Other, handler)
+        local.add_behavior(timing)
+        local.add_behavior(recording("outer"))
+        local.add_behavior(recording("ping"), Ping)
+
+        assert await local.send(Ping(value=2)) == 4
+        assert calls == [
+            "outer:before", "ping:before", "handler", "ping:after", "outer:after"
+        ]
+        calls.clear()
+        assert await local.send(Other(value=3)) == 6
+        assert calls == ["outer:before", "handler", "outer:after"]
+        assert timing.stats["Ping"].count == 1
+        assert timing.stats["Other"].count == 1
+
+    async def test_cached_post_is_evicted_by_writes(self, auth_client: AsyncClient):
+        from vertical_slice.shared.behaviors import response_cache
+
+        post_resp = await auth_client.post("/api/posts", json={"content": "Cached"})
+        post_id = post_resp.json()["id"]
+        stats = response_cache.stats["GetPostRequest"]
+        hits = stats.hits
+
+        first = await auth_client.get(f"/api/posts/{post_id}")
+        second = await auth_client.get(f"/api/posts/{post_id}")
+        assert first.json() == second.json()
+        assert stats.hits == hits + 1
+
+        await auth_client.post(f"/api/posts/{post_id}/likes")
+        comment = await auth_client.post(
+            f"/api/posts/{post_id}/comments", json={"content": "Fresh"}
+        )
+        resp = await auth_client.get(f"/api/posts/{post_id}")
+        assert resp.json()["like_count"] == 1
+        assert resp.json()["comment_count"] == 1
+
+        # Deleting a comment evicts its own post only.
+        other = await auth_client.post("/api/posts", json={"content": "Other"})
+        other_id = other.json()["id"]
+        await auth_client.get(f"/api/posts/{other_id}")
+        await auth_client.delete(f"/api/posts/comments/{comment.json()['id']}")
+        hits = stats.hits
+        await auth_client.get(f"/api/posts/{other_id}")
+        assert stats.hits == hits + 1
+        resp = await auth_client.get(f"/api/posts/{post_id}")
+        assert resp.json()["comment_count"] == 0
+        assert stats.hits == hits + 1
+
+    async def test_response_evicted_during_handling_is_not_cached(self):
+        from dataclasses import dataclass
+
+        from vertical_slice.shared.behaviors import CachingBehavior, ResponseCache
+        from vertical_slice.shared.mediator import Mediator
+
+        @dataclass
+        class Read:
+            key: int
+
+        cache = ResponseCache()
+        version = {"value": 1}
+
+        async def handler(request):
+            response = version["value"]
+            # A write commits and evicts while this read is in flight.
+            version["value"] += 1
+            cache.evict(Read, key=request.key)
+            return response
+
+        local = Mediator()
+        local.register(Read, handler)
+        local.add_behavior(CachingBehavior(ttl=60, cache=cache), Read)
+
+        assert await local.send(Read(key=1)) == 1
+        assert cache.get(Read(key=1)) == (False, None)
+        cache.put(Read(key=1), 2, ttl=60, token=cache.token())
+        assert cache.get(Read(key=1)) == (True, 2)
+
+        # Evicting another key does not keep the response out of the cache.
+        token = cache.token()
+        cache.evict(Read, key=3)
+        cache.put(Read(key=2), 5, ttl=60, token=token)
+        assert cache.get(Read(key=2)) == (True, 5)
+
+    async def test_single_flight_coalesces_identical_requests(self):
+        import asyncio
+        from dataclasses import dataclass
+
+        from sqlalchemy import text
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        from tests.conftest import test_session
+        from vertical_slice.shared.behaviors import SingleFlightBehavior
+        from vertical_slice.shared.mediator import Mediator
+
+        @dataclass
+        class Slow:
+            key: int
+            db: AsyncSession
+
+        runs = []
+        release = asyncio.Event()
+
+        async def handler(request):
+            runs.append(request.db)
+            await release.wait()
+            result = await request.db.execute(text("SELECT :key"), {"key": request.key})
+            return {"key": result.scalar_one()}
+
+        single_flight = SingleFlightBehavior()
+        local = Mediator()
+        local.register(Slow, handler)
+        local.add_behavior(single_flight, Slow)
+
+        sessions = [test_session() for _ in range(5)]
+        tasks = [
+            asyncio.ensure_future(local.send(Slow(key=k, db=db)))
+            for k, db in zip((1, 1, 1, 2, 1), sessions)
+        ]
+        await asyncio.sleep(0)
+        # The first caller goes away and its session is closed, as get_db
+        # does on a disconnect, while the shared run is still in flight.
+        tasks[0].cancel()
+        await sessions[0].close()
+        release.set()
+        results = await asyncio.gather(*tasks[1:])
+        for db in sessions[1:]:
+            await db.close()
+
+        assert len(runs) == 2
+        assert not set(runs) & set(sessions)
+        assert [r["key"] for r in results] == [1, 1, 2, 1]
+        assert results[0] is results[1]
+        assert single_flight.stats["Slow"].executions == 2
+        assert single_flight.stats["Slow"].coalesced == 3
@@ -24,9 +24,16 @@ from event_driven.models.tables import *  # noqa: F401,F403
 from event_driven.shared.database import Base, engine
 from event_driven.shared.event_broker import broker
 
+# Notifications are delivered after the producer commits, so likes, comments
+# and follows do not wait for them. Hashtags stay inline, in the post's own
+# transaction, so a new post is searchable by tag right away.
+ASYNC_TOPICS = (POST_LIKED, COMMENT_ADDED, USER_FOLLOWED)
+
 
 def _register_consumers() -> None:
     broker.clear()
+    for topic in ASYNC_TOPICS:
+        broker.configure_topic(topic)
     broker.subscribe(POST_LIKED, on_post_liked)
     broker.subscribe(COMMENT_ADDED, on_comment_added)
     broker.subscribe(USER_FOLLOWED, on_user_followed)
@@ -39,6 +46,7 @@ async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
+    await broker.stop()
     await engine.dispose()
 
 
@@ -3,6 +3,8 @@ from collections.abc import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
+from event_driven.shared.event_broker import broker
+
 DATABASE_URL = "sqlite+aiosqlite:///./event_driven.db"
 
 engine = create_async_engine(DATABASE_URL, echo=False)
@@ -20,6 +22,7 @@ async def get_db() -> AsyncGenerator[AsyncSession]:
         try:
             yield session
             await session.commit()
+            await broker.wait_for_capacity(session)
         except Exception:
             await session.rollback()
             raise
@@ -1,28 +1,223 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
+from sqlalchemy import event as sa_event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+PENDING_EVENTS_KEY = "pending_broker_events"
+BLOCKED_EVENTS_KEY = "blocked_broker_events"
+
+DEFAULT_WORKERS = int(os.getenv("EVENT_BROKER_WORKERS", "2"))
+DEFAULT_QUEUE_SIZE = int(os.getenv("EVENT_BROKER_QUEUE_SIZE", "1000"))
+
+# What happens to an event whose topic queue is full:
+BLOCK = "block"  # the producer waits for room (backpressure)
+DROP_NEWEST = "drop_newest"  # the new event is dropped
+DROP_OLDEST = "drop_oldest"  # the oldest queued event is dropped to make room
+OVERFLOW_POLICIES = (BLOCK, DROP_NEWEST, DROP_OLDEST)
+
+Handler = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class TopicStats:
+    published: int = 0
+    delivered: int = 0
+    failed: int = 0
+    dropped: int = 0
+
+
+class _Topic:
+    def __init__(self, name: str, workers: int, max_queue_size: int, overflow: str):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow!r}")
+        self.name = name
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.overflow = overflow
+        self.queue: asyncio.Queue[dict[str, Any]] | None = None
+        self.tasks: list[asyncio.Task] = []
+        self.loop: asyncio.AbstractEventLoop | None = None
+
 
 class EventBroker:
     """
     In-memory pub/sub broker. Producers publish events by type string,
     consumers subscribe handlers that receive the event + db session.
+
+    By default ``publish`` awaits every handler inline with the producer's
+    own session. Topics set up with ``configure_topic`` are delivered
+    asynchronously instead: the event is queued once the producer's session
+    commits, and a pool of workers per topic runs each handler with a
+    session of its own, committing it separately. A full topic queue
+    applies the topic's overflow policy.
     """
 
     def __init__(self) -> None:
         self._subscribers: dict[str, list[Callable]] = defaultdict(list)
+        self._topics: dict[str, _Topic] = {}
+        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self.stats: dict[str, TopicStats] = defaultdict(TopicStats)
+
+    def configure(
+        self, session_factory: async_sessionmaker[AsyncSession] | None = None
+    ) -> None:
+        if session_factory is not None:
+            self._session_factory = session_factory
+
+    def configure_topic(
+        self,
+        event_type: str,
+        workers: int = DEFAULT_WORKERS,
+        max_queue_size: int = DEFAULT_QUEUE_SIZE,
+        overflow: str = BLOCK,
+    ) -> None:
+        """Deliver ``event_type`` asynchronously from a bounded queue."""
+        self._topics[event_type] = _Topic(event_type, workers, max_queue_size, overflow)
 
     def subscribe(self, event_type: str, handler: Callable) -> None:
         self._subscribers[event_type].append(handler)
 
     async def publish(self, event_type: str, event_data: dict[str, Any]) -> None:
-        for handler in self._subscribers.get(event_type, []):
-            await handler(event_data)
+        topic = self._topics.get(event_type)
+        if topic is None:
+            for handler in self._subscribers.get(event_type, []):
+                await handler(event_data)
+            return
+        if not self._subscribers.get(event_type):
+            return
+
+        # Consumers get their own session; the producer's never leaves it.
+        db = event_data.get("db")
+        payload = {key: value for key, value in event_data.items() if key != "db"}
+        self.stats[event_type].published += 1
+        if db is None:
+            if not self._offer(topic, payload):
+                await self._queue(topic).put(payload)
+        else:
+            db.info.setdefault(PENDING_EVENTS_KEY, []).append((self, topic, payload))
+
+    def _queue(self, topic: _Topic) -> asyncio.Queue[dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        if topic.loop is not loop or topic.queue is None:
+            # Workers are bound to the loop that started them.
+            topic.loop = loop
+            topic.queue = asyncio.Queue(maxsize=topic.max_queue_size)
+            topic.tasks = [
+                loop.create_task(self._work(topic, topic.queue))
+                for _ in range(topic.workers)
+            ]
+        return topic.queue
+
+    def _offer(self, topic: _Topic, payload: dict[str, Any]) -> bool:
+        """Queue ``payload`` without waiting. False means the caller has to
+        wait for room, under the ``block`` policy."""
+        queue = self._queue(topic)
+        if not queue.full():
+            queue.put_nowait(payload)
+            return True
+        if topic.overflow == BLOCK:
+            return False
+        if topic.overflow == DROP_OLDEST:
+            queue.get_nowait()
+            queue.task_done()
+            queue.put_nowait(payload)
+        self.stats[topic.name].dropped += 1
+        logger.warning("Event queue for %s full, dropped an event", topic.name)
+        return True
+
+    async def wait_for_capacity(self, db: AsyncSession) -> None:
+        """Wait until the events ``db`` committed into full ``block`` queues
+        are queued. Call it after the producer's commit to slow producers
+        down to the consumers' pace."""
+        blocked = db.info.pop(BLOCKED_EVENTS_KEY, ())
+        if blocked:
+            await asyncio.gather(*blocked)
+
+    def _sessions(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_factory is None:
+            from event_driven.shared.database import async_session_factory
+
+            self._session_factory = async_session_factory
+        return self._session_factory
+
+    async def _work(self, topic: _Topic, queue: asyncio.Queue[dict[str, Any]]) -> None:
+        while True:
+            payload = await queue.get()
+            try:
+                for handler in self._subscribers.get(topic.name, []):
+                    await self._deliver(topic, handler, payload)
+            finally:
+                queue.task_done()
+
+    async def _deliver(
+        self, topic: _Topic, handler: Handler, payload: dict[str, Any]
+    ) -> None:
+        stats = self.stats[topic.name]
+        async with self._sessions()() as session:
+            try:
+                await handler({**payload, "db": session})
+                await session.commit()
+                stats.delivered += 1
+            except Exception:
+                await session.rollback()
+                stats.failed += 1
+                logger.exception(
+                    "Consumer %s failed for %s", handler.__qualname__, topic.name
+                )
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been handled."""
+        loop = asyncio.get_running_loop()
+        for topic in list(self._topics.values()):
+            if topic.queue is not None and topic.loop is loop:
+                await topic.queue.join()
+
+    async def stop(self) -> None:
+        await self.drain()
+        loop = asyncio.get_running_loop()
+        tasks = []
+        for topic in self._topics.values():
+            # Workers of a loop that has since closed died with it.
+            if topic.loop is loop:
+                tasks.extend(topic.tasks)
+            topic.tasks = []
+            topic.queue = None
+            topic.loop = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     def clear(self) -> None:
+        for topic in self._topics.values():
+            for task in topic.tasks:
+                task.cancel()
         self._subscribers.clear()
+        self._topics.clear()
+        self.stats.clear()
 
 
 broker = EventBroker()
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _enqueue_committed_events(session: Session) -> None:
+    for owner, topic, payload in session.info.pop(PENDING_EVENTS_KEY, ()):
+        if not owner._offer(topic, payload):
+            task = topic.loop.create_task(topic.queue.put(payload))
+            session.info.setdefault(BLOCKED_EVENTS_KEY, []).append(task)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_uncommitted_events(session: Session) -> None:
+    session.info.pop(PENDING_EVENTS_KEY, None)
@@ -6,6 +6,7 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from event_driven.shared.database import Base, get_db
+from event_driven.shared.event_broker import broker
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///./test_event_driven.db"
 
@@ -20,6 +21,7 @@ async def override_get_db() -> AsyncGenerator[AsyncSession]:
         try:
             yield session
             await session.commit()
+            await broker.wait_for_capacity(session)
         except Exception:
             await session.rollback()
             raise
@@ -49,10 +51,12 @@ async def setup_db():
     from event_driven.main import _register_consumers
 
     _register_consumers()
+    broker.configure(session_factory=test_session_factory)
 
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
+    await broker.stop()
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
     await test_engine.dispose()
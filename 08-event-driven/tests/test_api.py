@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient
 
+from event_driven.shared.event_broker import broker
+
 
 class TestAuth:
     async def test_register(self, client: AsyncClient):
@@ -358,6 +360,7 @@ class TestNotification:
         other_id = other_me.json()["id"]
 
         await auth_client.post(f"/api/follow/{other_id}")
+        await broker.drain()
 
         notif_resp = await auth_client.get(
             "/api/notifications",
@@ -381,6 +384,7 @@ class TestNotification:
         post_id = post_resp.json()["id"]
 
         await auth_client.post(f"/api/posts/{post_id}/likes")
+        await broker.drain()
 
         notif_resp = await auth_client.get(
             "/api/notifications",
@@ -490,3 +494,82 @@ class TestEventBroker:
         await test_broker.publish("clear.event", {"data": 1})
 
         assert len(received) == 0
+
+    async def test_async_topic_delivers_after_commit_with_own_session(self):
+        from sqlalchemy import text
+
+        from event_driven.shared.event_broker import EventBroker
+        from tests.conftest import test_session_factory
+
+        received = []
+        test_broker = EventBroker()
+        test_broker.configure(session_factory=test_session_factory)
+        test_broker.configure_topic("async.event", workers=1, max_queue_size=10)
+
+        async def handler(data):
+            await data["db"].execute(text("SELECT 1"))
+            received.append(data)
+
+        test_broker.subscribe("async.event", handler)
+
+        async with test_session_factory() as db:
+            await db.execute(text("SELECT 1"))
+            await test_broker.publish("async.event", {"n": 1, "db": db})
+            await test_broker.publish("async.event", {"n": 2, "db": db})
+            await test_broker.drain()
+            assert received == []
+            await db.commit()
+            await test_broker.wait_for_capacity(db)
+            await test_broker.drain()
+            assert [data["n"] for data in received] == [1, 2]
+            assert all(data["db"] is not db for data in received)
+
+            await db.execute(text("SELECT 1"))
+            await test_broker.publish("async.event", {"n": 3, "db": db})
+            await db.rollback()
+        await test_broker.drain()
+        assert len(received) == 2
+        assert test_broker.stats["async.event"].delivered == 2
+        await test_broker.stop()
+
+    async def test_async_topic_overflow_policies(self):
+        import asyncio
+
+        from event_driven.shared.event_broker import (
+            BLOCK,
+            DROP_NEWEST,
+            DROP_OLDEST,
+            EventBroker,
+        )
+        from tests.conftest import test_session_factory
+
+        async def fill(overflow):
+            release = asyncio.Event()
+            received = []
+            test_broker = EventBroker()
+            test_broker.configure(session_factory=test_session_factory)
+            test_broker.configure_topic(
+                "busy.event", workers=1, max_queue_size=1, overflow=overflow
+            )
+
+            async def handler(data):
+                await release.wait()
+                received.append(data["n"])
+
+            test_broker.subscribe("busy.event", handler)
+            # The worker takes 1 and stalls, 2 fills the queue.
+            await test_broker.publish("busy.event", {"n": 1})
+            await asyncio.sleep(0)
+            await test_broker.publish("busy.event", {"n": 2})
+            third = asyncio.ensure_future(test_broker.publish("busy.event", {"n": 3}))
+            await asyncio.sleep(0.01)
+            blocked = not third.done()
+            release.set()
+            await third
+            await test_broker.drain()
+            await test_broker.stop()
+            return received, blocked, test_broker.stats["busy.event"].dropped
+
+        assert await fill(DROP_NEWEST) == ([1, 2], False, 1)
+        assert await fill(DROP_OLDEST) == ([1, 3], False, 1)
+        assert await fill(BLOCK) == ([1, 2, 3], True, 0)